@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Alias Map - Persistent record of which Wiktionary page each word resolves to
+
+Word lists derived from frequency data contain case variants, alternative
+spellings and other titles that Wiktionary normalizes or redirects to a single
+page. AliasMap remembers, for every word looked up, the canonical title of the
+page it resolved to, so later runs can group words by page and fetch each page
+once without asking again.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Optional
+
+
+class AliasMap:
+    """Thread-safe word -> canonical page title map, stored as a JSON object."""
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the map (the file is read on first use).
+
+        Args:
+            path: JSON file to load from and save to (None keeps the map in memory)
+        """
+        self.path = path
+        self._titles: Optional[Dict[str, str]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, str]:
+        """Read the map from disk (once)."""
+        if self._titles is None:
+            self._titles = {}
+            if self.path and os.path.exists(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._titles = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"Error reading alias map {self.path}: {str(e)}")
+        return self._titles
+
+    def __contains__(self, word: str) -> bool:
+        with self._lock:
+            return word in self._load()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    def resolve(self, word: str) -> str:
+        """Canonical title for a word (the word itself if it was never resolved)."""
+        with self._lock:
+            return self._load().get(word, word)
+
+    def record(self, word: str, title: str):
+        """Remember the canonical title a word resolved to."""
+        with self._lock:
+            titles = self._load()
+            if titles.get(word) != title:
+                titles[word] = title
+                self._dirty = True
+
+    def aliases(self) -> Dict[str, str]:
+        """Words that resolve to a different title, with their canonical titles."""
+        with self._lock:
+            return {word: title for word, title in self._load().items() if word != title}
+
+    def save(self):
+        """Write the map back to its file if anything changed."""
+        with self._lock:
+            if not self.path or not self._dirty:
+                return
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._titles, f, ensure_ascii=False, sort_keys=True)
+                os.replace(temp_path, self.path)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+            self._dirty = False
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Benchmark Scraper - Offline parsing/extraction benchmark over saved pages
+
+Runs WiktionaryScraper.parse_page on a corpus of saved Wiktionary HTML pages
+(no network: the HTML is injected instead of fetched) and reports pages/sec,
+time per page, per-extractor cost and peak memory. Results can be saved as a
+baseline and later runs compared against it, failing when throughput drops
+by more than a tolerance.
+
+The corpus of the words listed in benchmarks/corpus_words.txt is checked in
+under benchmarks/corpus, with a baseline recorded on it in
+benchmarks/baseline.json, so the benchmark runs offline. --fetch-corpus
+refreshes the pages from Wiktionary. Each result records the revision of
+every page, and comparisons warn when the baseline was taken on other
+revisions. Baselines are machine-specific: regenerate one with
+--save-baseline after refreshing the corpus or when benchmarking on different
+hardware.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+from html_parsers import PARSER_BACKENDS
+from parse_pipeline import iter_html_dir
+from scrape_metrics import metrics
+from wiktionary_curl_wrapper import WiktionaryCurlWrapper
+from wiktionary_scraper import REVISION_ID_PATTERN, WiktionaryScraper
+
+BENCHMARK_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+DEFAULT_CORPUS = os.path.join(BENCHMARK_DIR, "corpus")
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_CORPUS_WORDS = os.path.join(BENCHMARK_DIR, "corpus_words.txt")
+
+
+def fetch_corpus(words_file: str, corpus_dir: str, rate_limit: float = 1.0) -> int:
+    """Save the current Wiktionary page of every word in words_file as <word>.html.
+
+    Returns:
+        Number of pages saved
+    """
+    with open(words_file, "r", encoding="utf-8") as f:
+        words = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+    os.makedirs(corpus_dir, exist_ok=True)
+    fetcher = WiktionaryCurlWrapper(rate_limit=rate_limit)
+    saved = 0
+    for word in words:
+        html_content = fetcher.fetch_page(word)
+        if not html_content:
+            print(f"Could not fetch '{word}'")
+            continue
+        with open(os.path.join(corpus_dir, f"{word}.html"), "w", encoding="utf-8") as f:
+            f.write(html_content)
+        revision = REVISION_ID_PATTERN.search(html_content)
+        print(f"Saved '{word}' (revision {revision.group(1) if revision else 'unknown'})")
+        saved += 1
+    return saved
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unavailable)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class ScraperBenchmark:
+    """Time parse_page over an in-memory corpus of pages."""
+
+    def __init__(self, pages: List[Tuple[str, str]], lang_code: str = "es", parser: str = "html.parser"):
+        """Initialize the benchmark.
+
+        Args:
+            pages: (word, html) pairs to parse
+            lang_code: Language section to extract
+            parser: HTML parser backend
+        """
+        self.pages = pages
+        self.lang_code = lang_code
+        self.parser = parser
+        self.scraper = WiktionaryScraper(lang_code=lang_code, parser=parser)
+        self.errors: Dict[str, str] = {}
+
+    def _parse(self, word: str, html_content: str):
+        """Parse one page, remembering (instead of raising) extraction errors."""
+        try:
+            self.scraper.parse_page(word, html_content)
+        except Exception as e:
+            self.errors[word] = f"{type(e).__name__}: {str(e)}"
+
+    def time_pages(self, iterations: int) -> Dict[str, float]:
+        """Best-of-N milliseconds per page, with instrumentation off."""
+        best: Dict[str, float] = {}
+        for _ in range(iterations):
+            for word, html_content in self.pages:
+                start = time.perf_counter()
+                self._parse(word, html_content)
+                elapsed = (time.perf_counter() - start) * 1000
+                best[word] = min(best.get(word, elapsed), elapsed)
+        return best
+
+    def time_extractors(self) -> Dict[str, Dict[str, Any]]:
+        """Mean and total milliseconds per instrumented stage over one pass."""
+        metrics.reset(enabled=True)
+        try:
+            for word, html_content in self.pages:
+                self._parse(word, html_content)
+            stages = metrics.summary()["stages"]
+        finally:
+            metrics.reset(enabled=False)
+        return {
+            name: {"calls": stage["count"], "total_ms": round(stage["total"] * 1000, 3),
+                   "mean_ms": round(stage["mean"] * 1000, 3)}
+            for name, stage in stages.items()
+        }
+
+    def peak_memory(self) -> float:
+        """Peak Python heap allocation (MB) while parsing the largest page."""
+        word, html_content = max(self.pages, key=lambda page: len(page[1]))
+        gc.collect()
+        tracemalloc.start()
+        try:
+            self._parse(word, html_content)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return round(peak / (1024 * 1024), 2)
+
+    def revisions(self) -> Dict[str, Optional[int]]:
+        """Wiktionary revision ID of each corpus page."""
+        revisions = {}
+        for word, html_content in sorted(self.pages):
+            revision = REVISION_ID_PATTERN.search(html_content)
+            revisions[word] = int(revision.group(1)) if revision else None
+        return revisions
+    
+    def run(self, iterations: int = 5) -> Dict[str, Any]:
+        """Warm up, then measure throughput, per-extractor cost and memory."""
+        for word, html_content in self.pages:
+            self._parse(word, html_content)
+
+        per_page = self.time_pages(iterations)
+        total_ms = sum(per_page.values())
+        return {
+            "parser": self.parser,
+            "lang_code": self.lang_code,
+            "pages": len(self.pages),
+            "revisions": self.revisions(),
+            "iterations": iterations,
+            "pages_per_second": round(len(self.pages) / (total_ms / 1000), 2) if total_ms else None,
+            "per_page_ms": {word: round(ms, 3) for word, ms in sorted(per_page.items())},
+            "extractors": self.time_extractors(),
+            "peak_memory_mb": self.peak_memory(),
+            "peak_rss_mb": _peak_rss_mb(),
+            "errors": dict(sorted(self.errors.items())),
+        }
+
+
+def compare(result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> bool:
+    """Print the change against a baseline; return False on a throughput regression."""
+    ok = True
+    print(f"\nCompared with baseline (tolerance {tolerance:.0%}):")
+    
+    changed = sorted(word for word, revision in result["revisions"].items()
+                     if baseline.get("revisions", {}).get(word) != revision)
+    if changed:
+        print(f"  Note: the baseline was recorded on other pages or revisions ({', '.join(changed)}); "
+              f"regenerate it with --save-baseline")
+
+    old, new = baseline.get("pages_per_second"), result.get("pages_per_second")
+    if old and new:
+        change = new / old - 1
+        regressed = change < -tolerance
+        ok = not regressed
+        print(f"  pages/sec: {old} -> {new} ({change:+.1%}){'  REGRESSION' if regressed else ''}")
+
+    for word, ms in result["per_page_ms"].items():
+        old_ms = baseline.get("per_page_ms", {}).get(word)
+        if old_ms:
+            print(f"  {word}: {old_ms} -> {ms} ms ({ms / old_ms - 1:+.1%})")
+
+    for name, stage in result["extractors"].items():
+        old_stage = baseline.get("extractors", {}).get(name)
+        if old_stage and old_stage["total_ms"]:
+            print(f"  {name}: {old_stage['total_ms']} -> {stage['total_ms']} ms "
+                  f"({stage['total_ms'] / old_stage['total_ms'] - 1:+.1%})")
+
+    if baseline.get("peak_memory_mb"):
+        print(f"  peak memory: {baseline['peak_memory_mb']} -> {result['peak_memory_mb']} MB")
+    return ok
+
+
+def print_report(result: Dict[str, Any]):
+    """Human-readable summary of one benchmark run."""
+    print(f"Parser: {result['parser']}  pages: {result['pages']}  iterations: {result['iterations']}")
+    print(f"Throughput: {result['pages_per_second']} pages/sec")
+    print("Per page (best of N):")
+    for word, ms in result["per_page_ms"].items():
+        print(f"  {word:<12} {ms:>10.3f} ms")
+    print("Per stage (one instrumented pass):")
+    for name, stage in sorted(result["extractors"].items(), key=lambda item: -item[1]["total_ms"]):
+        print(f"  {name:<36} {stage['total_ms']:>10.3f} ms total  {stage['mean_ms']:>8.3f} ms/call")
+    print(f"Peak memory parsing the largest page: {result['peak_memory_mb']} MB "
+          f"(process peak RSS: {result['peak_rss_mb']} MB)")
+    for word, error in result["errors"].items():
+        print(f"Error on '{word}': {error}")
+
+
+def main():
+    """Main function to run the benchmark from command line."""
+    parser = argparse.ArgumentParser(description="Benchmark Wiktionary page parsing on saved pages")
+
+    parser.add_argument("--corpus", type=str, default=DEFAULT_CORPUS,
+                        help="Directory of saved <word>.html pages (default: benchmarks/corpus)")
+    parser.add_argument("--fetch-corpus", action="store_true",
+                        help="First refresh --corpus with the current pages of the words in --corpus-words")
+    parser.add_argument("--corpus-words", type=str, default=DEFAULT_CORPUS_WORDS,
+                        help="Words whose pages make up the corpus (default: benchmarks/corpus_words.txt)")
+    parser.add_argument("--rate-limit", type=float, default=1.0,
+                        help="Seconds between requests with --fetch-corpus (default: 1.0)")
+    parser.add_argument("--lang", type=str, default="es", help="Language code to extract (default: es)")
+    parser.add_argument("--parser", type=str, default="html.parser", choices=sorted(PARSER_BACKENDS),
+                        help="HTML parser backend (default: html.parser)")
+    parser.add_argument("--iterations", type=int, default=5, help="Timed passes over the corpus (default: 5)")
+    parser.add_argument("--baseline", type=str, default=DEFAULT_BASELINE,
+                        help="Baseline results to compare against (default: benchmarks/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed throughput drop before failing, as a fraction (default: 0.2)")
+    parser.add_argument("--output", type=str, help="Also write this run's results as JSON")
+
+    args = parser.parse_args()
+
+    if args.fetch_corpus:
+        fetch_corpus(args.corpus_words, args.corpus, args.rate_limit)
+    
+    pages = list(iter_html_dir(args.corpus)) if os.path.isdir(args.corpus) else []
+    if not pages:
+        print(f"No saved pages found in {args.corpus}; save them with --fetch-corpus")
+        sys.exit(1)
+
+    result = ScraperBenchmark(pages, lang_code=args.lang, parser=args.parser).run(args.iterations)
+    print_report(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+    if args.save_baseline:
+        baselines = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baselines = json.load(f)
+        baselines[result["parser"]] = result
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2)
+        print(f"\nBaseline for '{result['parser']}' saved to {args.baseline}")
+        return
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f).get(result["parser"])
+        if baseline and not compare(result, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Crawl Frontier - Persistent priority queue of words to scrape next
+
+A crawl starts from seed words and keeps adding the words each scraped page
+links to (related terms, synonyms, antonyms). The frontier hands them out
+most valuable first: words with a frequency rank in rank order, then the rest
+by link depth (breadth first), then in discovery order.
+
+Every word ever queued is remembered in a Bloom filter, a fixed-size bit
+array (about 1.8 MB per million words at a 0.1% false positive rate) that
+keeps the memory for deduplication flat however many titles the crawl sees.
+A false positive only means a word is never queued.
+
+The state lives in a directory: frontier.jsonl (queued words) and seen.bloom
+(the filter), both replaced atomically on save so an interrupted crawl can be
+resumed.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import struct
+import tempfile
+from typing import Callable, Dict, List, Optional, Tuple
+
+MAGIC = b"NBLM"
+VERSION = 1
+
+# magic, version, bit count, hash count, items added
+_HEADER = struct.Struct("<4sIQIQ")
+
+# Priority of words without a frequency rank (after every ranked word)
+UNRANKED = 2 ** 63
+
+
+def _atomic_write(path: str, write: Callable):
+    """Write a file through a temporary file in the same directory, then rename it into place."""
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+class BloomFilter:
+    """Set membership in a fixed-size bit array (no false negatives, rare false positives)."""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        """Size the filter for a number of items at a target false positive rate.
+
+        Args:
+            capacity: Number of items the filter is sized for (more raise the error rate)
+            error_rate: False positive rate at capacity
+        """
+        self.bit_count = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        """Bit positions of an item (double hashing of one 128-bit digest)."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.bit_count
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, item: str) -> bool:
+        """Add an item; returns False if it was (probably) already present."""
+        added = False
+        bits = self.bits
+        for p in self._positions(item):
+            mask = 1 << (p & 7)
+            if not bits[p >> 3] & mask:
+                bits[p >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def save(self, path: str):
+        """Write the filter to a file."""
+        def write(f):
+            f.write(_HEADER.pack(MAGIC, VERSION, self.bit_count, self.hash_count, self.count))
+            f.write(self.bits)
+        _atomic_write(path, write)
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter":
+        """Read a filter written by save (keeping the size it was created with)."""
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            bits = f.read()
+        if len(header) < _HEADER.size:
+            raise ValueError(f"Not a Bloom filter: {path}")
+        magic, version, bit_count, hash_count, count = _HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION or len(bits) != (bit_count + 7) // 8:
+            raise ValueError(f"Not a Bloom filter (or unsupported version): {path}")
+        bloom = cls.__new__(cls)
+        bloom.bit_count = bit_count
+        bloom.hash_count = hash_count
+        bloom.bits = bytearray(bits)
+        bloom.count = count
+        return bloom
+
+
+class CrawlFrontier:
+    """Priority queue of (word, link depth) with a Bloom filter of every word queued."""
+
+    def __init__(self, state_dir: str, rank: Optional[Callable[[str], Optional[int]]] = None,
+                 capacity: int = 1_000_000, error_rate: float = 0.001):
+        """Open a frontier, resuming the state saved in state_dir if there is one.
+
+        Args:
+            state_dir: Directory holding frontier.jsonl and seen.bloom
+            rank: Frequency rank of a word (1 = most common), or None if unranked
+            capacity: Words the seen-filter of a new crawl is sized for
+            error_rate: False positive rate of a new seen-filter at capacity
+        """
+        self.state_dir = state_dir
+        self.rank = rank
+        self.frontier_file = os.path.join(state_dir, "frontier.jsonl")
+        self.seen_file = os.path.join(state_dir, "seen.bloom")
+        self._heap: List[Tuple[int, int, int, str]] = []
+        self._counter = 0
+
+        os.makedirs(state_dir, exist_ok=True)
+        self.resumed = os.path.exists(self.seen_file)
+        if self.resumed:
+            self.seen = BloomFilter.load(self.seen_file)
+            if os.path.exists(self.frontier_file):
+                with open(self.frontier_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            self._push(*json.loads(line))
+        else:
+            self.seen = BloomFilter(capacity, error_rate)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _push(self, word: str, depth: int):
+        """Queue a word without consulting the seen-filter."""
+        rank = self.rank(word) if self.rank else None
+        heapq.heappush(self._heap, (UNRANKED if rank is None else rank, depth, self._counter, word))
+        self._counter += 1
+
+    def add(self, word: str, depth: int = 0) -> bool:
+        """Queue a word unless it was queued before; returns whether it was added."""
+        if not self.seen.add(word):
+            return False
+        self._push(word, depth)
+        return True
+
+    def requeue(self, word: str, depth: int):
+        """Put back a word taken with pop() that was not scraped after all."""
+        self._push(word, depth)
+
+    def queued(self) -> Dict[str, int]:
+        """Queued words with their link depth."""
+        return {word: depth for _, depth, _, word in self._heap}
+
+    def pop(self) -> Optional[Tuple[str, int]]:
+        """Take the most valuable queued word as (word, depth), or None if the frontier is empty."""
+        if not self._heap:
+            return None
+        _, depth, _, word = heapq.heappop(self._heap)
+        return word, depth
+
+    def save(self):
+        """Persist the queued words and the seen-filter."""
+        def write(f):
+            for _, depth, _, word in sorted(self._heap):
+                f.write((json.dumps([word, depth], ensure_ascii=False) + "\n").encode("utf-8"))
+        _atomic_write(self.frontier_file, write)
+        self.seen.save(self.seen_file)
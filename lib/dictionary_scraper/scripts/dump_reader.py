@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Dump Reader - Stream pages out of a Wiktionary pages-articles XML dump
+
+Reads a (optionally bz2- or gzip-compressed) MediaWiki XML export incrementally
+with iterparse, clearing each page once it has been handled so memory stays
+constant regardless of dump size. Only main-namespace, non-redirect pages with
+a section for the requested language are yielded, trimmed to that section.
+
+Dumps hold wikitext, so entries extracted from them go through
+WikitextRenderer and share its limits: conjugation tables and automatic
+pronunciations are computed templates and cannot be reproduced offline. Dump
+entries are therefore no substitute for scraped ones: scrape_dump lists the
+words whose records miss fields, so an online run can complete them.
+"""
+
+import bz2
+import gzip
+import re
+import xml.etree.ElementTree as ET
+from typing import IO, Iterator, Optional, Tuple
+
+
+def open_dump(dump_file: str) -> IO[bytes]:
+    """Open a dump file, decompressing .bz2 and .gz on the fly."""
+    if dump_file.endswith(".bz2"):
+        return bz2.open(dump_file, "rb")
+    if dump_file.endswith(".gz"):
+        return gzip.open(dump_file, "rb")
+    return open(dump_file, "rb")
+
+
+def _local_name(tag: str) -> str:
+    """Strip the export schema namespace from an element tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def extract_language_section(wikitext: str, language_name: str) -> Optional[str]:
+    """Cut the level-2 section for a language out of a page's wikitext.
+
+    Returns:
+        The section including its "==Language==" heading, or None if absent
+    """
+    heading = re.search(rf"^==\s*{re.escape(language_name)}\s*==\s*$", wikitext, re.MULTILINE)
+    if not heading:
+        return None
+    next_heading = re.search(r"^==[^=].*?[^=]==\s*$", wikitext[heading.end():], re.MULTILINE)
+    end = heading.end() + next_heading.start() if next_heading else len(wikitext)
+    return wikitext[heading.start():end]
+
+
+def iter_dump_pages(dump_file: str, language_name: str) -> Iterator[Tuple[str, str]]:
+    """Yield (title, wikitext) for every dump page that has a section for the language.
+
+    Args:
+        dump_file: Path to the pages-articles XML dump (.xml, .xml.bz2 or .xml.gz)
+        language_name: Wiktionary section heading to look for (e.g. "Spanish")
+    """
+    with open_dump(dump_file) as f:
+        context = ET.iterparse(f, events=("start", "end"))
+        _, root = next(context)
+
+        for event, elem in context:
+            if event != "end" or _local_name(elem.tag) != "page":
+                continue
+
+            title = None
+            namespace = None
+            text = None
+            is_redirect = False
+            for child in elem.iter():
+                name = _local_name(child.tag)
+                if name == "title":
+                    title = child.text
+                elif name == "ns":
+                    namespace = child.text
+                elif name == "redirect":
+                    is_redirect = True
+                elif name == "text":
+                    text = child.text
+
+            # Free the page (and anything the root still references) before yielding
+            elem.clear()
+            root.clear()
+
+            if not title or namespace != "0" or is_redirect or not text:
+                continue
+            # Cheap substring test before running the heading regex
+            if language_name not in text:
+                continue
+
+            section = extract_language_section(text, language_name)
+            if section:
+                yield title, section
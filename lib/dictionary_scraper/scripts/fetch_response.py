@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Fetch Response - Result type shared by the Wiktionary fetcher backends
+
+Both WiktionaryCurlWrapper and WiktionaryHttpWrapper return a FetchResponse
+from fetch_response(), so layers above them (caching, retries) can inspect the
+HTTP status and headers regardless of how the page was downloaded.
+fetch_with_retries wraps a single request with the retry and backoff policy
+both backends use.
+"""
+
+import email.utils
+import time
+from typing import Callable, Dict, NamedTuple, Optional
+
+from rate_limiter import TokenBucket, backoff_delay
+from scrape_metrics import metrics
+
+# Text Wiktionary shows on pages for terms that have no entry
+MISSING_ENTRY_MARKER = "Wiktionary does not have an entry for this term"
+
+# Statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchResponse(NamedTuple):
+    """Outcome of a single page request."""
+
+    status: int
+    headers: Dict[str, str]  # Lower-cased header names
+    content: Optional[str]
+    url: str  # Final URL after redirects
+
+
+def is_missing_entry(content: Optional[str]) -> bool:
+    """Check whether a page is Wiktionary's placeholder for a missing entry."""
+    return not content or MISSING_ENTRY_MARKER in content
+
+
+def retry_after_seconds(headers: Dict[str, str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date)."""
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def fetch_with_retries(send: Callable[[], FetchResponse], rate_limiter: TokenBucket,
+                       max_retries: int, label: str) -> Optional[FetchResponse]:
+    """Run a request, retrying network failures and 429/5xx responses.
+
+    Each attempt takes a token from the rate limiter. Retry-After pauses the
+    limiter, so every request sharing it waits, and an AdaptiveRateLimiter is
+    told about healthy and throttled responses.
+
+    Args:
+        send: Performs one request, raising on network failure
+        rate_limiter: Limiter shared by the fetcher
+        max_retries: Number of retries after the first attempt
+        label: What is being fetched, for log messages
+
+    Returns:
+        The final response (possibly still an error status), or None if every attempt failed
+    """
+    response = None
+    for attempt in range(max_retries + 1):
+        with metrics.timer("rate_wait"):
+            rate_limiter.acquire()
+        try:
+            with metrics.timer("fetch"):
+                response = send()
+        except Exception as e:
+            print(f"Error fetching {label}: {str(e)}")
+            response = None
+        else:
+            if response.status not in RETRYABLE_STATUSES:
+                if hasattr(rate_limiter, "record_success"):
+                    rate_limiter.record_success()
+                return response
+            print(f"HTTP {response.status} for {label}")
+            retry_after = retry_after_seconds(response.headers)
+            if retry_after:
+                rate_limiter.pause(retry_after)
+
+        if hasattr(rate_limiter, "record_throttle"):
+            rate_limiter.record_throttle()
+        if attempt < max_retries:
+            metrics.increment("retries")
+            time.sleep(backoff_delay(attempt))
+    return response
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Frequency Index - Memory-mapped word -> (rank, frequency) lookups
+
+A frequency list is written as a single binary file: a header, fixed-width
+arrays of string offsets, ranks and frequencies for the words in sorted
+(UTF-8 byte) order, an open-addressing hash table of slots pointing into those
+arrays, and finally the concatenated words. Opening the index only maps the
+file, so load time does not depend on its size, and a lookup hashes the word
+once and usually compares a single string.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from typing import Iterable, Iterator, Optional, Tuple
+
+MAGIC = b"NFQX"
+VERSION = 1
+
+# magic, version, entry count, hash slot count, size of the string table
+_HEADER = struct.Struct("<4sIIIQ")
+_OFFSET = struct.Struct("<I")
+_RANK = struct.Struct("<I")
+_FREQUENCY = struct.Struct("<d")
+_SLOT = struct.Struct("<I")
+
+
+def index_path_for(word_list_file: str) -> str:
+    """Path of the index written alongside a word list (.txt -> .idx)."""
+    return os.path.splitext(word_list_file)[0] + ".idx"
+
+
+def _slot_count(count: int) -> int:
+    """Hash table size: a power of two with a load factor of at most 0.5."""
+    slots = 1
+    while slots < count * 2:
+        slots *= 2
+    return slots
+
+
+def write_frequency_index(path: str, ranked_words: Iterable[Tuple[str, float]]) -> int:
+    """Write an index for words given most frequent first.
+
+    Args:
+        path: Where to write the index
+        ranked_words: (word, frequency) pairs in rank order; repeated words keep their first rank
+
+    Returns:
+        Number of words in the index
+    """
+    ranks = {}
+    for word, frequency in ranked_words:
+        if word not in ranks:
+            ranks[word] = (len(ranks) + 1, float(frequency))
+
+    entries = sorted((word.encode("utf-8"), rank, frequency) for word, (rank, frequency) in ranks.items())
+    count = len(entries)
+    slot_count = _slot_count(count)
+
+    offsets = bytearray()
+    rank_data = bytearray()
+    frequency_data = bytearray()
+    strings = bytearray()
+    slots = [0] * slot_count
+    mask = slot_count - 1
+
+    for i, (key, rank, frequency) in enumerate(entries):
+        offsets += _OFFSET.pack(len(strings))
+        rank_data += _RANK.pack(rank)
+        frequency_data += _FREQUENCY.pack(frequency)
+        strings += key
+
+        slot = zlib.crc32(key) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = i + 1  # 0 marks an empty slot
+    offsets += _OFFSET.pack(len(strings))
+
+    if len(strings) > 0xFFFFFFFF:
+        raise ValueError("Word list too large for a frequency index")
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, count, slot_count, len(strings)))
+            f.write(offsets)
+            f.write(rank_data)
+            f.write(frequency_data)
+            f.write(struct.pack(f"<{slot_count}I", *slots))
+            f.write(strings)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return count
+
+
+class FrequencyIndex:
+    """Read-only, memory-mapped view of a frequency index file."""
+
+    def __init__(self, path: str):
+        """Map an index file written by write_frequency_index."""
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self._count, self._slot_count, _ = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"Not a frequency index (or unsupported version): {path}")
+
+        self._offsets_at = _HEADER.size
+        self._ranks_at = self._offsets_at + (self._count + 1) * _OFFSET.size
+        self._frequencies_at = self._ranks_at + self._count * _RANK.size
+        self._slots_at = self._frequencies_at + self._count * _FREQUENCY.size
+        self._strings_at = self._slots_at + self._slot_count * _SLOT.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, word: str) -> bool:
+        return self._find(word) is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Unmap the index file."""
+        self._map.close()
+
+    def _key(self, i: int) -> bytes:
+        """The UTF-8 bytes of entry i."""
+        start, = _OFFSET.unpack_from(self._map, self._offsets_at + i * _OFFSET.size)
+        end, = _OFFSET.unpack_from(self._map, self._offsets_at + (i + 1) * _OFFSET.size)
+        return self._map[self._strings_at + start:self._strings_at + end]
+
+    def _find(self, word: str) -> Optional[int]:
+        """Entry number of a word, or None if it is not in the index."""
+        if not self._count:
+            return None
+        key = word.encode("utf-8")
+        mask = self._slot_count - 1
+        slot = zlib.crc32(key) & mask
+        while True:
+            entry, = _SLOT.unpack_from(self._map, self._slots_at + slot * _SLOT.size)
+            if not entry:
+                return None
+            if self._key(entry - 1) == key:
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def lookup(self, word: str) -> Optional[Tuple[int, float]]:
+        """Get (rank, frequency) for a word, or None if it is not in the index.
+
+        Rank 1 is the most frequent word.
+        """
+        i = self._find(word)
+        if i is None:
+            return None
+        rank, = _RANK.unpack_from(self._map, self._ranks_at + i * _RANK.size)
+        frequency, = _FREQUENCY.unpack_from(self._map, self._frequencies_at + i * _FREQUENCY.size)
+        return rank, frequency
+
+    def rank(self, word: str) -> Optional[int]:
+        """Frequency rank of a word (1 = most frequent), or None if unknown."""
+        result = self.lookup(word)
+        return result[0] if result else None
+
+    def words(self) -> Iterator[str]:
+        """Iterate over all words in sorted (UTF-8 byte) order."""
+        for i in range(self._count):
+            yield self._key(i).decode("utf-8")
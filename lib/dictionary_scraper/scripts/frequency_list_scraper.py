@@ -7,24 +7,51 @@ for processing by the Wiktionary scraper.
 """
 
 import argparse
+import contextlib
 import csv
 import gzip
+import hashlib
+import io
 import json
 import os
 import re
 import requests
+import tempfile
 import zipfile
-from typing import List, Dict, Optional, Tuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Iterator, List, Dict, Optional, Tuple, Union
+
+from frequency_index import FrequencyIndex, index_path_for, write_frequency_index
+from frequency_table import FrequencyTable, rank_normalized, top_frequencies
+from language_registry import languages
+
+# Seconds to wait for a download to connect, and for each chunk of data
+DOWNLOAD_TIMEOUT = (15, 60)
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# Words we keep from frequency lists (lowercase Latin letters incl. Spanish accents)
+WORD_PATTERN = re.compile(r'^[a-záéíóúüñ]+$')
+
+
+def _open_text(source: Union[str, IO[str]]):
+    """Open a file path for reading, or pass an already open text stream through."""
+    if isinstance(source, str):
+        return open(source, 'r', encoding='utf-8', errors='replace')
+    return contextlib.nullcontext(source)
+
 
 class FrequencyListScraper:
     """Scraper for obtaining word frequency lists for different languages."""
 
-    def __init__(self, output_dir="data"):
+    def __init__(self, output_dir="data", revalidate_downloads=False):
         """Initialize the scraper.
         
         Args:
             output_dir: Directory to save downloaded lists
+            revalidate_downloads: Ask the server whether downloaded lists changed before reusing them
         """
+        self.revalidate_downloads = revalidate_downloads
         self.output_dir = os.path.join(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
             output_dir
@@ -73,64 +100,227 @@ class FrequencyListScraper:
             # Add more language sources as needed
         }
     
-    def download_file(self, url: str, target_path: str) -> bool:
-        """Download a file from a URL.
+    def download_file(self, url: str, target_path: str, revalidate: Optional[bool] = None) -> bool:
+        """Download a file from a URL, or reuse a verified earlier download.
+        
+        The file is written to "<target_path>.part" and only renamed into place
+        once complete and checked against the announced length. Its size,
+        SHA-256 and the server's validators (ETag, Last-Modified) are recorded
+        in "<target_path>.manifest.json". An interrupted download is resumed
+        with a Range request (If-Range makes the server send the whole file
+        instead if it changed meanwhile). An existing file is reused only if it
+        still matches its manifest; files without one are downloaded again.
         
         Args:
             url: The URL to download from
             target_path: Where to save the downloaded file
+            revalidate: Send a conditional request to check an existing download
+                is current (default: the scraper's revalidate_downloads setting)
             
         Returns:
             True if successful, False otherwise
         """
+        if revalidate is None:
+            revalidate = self.revalidate_downloads
+        manifest_path = f"{target_path}.manifest.json"
+        part_path = f"{target_path}.part"
+        manifest = self._read_manifest(manifest_path)
+        if manifest.get("url") != url:
+            manifest = {"url": url}
+        
+        # Byte ranges must refer to the file itself, not a compressed transfer of it
+        headers = {"Accept-Encoding": "identity"}
+        verified = self._verify_download(target_path, manifest_path, manifest)
+        if verified:
+            if not revalidate:
+                return True
+            if manifest.get("etag"):
+                headers["If-None-Match"] = manifest["etag"]
+            if manifest.get("last_modified"):
+                headers["If-Modified-Since"] = manifest["last_modified"]
+            if len(headers) == 1:
+                # Nothing to revalidate against
+                return True
+        
+        # Resume a partial download of the same version of the file
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        validator = manifest.get("etag") or manifest.get("last_modified")
+        if offset and validator and not verified:
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+        else:
+            offset = 0
+        
         try:
-            print(f"Downloading {url}...")
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
+            if verified:
+                print(f"Checking {url} for changes...")
+            elif offset:
+                print(f"Resuming {url} at {offset} bytes...")
+            else:
+                print(f"Downloading {url}...")
+            with requests.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                if response.status_code == 304:
+                    print(f"{target_path} is up to date")
+                    return True
+                if response.status_code == 416:
+                    # The partial file does not fit the current version; start over next time
+                    if os.path.exists(part_path):
+                        os.remove(part_path)
+                    print(f"Error downloading {url}: cannot resume, partial download discarded")
+                    return verified
+                response.raise_for_status()
+                
+                if response.status_code != 206:
+                    offset = 0
+                expected = response.headers.get("Content-Length")
+                expected = offset + int(expected) if expected is not None and expected.isdigit() else None
+                if response.headers.get("Content-Encoding", "identity") != "identity":
+                    # Server compressed anyway: the announced length counts compressed bytes
+                    expected = None
+                
+                manifest.update({
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                })
+                manifest.pop("size", None)
+                manifest.pop("sha256", None)
+                self._write_manifest(manifest_path, manifest)
+                
+                digest = hashlib.sha256()
+                if offset:
+                    with open(part_path, 'rb') as f:
+                        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                            digest.update(chunk)
+                
+                with open(part_path, 'ab' if offset else 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        digest.update(chunk)
             
-            with open(target_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            size = os.path.getsize(part_path)
+            if expected is not None and size != expected:
+                print(f"Error downloading {url}: got {size} of {expected} bytes (will resume)")
+                return False
             
+            os.replace(part_path, target_path)
+            manifest.update({"size": size, "sha256": digest.hexdigest(),
+                             "mtime_ns": os.stat(target_path).st_mtime_ns})
+            self._write_manifest(manifest_path, manifest)
             print(f"Downloaded to {target_path}")
             return True
         
         except Exception as e:
             print(f"Error downloading {url}: {str(e)}")
+            if verified:
+                print(f"Using the existing download {target_path}")
+            return verified
+    
+    @staticmethod
+    def _read_manifest(manifest_path: str) -> Dict[str, Union[str, int, None]]:
+        """Load a download manifest (empty if missing or unreadable)."""
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    @staticmethod
+    def _write_manifest(manifest_path: str, manifest: Dict[str, Union[str, int, None]]):
+        """Atomically replace a download manifest."""
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(manifest_path)))
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(temp_path, manifest_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+    
+    def _verify_download(self, target_path: str, manifest_path: str,
+                         manifest: Dict[str, Union[str, int, None]]) -> bool:
+        """Check a downloaded file against the size and SHA-256 in its manifest.
+        
+        The checksum is recomputed only when the file's modification time
+        differs from the one recorded after the download.
+        """
+        if not os.path.isfile(target_path) or "sha256" not in manifest:
+            return False
+        stat = os.stat(target_path)
+        if stat.st_size != manifest.get("size"):
+            print(f"{target_path} does not match its manifest (size); downloading again")
+            return False
+        if stat.st_mtime_ns == manifest.get("mtime_ns"):
+            return True
+        
+        digest = hashlib.sha256()
+        with open(target_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        if digest.hexdigest() != manifest["sha256"]:
+            print(f"{target_path} does not match its manifest (checksum); downloading again")
             return False
+        manifest["mtime_ns"] = stat.st_mtime_ns
+        self._write_manifest(manifest_path, manifest)
+        return True
     
-    def extract_archive(self, archive_path: str, extract_to: str) -> Optional[List[str]]:
-        """Extract files from a zip archive.
+    def open_archive_member(self, archive_path: str, extract_to: str,
+                            member: Optional[str] = None) -> Optional[IO[str]]:
+        """Open one file of an archive as a text stream, without extracting it.
+        
+        An extracted copy in extract_to that is at least as new as the archive
+        is read directly; otherwise the member is decompressed on the fly.
         
         Args:
-            archive_path: Path to the archive file
-            extract_to: Directory to extract to
+            archive_path: Path to the .zip or .gz file
+            extract_to: Directory where an extracted copy may already exist
+            member: Name of the file inside a zip archive (default: the first file)
             
         Returns:
-            List of extracted file paths or None if failed
+            Text stream positioned at the start of the file, or None if failed
         """
         try:
             if archive_path.endswith('.zip'):
                 with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                    zip_ref.extractall(extract_to)
-                    return [os.path.join(extract_to, name) for name in zip_ref.namelist()]
+                    names = [name for name in zip_ref.namelist() if not name.endswith('/')]
+                    if member:
+                        names = [name for name in names if os.path.basename(name) == member]
+                    if not names:
+                        print(f"Could not find {member or 'any file'} in {archive_path}")
+                        return None
+                    name = names[0]
+                
+                extracted_path = os.path.join(extract_to, name)
+                if self._is_up_to_date(extracted_path, archive_path):
+                    return _open_text(extracted_path)
+                
+                # The ZipExtFile keeps its own handle on the archive after ZipFile closes
+                zip_ref = zipfile.ZipFile(archive_path, 'r')
+                stream = zip_ref.open(name)
+                zip_ref.close()
+                return io.TextIOWrapper(stream, encoding='utf-8', errors='replace')
             
             elif archive_path.endswith('.gz'):
-                # For gzip files (usually single file archives)
-                output_path = os.path.join(extract_to, os.path.basename(archive_path)[:-3])
-                with gzip.open(archive_path, 'rb') as f_in:
-                    with open(output_path, 'wb') as f_out:
-                        f_out.write(f_in.read())
-                return [output_path]
+                extracted_path = os.path.join(extract_to, os.path.basename(archive_path)[:-3])
+                if self._is_up_to_date(extracted_path, archive_path):
+                    return _open_text(extracted_path)
+                return gzip.open(archive_path, 'rt', encoding='utf-8', errors='replace')
             
             else:
                 print(f"Unsupported archive format: {archive_path}")
                 return None
         
         except Exception as e:
-            print(f"Error extracting {archive_path}: {str(e)}")
+            print(f"Error opening {archive_path}: {str(e)}")
             return None
     
+    @staticmethod
+    def _is_up_to_date(extracted_path: str, archive_path: str) -> bool:
+        """Check whether an extracted copy exists and is not older than its archive."""
+        return (os.path.isfile(extracted_path)
+                and os.path.getmtime(extracted_path) >= os.path.getmtime(archive_path))
+    
     def process_csv_file(self, file_path: str, word_column: str, frequency_column: str, 
                          delimiter: str = ',') -> List[Tuple[str, int]]:
         """Process a CSV file to extract words and their frequencies.
@@ -144,10 +334,23 @@ class FrequencyListScraper:
         Returns:
             List of (word, frequency) tuples
         """
-        try:
-            words = []
+        return list(self.iter_csv_file(file_path, word_column, frequency_column, delimiter))
+    
+    def iter_csv_file(self, file_path: Union[str, IO[str]], word_column: str, frequency_column: str,
+                      delimiter: str = ',') -> Iterator[Tuple[str, int]]:
+        """Stream (word, frequency) pairs from a CSV file one row at a time.
+        
+        Args:
+            file_path: Path to the CSV file, or an open text stream
+            word_column: Column name or index for the word
+            frequency_column: Column name or index for the frequency
+            delimiter: CSV delimiter character
             
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        Yields:
+            (word, frequency) tuples
+        """
+        try:
+            with _open_text(file_path) as f:
                 # Try to determine if the file has headers
                 sample = f.read(1024)
                 f.seek(0)
@@ -163,27 +366,29 @@ class FrequencyListScraper:
                     if isinstance(frequency_column, str):
                         frequency_column = headers.index(frequency_column)
                 
+                last_column = max(word_column, frequency_column)
                 for row in reader:
-                    if len(row) > max(word_column, frequency_column):
+                    if len(row) > last_column:
                         word = row[word_column].strip().lower()
                         try:
                             freq = int(float(row[frequency_column]))
-                            if word and freq > 0 and re.match(r'^[a-záéíóúüñ]+$', word):
-                                words.append((word, freq))
+                            if word and freq > 0 and WORD_PATTERN.match(word):
+                                yield word, freq
                         except ValueError:
                             # Skip rows with non-numeric frequency
                             continue
-            
-            return words
         
         except Exception as e:
-            print(f"Error processing CSV {file_path}: {str(e)}")
-            return []
+            print(f"Error processing CSV {getattr(file_path, 'name', file_path)}: {str(e)}")
     
     def process_tsv_file(self, file_path: str, word_column: str, frequency_column: str) -> List[Tuple[str, int]]:
         """Process a TSV file to extract words and their frequencies."""
         return self.process_csv_file(file_path, word_column, frequency_column, delimiter='\t')
     
+    def iter_tsv_file(self, file_path: Union[str, IO[str]], word_column: str, frequency_column: str) -> Iterator[Tuple[str, int]]:
+        """Stream (word, frequency) pairs from a TSV file."""
+        return self.iter_csv_file(file_path, word_column, frequency_column, delimiter='\t')
+    
     def process_line_file(self, file_path: str, pattern: str) -> List[Tuple[str, int]]:
         """Process a simple line-based frequency list.
         
@@ -194,51 +399,60 @@ class FrequencyListScraper:
         Returns:
             List of (word, frequency) tuples
         """
+        return list(self.iter_line_file(file_path, pattern))
+    
+    def iter_line_file(self, file_path: Union[str, IO[str]], pattern: str) -> Iterator[Tuple[str, int]]:
+        """Stream (word, frequency) pairs from a line-based frequency list.
+        
+        Args:
+            file_path: Path to the text file, or an open text stream
+            pattern: Regex pattern with two capture groups (word and frequency)
+            
+        Yields:
+            (word, frequency) tuples
+        """
         try:
-            words = []
+            line_pattern = re.compile(pattern)
             
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            with _open_text(file_path) as f:
                 for line in f:
                     line = line.strip()
-                    match = re.match(pattern, line)
+                    match = line_pattern.match(line)
                     if match:
                         word, freq_str = match.groups()
                         word = word.strip().lower()
                         try:
                             freq = int(float(freq_str))
-                            if word and freq > 0 and re.match(r'^[a-záéíóúüñ]+$', word):
-                                words.append((word, freq))
+                            if word and freq > 0 and WORD_PATTERN.match(word):
+                                yield word, freq
                         except ValueError:
                             continue
-            
-            return words
         
         except Exception as e:
-            print(f"Error processing line file {file_path}: {str(e)}")
-            return []
+            print(f"Error processing line file {getattr(file_path, 'name', file_path)}: {str(e)}")
     
-    def get_frequency_list(self, lang_code: str, limit: int = 5000, 
-                           source_index: int = 0) -> List[str]:
-        """Get a frequency list for a specific language.
+    def get_top_frequencies(self, lang_code: str, limit: int = 5000,
+                            source_index: int = 0) -> Optional[Tuple[FrequencyTable, int]]:
+        """Download (if needed) and stream one source, keeping its most frequent words.
         
         Args:
             lang_code: Language code (e.g., "es" for Spanish)
-            limit: Maximum number of words to include
+            limit: Maximum number of words to keep
             source_index: Which source to use if multiple are available
             
         Returns:
-            List of words ordered by frequency
+            Tuple of (table of the top words, highest frequency first, and the
+            total frequency of all accepted words in the source), or None if failed
         """
         if lang_code not in self.frequency_sources:
-            print(f"No frequency sources defined for language code '{lang_code}'")
-            return []
+            print(f"No frequency sources defined for {languages.heading(lang_code)} ('{lang_code}')")
+            return None
         
         if source_index >= len(self.frequency_sources[lang_code]):
             print(f"Invalid source index {source_index} for language code '{lang_code}'")
-            return []
+            return None
         
         source = self.frequency_sources[lang_code][source_index]
-        source_name = source["name"]
         
         # Create language-specific directory
         lang_dir = os.path.join(self.output_dir, lang_code)
@@ -249,65 +463,91 @@ class FrequencyListScraper:
         filename = os.path.basename(url)
         download_path = os.path.join(lang_dir, filename)
         
-        if not os.path.exists(download_path):
-            if not self.download_file(url, download_path):
-                return []
+        if not self.download_file(url, download_path):
+            return None
         
-        # Extract if it's an archive
-        extracted_files = None
+        # Read archives member-by-member straight from the compressed file
         if filename.endswith(('.zip', '.gz')):
-            extracted_files = self.extract_archive(download_path, lang_dir)
-            if not extracted_files:
-                return []
-            
-            # Find the specific file we want from the archive
-            if "file_in_archive" in source:
-                target_file = None
-                for extracted_file in extracted_files:
-                    if os.path.basename(extracted_file) == source["file_in_archive"]:
-                        target_file = extracted_file
-                        break
-                
-                if not target_file:
-                    print(f"Could not find {source['file_in_archive']} in extracted files")
-                    return []
-            else:
-                # Just use the first file
-                target_file = extracted_files[0]
+            stream = self.open_archive_member(download_path, lang_dir, source.get("file_in_archive"))
+            if stream is None:
+                return None
         else:
             # Direct file download, not an archive
-            target_file = download_path
-        
-        # Process the file based on its format
-        words_with_freq = []
+            stream = _open_text(download_path)
         
-        if source["format"] == "csv":
-            words_with_freq = self.process_csv_file(
-                target_file, source["word_column"], source["frequency_column"]
-            )
+        # The stream is ours, so close it (and the archive behind it) when done
+        with stream as f:
+            # Stream the file based on its format
+            words_with_freq = iter(())
+            
+            if source["format"] == "csv":
+                words_with_freq = self.iter_csv_file(
+                    f, source["word_column"], source["frequency_column"]
+                )
+            
+            elif source["format"] == "tsv":
+                words_with_freq = self.iter_tsv_file(
+                    f, source["word_column"], source["frequency_column"]
+                )
+            
+            elif source["format"] == "line":
+                words_with_freq = self.iter_line_file(
+                    f, source["pattern"]
+                )
+            
+            # Keep only the top words (highest frequency first)
+            return top_frequencies(words_with_freq, limit)
+    
+    def frequency_list_path(self, lang_code: str, limit: int, source_index: int = 0) -> str:
+        """Default path of the list get_frequency_list saves (its index goes alongside)."""
+        source_name = self.frequency_sources[lang_code][source_index]["name"]
+        return os.path.join(self.output_dir, lang_code,
+                            f"{lang_code}_top_{limit}_{source_name.lower().replace(' ', '_')}.txt")
+    
+    def get_frequency_list(self, lang_code: str, limit: int = 5000, 
+                           source_index: int = 0, output_file: Optional[str] = None) -> List[str]:
+        """Get a frequency list for a specific language.
         
-        elif source["format"] == "tsv":
-            words_with_freq = self.process_tsv_file(
-                target_file, source["word_column"], source["frequency_column"]
-            )
+        Args:
+            lang_code: Language code (e.g., "es" for Spanish)
+            limit: Maximum number of words to include
+            source_index: Which source to use if multiple are available
+            output_file: Where to save the list (default: frequency_list_path); its
+                frequency index is written alongside as .idx
+            
+        Returns:
+            List of words ordered by frequency
+        """
+        result = self.get_top_frequencies(lang_code, limit, source_index)
+        if result is None:
+            return []
         
-        elif source["format"] == "line":
-            words_with_freq = self.process_line_file(
-                target_file, source["pattern"]
-            )
+        top, total = result
+        ranked = top.pairs()
+        top_words = [word for word, _ in ranked]
         
-        # Sort by frequency (highest first) and take top words
-        words_with_freq.sort(key=lambda x: x[1], reverse=True)
-        top_words = [word for word, _ in words_with_freq[:limit]]
+        # Save the processed list, plus a binary index for rank lookups
+        output_path = output_file or self.frequency_list_path(lang_code, limit, source_index)
+        self.save_word_list(output_path, ranked)
         
-        # Save the processed list
-        output_path = os.path.join(lang_dir, f"{lang_code}_top_{limit}_{source_name.lower().replace(' ', '_')}.txt")
+        if ranked:
+            zipf = top.zipf(total)
+            print(f"Saved {len(top_words)} words (Zipf {zipf[0]:.2f} to {zipf[-1]:.2f}) to {output_path}")
+        else:
+            print(f"Saved {len(top_words)} words to {output_path}")
+        return top_words
+    
+    @staticmethod
+    def save_word_list(output_path: str, ranked: List[Tuple[str, float]]):
+        """Write words (most frequent first) one per line, plus their frequency index (.idx)."""
+        words = [word for word, _ in ranked]
+        if len(set(words)) != len(words):
+            repeated = sorted(word for word, count in Counter(words).items() if count > 1)
+            raise ValueError(f"Word list for {output_path} repeats words: {', '.join(repeated[:10])}")
         with open(output_path, 'w', encoding='utf-8') as f:
-            for word in top_words:
+            for word, _ in ranked:
                 f.write(f"{word}\n")
-        
-        print(f"Saved {len(top_words)} words to {output_path}")
-        return top_words
+        write_frequency_index(index_path_for(output_path), ranked)
     
     def filter_by_word_class(self, lang_code: str, words: List[str], 
                              target_class: str, limit: int = 1000) -> List[str]:
@@ -334,72 +574,83 @@ class FrequencyListScraper:
         print(f"Warning: Filtering by word class not fully implemented for {lang_code}/{target_class}")
         return words[:limit]
     
-    def generate_complete_wordlist(self, lang_code: str, output_file: Optional[str] = None) -> str:
+    def generate_complete_wordlist(self, lang_code: str, output_file: Optional[str] = None,
+                                   limit_per_source: int = 10000, workers: Optional[int] = None) -> str:
         """Generate a comprehensive wordlist for a language combining multiple sources.
         
+        Sources are downloaded and parsed concurrently. Each source's counts are
+        normalized to occurrences per million words, and the per-source lists are
+        merged so the combined list is ranked by normalized frequency (a word
+        found in several sources takes its highest rank).
+        
         Args:
             lang_code: Language code to process
             output_file: Optional custom output file path
+            limit_per_source: Number of top words to take from each source
+            workers: Number of sources to process at once (default: all of them)
             
         Returns:
             Path to the generated wordlist file
         """
         if lang_code not in self.frequency_sources:
-            print(f"No frequency sources defined for language code '{lang_code}'")
+            print(f"No frequency sources defined for {languages.heading(lang_code)} ('{lang_code}')")
             return ""
         
-        all_words = set()
+        source_count = len(self.frequency_sources[lang_code])
         
-        # Process all available sources for this language
-        for i in range(len(self.frequency_sources[lang_code])):
-            source_words = self.get_frequency_list(lang_code, limit=10000, source_index=i)
-            all_words.update(source_words)
+        # Process all available sources for this language in parallel
+        with ThreadPoolExecutor(max_workers=workers or source_count) as executor:
+            results = list(executor.map(
+                lambda i: self.get_top_frequencies(lang_code, limit_per_source, i),
+                range(source_count)
+            ))
         
-        # Sort alphabetically for easier browsing
-        sorted_words = sorted(list(all_words))
+        # Rank by occurrences per million, a word found in several sources taking its highest rank
+        ranked = rank_normalized(filter(None, results))
         
         # Save to file
         output_path = output_file or os.path.join(
             self.output_dir, lang_code, f"{lang_code}_combined_wordlist.txt"
         )
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for word in sorted_words:
-                f.write(f"{word}\n")
+        self.save_word_list(output_path, ranked)
         
-        print(f"Saved combined wordlist with {len(sorted_words)} words to {output_path}")
+        print(f"Saved combined wordlist with {len(ranked)} words to {output_path}")
         return output_path
 
-
 def main():
     """Main function to run the script from command line."""
     parser = argparse.ArgumentParser(description="Download and process word frequency lists")
     
-    parser.add_argument("--lang", type=str, required=True, help="Language code (e.g., 'es' for Spanish)")
+    parser.add_argument("--lang", type=str, required=True, help="Language code or name (e.g., 'es' or 'Spanish')")
     parser.add_argument("--limit", type=int, default=5000, help="Maximum number of words to include")
     parser.add_argument("--source", type=int, default=0, help="Source index to use (if multiple available)")
     parser.add_argument("--word-class", type=str, help="Filter for a specific word class (e.g., 'verb')")
     parser.add_argument("--output", type=str, help="Output file path")
     parser.add_argument("--combine", action="store_true", help="Combine all sources into one wordlist")
+    parser.add_argument("--revalidate", action="store_true",
+                        help="Check with the server whether downloaded lists changed before reusing them")
     
     args = parser.parse_args()
+    args.lang = languages.resolve(args.lang) or args.lang
     
-    scraper = FrequencyListScraper()
+    scraper = FrequencyListScraper(revalidate_downloads=args.revalidate)
     
     if args.combine:
         scraper.generate_complete_wordlist(args.lang, args.output)
+    elif not args.word_class:
+        scraper.get_frequency_list(args.lang, args.limit, args.source, args.output)
     else:
         words = scraper.get_frequency_list(args.lang, args.limit, args.source)
-        
-        if args.word_class:
-            words = scraper.filter_by_word_class(args.lang, words, args.word_class)
-            
-            # Save filtered list if requested
-            if args.output:
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    for word in words:
-                        f.write(f"{word}\n")
-                print(f"Saved {len(words)} {args.word_class}s to {args.output}")
+        words = scraper.filter_by_word_class(args.lang, words, args.word_class)
+        
+        # Save the filtered list (and its index, keeping the source frequencies) if requested
+        if args.output and words:
+            index_path = index_path_for(scraper.frequency_list_path(args.lang, args.limit, args.source))
+            with FrequencyIndex(index_path) as index:
+                ranked = [(word, index.lookup(word)[1]) for word in words]
+            scraper.save_word_list(args.output, ranked)
+            print(f"Saved {len(words)} {args.word_class}s to {args.output}")
 
 
 if __name__ == "__main__":
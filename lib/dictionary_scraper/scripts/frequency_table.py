@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Frequency Table - Array-backed (word, count) lists for frequency processing
+
+A FrequencyTable holds a source's words and counts as parallel arrays
+(NumPy object and int64 arrays when NumPy is installed), one row per distinct
+word: rows repeating a word (e.g. case variants that collapse once the
+parsers lowercase them) are merged by summing their counts. Selecting the top K
+words is an argpartition plus a sort of just those K, and per-million
+normalization, Zipf scores and the cross-source merge are whole-array
+operations, instead of Python-level heaps and sorts over millions of tuples.
+
+top_frequencies keeps the bounded memory of the streaming heap it replaced:
+rows are merged per chunk of distinct words, and a source with more distinct
+words than one chunk holds goes through an external merge sort (sorted runs
+in temporary files), so variants of a word far apart in the list still add
+up to one count.
+
+Without NumPy the same operations fall back to heapq and plain lists, with
+identical results.
+"""
+
+import heapq
+import itertools
+import json
+import math
+import tempfile
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class FrequencyTable:
+    """Words and their counts as parallel arrays (lists without NumPy)."""
+
+    def __init__(self, words: Sequence[str], counts: Sequence[int]):
+        """Wrap parallel sequences of words and counts."""
+        if np is not None:
+            words = np.asarray(words, dtype=object)
+            counts = np.asarray(counts, dtype=np.int64)
+        else:
+            words = list(words)
+            counts = list(counts)
+        self.words = words
+        self.counts = counts
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[str, int]]) -> "FrequencyTable":
+        """Build a table from a stream of (word, count) pairs, summing the counts of repeated words.
+
+        Words keep the position of their first occurrence.
+        """
+        merged: Dict[str, int] = {}
+        get = merged.get
+        for word, count in pairs:
+            merged[word] = get(word, 0) + count
+        return cls(list(merged), list(merged.values()))
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @property
+    def total(self) -> int:
+        """Sum of all counts."""
+        return int(self.counts.sum()) if np is not None else sum(self.counts)
+
+    def pairs(self) -> List[Tuple[str, int]]:
+        """The rows as (word, count) tuples."""
+        if np is not None:
+            return list(zip(self.words.tolist(), self.counts.tolist()))
+        return list(zip(self.words, self.counts))
+
+    def top(self, k: int) -> "FrequencyTable":
+        """The k highest counts, highest first (ties keep their original order)."""
+        if np is None:
+            top = heapq.nlargest(k, zip(self.words, self.counts), key=lambda row: row[1])
+            return FrequencyTable([word for word, _ in top], [count for _, count in top])
+
+        if k <= 0:
+            return FrequencyTable([], [])
+        selected = np.arange(len(self.counts))
+        if k < len(self.counts):
+            # Partition on the k-th largest count, then keep every row above it
+            # and the earliest rows equal to it, as a stable sort would
+            threshold = self.counts[np.argpartition(self.counts, len(self.counts) - k)[len(self.counts) - k]]
+            above = np.flatnonzero(self.counts > threshold)
+            tied = np.flatnonzero(self.counts == threshold)[:k - len(above)]
+            selected = np.concatenate((above, tied))
+        order = selected[np.lexsort((selected, -self.counts[selected]))]
+        return FrequencyTable(self.words[order], self.counts[order])
+
+    def per_million(self, total: Optional[int] = None) -> Sequence[float]:
+        """Counts as occurrences per million (of total, default: this table's total)."""
+        total = total or self.total
+        if np is not None:
+            return self.counts.astype(np.float64) * 1_000_000 / total
+        return [count * 1_000_000 / total for count in self.counts]
+
+    def zipf(self, total: Optional[int] = None) -> Sequence[float]:
+        """Zipf scale of each count: log10 of occurrences per billion words."""
+        per_million = self.per_million(total)
+        if np is not None:
+            return np.log10(per_million) + 3
+        return [math.log10(value) + 3 for value in per_million]
+
+
+def top_frequencies(pairs: Iterable[Tuple[str, int]], k: int,
+                    chunk_size: int = 1 << 20) -> Tuple[FrequencyTable, int]:
+    """Stream (word, count) pairs, keeping the k highest counts.
+
+    Counts of a repeated word are summed before selecting. Rows are merged in
+    chunks of at most chunk_size distinct words; a source with more distinct
+    words spills each chunk to a temporary file sorted by word, and the runs
+    are merged back word by word into a bounded heap of the k best. Memory
+    therefore stays bounded by chunk_size + k whatever the size of the source.
+
+    Returns:
+        (table of the top k distinct words highest first, total count of all rows)
+    """
+    total = 0
+    runs = []
+    chunk: Dict[str, List[int]] = {}
+    try:
+        for position, (word, count) in enumerate(pairs):
+            total += count
+            row = chunk.get(word)
+            if row is None:
+                chunk[word] = [count, position]
+            else:
+                row[0] += count
+            if len(chunk) >= chunk_size:
+                runs.append(_spill_run(chunk))
+                chunk = {}
+
+        if not runs:
+            # Everything fit in one chunk, whose rows are in first-occurrence order
+            table = FrequencyTable(list(chunk), [count for count, _ in chunk.values()])
+            return table.top(k), total
+        if chunk:
+            runs.append(_spill_run(chunk))
+
+        # Highest count first, ties in order of first occurrence (as FrequencyTable.top)
+        top = heapq.nlargest(k, _merge_runs(runs), key=lambda row: (row[1], -row[2]))
+        return FrequencyTable([word for word, _, _ in top], [count for _, count, _ in top]), total
+    finally:
+        for run in runs:
+            run.close()
+
+
+def _spill_run(chunk: Dict[str, List[int]]) -> IO[str]:
+    """Write a chunk's [count, first position] rows to a temporary file, sorted by word."""
+    run = tempfile.TemporaryFile("w+", encoding="utf-8")
+    for word in sorted(chunk):
+        count, position = chunk[word]
+        run.write(json.dumps([word, count, position], ensure_ascii=False))
+        run.write("\n")
+    run.seek(0)
+    return run
+
+
+def _merge_runs(runs: List[IO[str]]) -> Iterator[Tuple[str, int, int]]:
+    """Merge sorted runs into one (word, summed count, first position) row per word."""
+    rows = heapq.merge(*((json.loads(line) for line in run) for run in runs), key=lambda row: row[0])
+    for word, group in itertools.groupby(rows, key=lambda row: row[0]):
+        count = 0
+        position = None
+        for _, run_count, run_position in group:
+            count += run_count
+            position = run_position if position is None else min(position, run_position)
+        yield word, count, position
+
+
+def rank_normalized(sources: Iterable[Tuple[FrequencyTable, int]]) -> List[Tuple[str, float]]:
+    """Merge per-source tables into one ranking by occurrences per million.
+
+    Args:
+        sources: (table sorted highest count first, total count of the whole source) pairs
+
+    Returns:
+        (word, per-million frequency) pairs, highest first; a word found in
+        several sources takes its highest frequency
+    """
+    sources = [(table, total) for table, total in sources if total > 0 and len(table)]
+    if not sources:
+        return []
+
+    if np is None:
+        normalized = [zip(table.words, table.per_million(total)) for table, total in sources]
+        seen = set()
+        ranked = []
+        for word, per_million in heapq.merge(*normalized, key=lambda x: x[1], reverse=True):
+            if word not in seen:
+                seen.add(word)
+                ranked.append((word, per_million))
+        return ranked
+
+    words = np.concatenate([table.words for table, _ in sources])
+    scores = np.concatenate([table.per_million(total) for table, total in sources])
+    order = np.argsort(-scores, kind="stable")
+    words = words[order]
+    scores = scores[order]
+    # Keep each word at its first (highest) position
+    _, first = np.unique(words, return_index=True)
+    first.sort()
+    return list(zip(words[first].tolist(), scores[first].tolist()))
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+HTML Parsers - Pluggable backends for locating a language section in a page
+
+Every backend returns the same thing: the list of tag nodes between the target
+language's h2 and the next h2, as BeautifulSoup elements, so the extractors in
+WiktionaryScraper work unchanged whichever backend is used.
+
+- "html.parser": parses the whole page with Python's built-in parser (original behavior)
+- "lxml": parses the whole page with the C-backed lxml tree builder
+- "fast": slices out just the target language section from the raw HTML and
+  parses only that fragment, with lxml when it is installed
+"""
+
+import html
+import re
+from typing import Any, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401
+    FAST_FEATURES = "lxml"
+except ImportError:
+    FAST_FEATURES = "html.parser"
+
+
+def _section_nodes(h2) -> List[Any]:
+    """Get all tag nodes following a language h2 up to the next h2."""
+    lang_content = []
+    current = h2.next_sibling
+    while current and not (current.name == "h2"):
+        if current.name:
+            lang_content.append(current)
+        current = current.next_sibling
+    return lang_content
+
+
+def _find_language_h2(soup, language_name: str):
+    """Find the h2 whose headline matches the language name."""
+    for h2 in soup.find_all("h2"):
+        headline = h2.find("span", {"class": "mw-headline"})
+        if headline and headline.text == language_name:
+            return h2
+    return None
+
+
+class SoupPageParser:
+    """Parse the whole page with BeautifulSoup and walk to the language section."""
+
+    def __init__(self, features: str = "html.parser"):
+        """Initialize the parser.
+
+        Args:
+            features: BeautifulSoup tree builder ("html.parser" or "lxml")
+        """
+        self.features = features
+
+    def language_section(self, html_content: str, language_name: str) -> Optional[List[Any]]:
+        """Get the nodes of a language section, or None if the page has no such section."""
+        soup = BeautifulSoup(html_content, self.features)
+        lang_section = _find_language_h2(soup, language_name)
+        if not lang_section:
+            return None
+        return _section_nodes(lang_section)
+
+
+class PartialPageParser(SoupPageParser):
+    """Parse only the target language section, located by scanning the raw HTML."""
+
+    H2_PATTERN = re.compile(r"<h2[\s>].*?</h2>", re.IGNORECASE | re.DOTALL)
+    HEADLINE_PATTERN = re.compile(r'class="mw-headline"[^>]*>(.*?)</span>', re.DOTALL)
+    TAG_PATTERN = re.compile(r"<[^>]+>")
+    # Where the article body ends when the language is the last section on the page
+    END_PATTERN = re.compile(
+        r'<h2[\s>]|<!--\s*NewPP limit report|<div[^>]+class="printfooter"|<div[^>]+id="catlinks"',
+        re.IGNORECASE
+    )
+
+    def __init__(self, features: str = FAST_FEATURES):
+        super().__init__(features)
+
+    def _slice_section(self, html_content: str, language_name: str) -> Optional[str]:
+        """Cut the raw HTML of the language section, from its h2 to the next h2."""
+        for match in self.H2_PATTERN.finditer(html_content):
+            headline = self.HEADLINE_PATTERN.search(match.group(0))
+            if not headline:
+                continue
+            text = html.unescape(self.TAG_PATTERN.sub("", headline.group(1)))
+            if text != language_name:
+                continue
+            end = self.END_PATTERN.search(html_content, match.end())
+            return html_content[match.start():end.start() if end else len(html_content)]
+        return None
+
+    def language_section(self, html_content: str, language_name: str) -> Optional[List[Any]]:
+        """Get the nodes of a language section, parsing only that section."""
+        fragment = self._slice_section(html_content, language_name)
+        if fragment is None:
+            # Unusual markup: fall back to a full parse so nothing is lost
+            return super().language_section(html_content, language_name)
+
+        soup = BeautifulSoup(fragment, self.features)
+        lang_section = soup.find("h2")
+        if not lang_section:
+            return None
+        return _section_nodes(lang_section)
+
+
+PARSER_BACKENDS: Dict[str, Any] = {
+    "html.parser": lambda: SoupPageParser("html.parser"),
+    "lxml": lambda: SoupPageParser("lxml"),
+    "fast": PartialPageParser,
+}
+
+
+def get_page_parser(name: str = "html.parser"):
+    """Create a page parser backend by name."""
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend '{name}'")
+    if name == "lxml" and FAST_FEATURES != "lxml":
+        raise ValueError("The lxml parser backend requires the lxml package")
+    return PARSER_BACKENDS[name]()
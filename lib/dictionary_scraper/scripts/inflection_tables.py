@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Inflection Tables - Read conjugation and declension tables into nested dicts
+
+A table is first reduced to its layout signature: for every row, the tag and
+spans of each cell plus the text of header cells (data cells are left out, so
+every verb conjugated with the same template shares one signature). From the
+signature alone the cells are laid out on a grid with rowspan/colspan
+expanded, and each data cell is labelled from the headers that apply to it:
+
+- header cells to its left in the same row (tense rows, mood rails);
+- the nearest band of header rows above it in the same column (persons,
+  numbers, genders, cases);
+- section headers in that band that sit over the row-header columns
+  (a mood heading a block of tense rows).
+
+The labels (mood, tense, voice, case, gender, person/number) become the
+cell's key path, e.g. ("indicative", "present", "1sg"). Layouts are cached
+by signature, so for each further page with a known template only the data
+cells' text is read.
+
+Header vocabulary is English (as on en.wiktionary) plus the subject pronouns
+of Spanish, Latin, French, Italian, Portuguese and German.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from text_normalization import normalize_whitespace
+
+# Classes marking conjugation/declension tables and the boxes that hold them
+INFLECTION_TABLE_CLASSES = frozenset({"conjugation", "inflection-table", "roa-inflection-table"})
+INFLECTION_BOX_CLASSES = frozenset({"inflection-table", "NavFrame"})
+
+# Upper bound for rowspan/colspan, guarding against malformed markup
+MAX_SPAN = 64
+
+# Cells holding no form
+EMPTY_CELLS = frozenset({"", "-", "—", "–"})
+
+# Header vocabulary by category, matched longest phrase first on word boundaries
+MOODS = ("indicative", "subjunctive", "subjunctive i", "subjunctive ii", "imperative", "infinitive",
+         "gerund", "gerundive", "participle", "supine")
+TENSES = ("present", "imperfect", "preterite", "preterit", "future", "perfect", "pluperfect",
+          "future perfect", "past", "present perfect", "past perfect", "past anterior",
+          "past historic", "conditional perfect", "affirmative", "negative")
+VOICES = ("active", "passive")
+CASES = ("nominative", "genitive", "dative", "accusative", "ablative", "vocative", "locative",
+         "instrumental")
+GENDERS = ("masculine", "feminine", "neuter")
+NUMBERS = {"singular": "sg", "plural": "pl", "dual": "du"}
+PERSONS = {"1st": "1", "first": "1", "2nd": "2", "second": "2", "3rd": "3", "third": "3"}
+
+# Subject pronouns heading person columns or rows
+PRONOUNS = {
+    "1sg": ("yo", "ego", "je", "j", "io", "eu", "ich"),
+    "2sg": ("tú", "tu", "vos", "tū", "du"),
+    "3sg": ("él", "ella", "ello", "usted", "il", "elle", "on", "lui", "lei", "egli", "esso", "essa",
+            "ele", "ela", "você", "er"),
+    "1pl": ("nosotros", "nosotras", "nōs", "nous", "noi", "nós", "wir"),
+    "2pl": ("vosotros", "vosotras", "vōs", "vous", "voi", "vós", "ihr"),
+    "3pl": ("ellos", "ellas", "ustedes", "ils", "elles", "loro", "essi", "esse", "eles", "elas",
+            "vocês", "sie"),
+}
+PRONOUN_SLOTS = {pronoun: slot for slot, pronouns in PRONOUNS.items() for pronoun in pronouns}
+# Words introducing subjunctive pronouns ("que je", "che io", "dass ich")
+PRONOUN_PREFIXES = frozenset({"que", "qu", "che", "dass"})
+
+# Headers naming the whole table rather than a row or column
+TITLE_PATTERN = re.compile(r"\b(conjugation|declension|inflection)\b")
+WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+
+def _phrase_pattern(phrases) -> re.Pattern:
+    """Match any phrase as whole words, preferring the longest."""
+    alternation = "|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True))
+    return re.compile(rf"\b({alternation})\b")
+
+
+CATEGORY_PATTERNS = (
+    ("mood", _phrase_pattern(MOODS)),
+    ("tense", _phrase_pattern(TENSES)),
+    ("voice", _phrase_pattern(VOICES)),
+    ("case", _phrase_pattern(CASES)),
+    ("gender", _phrase_pattern(GENDERS)),
+    ("number", _phrase_pattern(NUMBERS)),
+    ("person", _phrase_pattern(PERSONS)),
+)
+CONDITIONAL_PATTERN = re.compile(r"\bconditional\b")
+
+# Order in which labels form a cell's key path
+PATH_ORDER = ("mood", "tense", "case", "gender", "slot")
+
+
+@lru_cache(maxsize=4096)
+def header_labels(text: str) -> Tuple[Tuple[str, str], ...]:
+    """Classify a (lowercase) header text into (category, value) labels."""
+    if not text or TITLE_PATTERN.search(text):
+        return ()
+    labels = []
+    for category, pattern in CATEGORY_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            value = match.group(1)
+            if category == "number":
+                value = NUMBERS[value]
+            elif category == "person":
+                value = PERSONS[value]
+            labels.append((category, value.replace(" ", "_")))
+    if CONDITIONAL_PATTERN.search(text) and not any(c == "tense" for c, _ in labels):
+        # A mood in French/Italian tables, a tense of the indicative in Spanish/Portuguese ones
+        labels.append(("conditional", "conditional"))
+    if not labels:
+        for word in WORD_PATTERN.findall(text):
+            if word in PRONOUN_PREFIXES:
+                continue
+            slot = PRONOUN_SLOTS.get(word)
+            if slot:
+                labels.append(("slot", slot))
+            break
+    return tuple(labels)
+
+
+def table_signature(table) -> Tuple[Tuple[Tuple[Any, ...], ...], List[Any]]:
+    """Structural signature of a table, plus its cells in document order.
+
+    Each cell is (is_header, rowspan, colspan, text or None). Only header cells
+    contribute their text, so tables of the same template share a signature
+    whatever forms they hold. A row's leading data cell counts as a header when
+    its text is a label (such as "yo" in simple tables), never when it is a form.
+    """
+    signature = []
+    cells = []
+    for row in table.find_all("tr"):
+        row_signature = []
+        row_cells = [cell for cell in row.children if cell.name in ("th", "td")]
+        for position, cell in enumerate(row_cells):
+            is_header = cell.name == "th"
+            text = None
+            if is_header or (position == 0 and len(row_cells) > 1):
+                text = normalize_whitespace(cell.get_text(" ")).strip().lower()
+                if not is_header:
+                    is_header = bool(header_labels(text))
+                    text = text if is_header else None
+            row_signature.append((is_header, _span(cell.get("rowspan")), _span(cell.get("colspan")), text))
+            cells.append(cell)
+        signature.append(tuple(row_signature))
+    return tuple(signature), cells
+
+
+def _span(value) -> int:
+    """Parse a rowspan/colspan attribute."""
+    try:
+        span = int(value)
+    except (TypeError, ValueError):
+        return 1
+    return min(max(span, 1), MAX_SPAN)
+
+
+def _grid(signature) -> Tuple[List[List[Optional[int]]], List[Tuple[int, int]]]:
+    """Lay the cells out on a grid of cell numbers, expanding spans.
+
+    Returns:
+        (grid of cell numbers or None, top-left (row, column) of each cell)
+    """
+    occupied: Dict[Tuple[int, int], int] = {}
+    origins = []
+    width = 0
+    index = 0
+    for r, row in enumerate(signature):
+        c = 0
+        for _, rowspan, colspan, _ in row:
+            while (r, c) in occupied:
+                c += 1
+            origins.append((r, c))
+            for dr in range(rowspan):
+                for dc in range(colspan):
+                    occupied[(r + dr, c + dc)] = index
+            c += colspan
+            width = max(width, c)
+            index += 1
+    height = max((r for r, _ in occupied), default=-1) + 1
+    grid = [[occupied.get((r, c)) for c in range(width)] for r in range(height)]
+    return grid, origins
+
+
+def _cell_key(labels: Dict[str, str]) -> Tuple[str, ...]:
+    """Key path of a data cell from its labels."""
+    if "conditional" in labels:
+        if "mood" in labels:
+            labels.setdefault("tense", "conditional")
+        else:
+            labels["mood"] = "conditional"
+    if "voice" in labels and labels["voice"] != "active":
+        labels["tense"] = f"{labels['tense']}_{labels['voice']}" if "tense" in labels else labels["voice"]
+    if "slot" not in labels:
+        if "person" in labels and "number" in labels:
+            labels["slot"] = labels["person"] + labels["number"]
+        elif "number" in labels:
+            labels["slot"] = {"sg": "singular", "pl": "plural", "du": "dual"}[labels["number"]]
+    return tuple(labels[category] for category in PATH_ORDER if category in labels)
+
+
+@lru_cache(maxsize=512)
+def table_layout(signature) -> Tuple[Tuple[int, Tuple[str, ...]], ...]:
+    """Key path of every labelled data cell of a layout, as (cell number, path) pairs."""
+    cells = [cell for row in signature for cell in row]
+    grid, origins = _grid(signature)
+    headers = [header for header, _, _, _ in cells]
+
+    def is_header(i):
+        return i is not None and headers[i]
+
+    layout = []
+    seen = set()
+    for i in range(len(cells)):
+        if headers[i]:
+            continue
+        r, c = origins[i]
+        labels: Dict[str, str] = {}
+
+        def apply(cell_number):
+            for category, value in header_labels(cells[cell_number][3]):
+                labels.setdefault(category, value)
+
+        # Row headers, nearest first
+        row_header_columns = set()
+        for col in range(c - 1, -1, -1):
+            if is_header(grid[r][col]):
+                row_header_columns.add(col)
+                apply(grid[r][col])
+
+        # The nearest band of header rows above, nearest first
+        band = []
+        for row in range(r - 1, -1, -1):
+            if is_header(grid[row][c]):
+                band.append(row)
+            elif band:
+                break
+        for row in band:
+            apply(grid[row][c])
+
+        # Section headers in the band, over the row-header columns
+        sections = []
+        for row in band:
+            for col in sorted(row_header_columns, reverse=True):
+                if is_header(grid[row][col]) and grid[row][col] not in sections:
+                    sections.append(grid[row][col])
+        for cell_number in sections:
+            apply(cell_number)
+
+        if not labels:
+            continue
+        key = _cell_key(labels)
+        if key in seen:
+            # A second row or column with the same labels, e.g. the -ra/-se imperfect subjunctive
+            position = PATH_ORDER.index("tense") if "tense" in labels else len(key) - 1
+            position = min(position, len(key) - 1)
+            n = 1
+            while True:
+                suffix = "_alternate" if n == 1 else f"_alternate_{n}"
+                alternate = key[:position] + (key[position] + suffix,) + key[position + 1:]
+                if alternate not in seen:
+                    key = alternate
+                    break
+                n += 1
+        seen.add(key)
+        layout.append((i, key))
+    return tuple(layout)
+
+
+def _set_path(forms: Dict[str, Any], path: Tuple[str, ...], value: str):
+    """Store a form under a key path, leaving conflicting entries alone."""
+    target = forms
+    for key in path[:-1]:
+        nested = target.setdefault(key, {})
+        if not isinstance(nested, dict):
+            return
+        target = nested
+    if path[-1] not in target:
+        target[path[-1]] = value
+
+
+def _cell_text(cell) -> str:
+    """A data cell's form(s); alternatives on separate lines are joined with commas."""
+    if not any(node.name == "br" for node in cell.descendants):
+        return normalize_whitespace(cell.get_text(" ")).strip()
+    lines = (normalize_whitespace(line).strip() for line in cell.get_text("\n").split("\n"))
+    return ", ".join(line for line in lines if line)
+
+
+def read_inflection_table(table) -> Dict[str, Any]:
+    """Read a conjugation or declension table into nested {label: ... {label: form}} dicts."""
+    signature, cells = table_signature(table)
+    forms: Dict[str, Any] = {}
+    for i, path in table_layout(signature):
+        form = _cell_text(cells[i])
+        if form not in EMPTY_CELLS:
+            _set_path(forms, path, form)
+    return forms
+
+
+def merge_forms(target: Dict[str, Any], forms: Dict[str, Any]):
+    """Merge nested forms into target (later tables fill in, never overwrite)."""
+    for key, value in forms.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge_forms(target[key], value)
+        elif key not in target:
+            target[key] = value
+
+
+def is_inflection_table(elem) -> bool:
+    """Whether an element is a conjugation/declension table."""
+    return elem.name == "table" and not INFLECTION_TABLE_CLASSES.isdisjoint(elem.get("class", []))
+
+
+def is_inflection_box(elem) -> bool:
+    """Whether an element is a box wrapping inflection tables."""
+    return elem.name == "div" and not INFLECTION_BOX_CLASSES.isdisjoint(elem.get("class", []))
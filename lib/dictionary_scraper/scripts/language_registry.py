@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Language Registry - Wiktionary language codes, names and section headings
+
+The process-wide `languages` registry maps between Wiktionary language codes
+(ISO 639 where one exists, e.g. "es", "grc", "roa-opt"), canonical names and
+the other names a language goes by. A language's canonical name is also the
+heading of its level-2 section and the label of its translation rows.
+
+The table is read from languages.tsv on the first lookup, once per process
+(parser workers load their own copy), and all lookups are dict hits in either
+direction. The bundled table covers the commonly used languages; run this
+script with --update to regenerate it from Wiktionary's full language data.
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_LANGUAGES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "languages.tsv")
+
+# Raw Lua data module listing every Wiktionary language code with its canonical name
+CANONICAL_NAMES_URL = ("https://en.wiktionary.org/w/index.php"
+                       "?title=Module:languages/code_to_canonical_name&action=raw")
+LUA_ENTRY_PATTERN = re.compile(r'\[\s*"([^"]+)"\s*\]\s*=\s*"((?:[^"\\]|\\.)*)"')
+
+
+def read_languages_file(path: str) -> Iterator[Tuple[str, str, List[str]]]:
+    """Yield (code, canonical name, other names) from a languages TSV file."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split("\t")
+            if len(fields) >= 2 and fields[0] and fields[1]:
+                yield fields[0], fields[1], [name for name in fields[2:] if name]
+
+
+class LanguageRegistry:
+    """Bidirectional language code <-> name lookups, loaded on first use."""
+
+    def __init__(self, path: str = DEFAULT_LANGUAGES_FILE):
+        """Initialize the registry (nothing is read until the first lookup).
+
+        Args:
+            path: Languages TSV file (code, canonical name, other names...)
+        """
+        self.path = path
+        self._names: Optional[Dict[str, str]] = None
+        self._codes: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, str]:
+        """Build both lookup tables (once)."""
+        with self._lock:
+            if self._names is None:
+                names = {}
+                codes = {}
+                try:
+                    for code, name, other_names in read_languages_file(self.path):
+                        names[code] = name
+                        codes[name] = code
+                        for other in other_names:
+                            codes.setdefault(other, code)
+                except OSError as e:
+                    print(f"Error reading language registry {self.path}: {str(e)}")
+                # Case-insensitive fallbacks, without overriding exact names
+                for name, code in list(codes.items()):
+                    codes.setdefault(name.lower(), code)
+                self._codes = codes
+                self._names = names
+            return self._names
+
+    def name(self, code: str) -> Optional[str]:
+        """Canonical name of a language code, or None if unknown."""
+        names = self._names if self._names is not None else self._load()
+        return names.get(code)
+
+    def heading(self, code: str) -> str:
+        """Section heading for a language code (the upper-cased code if unknown)."""
+        return self.name(code) or code.upper()
+
+    def code(self, name: str) -> Optional[str]:
+        """Language code for a canonical or other name (any case), or None if unknown."""
+        if self._names is None:
+            self._load()
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes.get(name.lower())
+        return code
+
+    def resolve(self, code_or_name: str) -> Optional[str]:
+        """Language code for something that is either a code or a name."""
+        if self.name(code_or_name) is not None:
+            return code_or_name
+        return self.code(code_or_name)
+
+    def __contains__(self, code: str) -> bool:
+        return self.name(code) is not None
+
+    def __len__(self) -> int:
+        names = self._names if self._names is not None else self._load()
+        return len(names)
+
+
+# Process-wide registry shared by the scrapers
+languages = LanguageRegistry()
+
+
+def update_languages_file(path: str = DEFAULT_LANGUAGES_FILE, url: str = CANONICAL_NAMES_URL) -> int:
+    """Regenerate the languages file from Wiktionary's language data.
+
+    Other names already listed in the file are kept for codes that still exist.
+
+    Returns:
+        Number of languages written (0 if the download failed)
+    """
+    import requests
+
+    try:
+        print(f"Downloading {url}...")
+        response = requests.get(url, timeout=60)
+        response.raise_for_status()
+    except Exception as e:
+        print(f"Error downloading language data: {str(e)}")
+        return 0
+
+    canonical = {code: name.replace('\\"', '"') for code, name in LUA_ENTRY_PATTERN.findall(response.text)}
+    if not canonical:
+        print("Error: no language entries found in the downloaded data")
+        return 0
+
+    other_names = {}
+    if os.path.exists(path):
+        other_names = {code: names for code, _, names in read_languages_file(path)}
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("# Wiktionary language codes, canonical names (= the level-2 section heading) and other names\n")
+            f.write("# code<TAB>canonical name[<TAB>other name...]\n")
+            f.write("# Regenerate with all Wiktionary languages: python language_registry.py --update\n")
+            for code, name in sorted(canonical.items()):
+                extra = [other for other in other_names.get(code, []) if other != name]
+                f.write("\t".join([code, name] + extra) + "\n")
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    print(f"Saved {len(canonical)} languages to {path}")
+    return len(canonical)
+
+
+def main():
+    """Main function to look up or update languages from command line."""
+    parser = argparse.ArgumentParser(description="Look up Wiktionary language codes and names")
+
+    parser.add_argument("languages", nargs="*", help="Language codes or names to look up")
+    parser.add_argument("--file", type=str, default=DEFAULT_LANGUAGES_FILE, help="Languages TSV file")
+    parser.add_argument("--update", action="store_true",
+                        help="Regenerate the file with every language Wiktionary knows")
+
+    args = parser.parse_args()
+
+    if args.update:
+        update_languages_file(args.file)
+
+    registry = LanguageRegistry(args.file)
+    for query in args.languages:
+        code = registry.resolve(query)
+        if code:
+            print(f"{code}\t{registry.name(code)}")
+        else:
+            print(f"Unknown language: {query}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Page Cache - Persistent on-disk cache of fetched Wiktionary pages
+
+Pages are stored gzip-compressed and content-addressed (by SHA-256 of the HTML),
+with a small JSON metadata record per (wiki language, title) holding the blob
+hash, ETag and Last-Modified. CachedFetcher sits in front of a fetcher backend
+and serves fresh entries from disk, revalidates stale ones with conditional
+requests, and can run fully offline.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from fetch_response import is_missing_entry
+
+
+class PageCache:
+    """Content-addressed, gzip-compressed store of Wiktionary pages."""
+
+    def __init__(self, cache_dir: str, wiki_lang: str = "en"):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache
+            wiki_lang: Language edition of Wiktionary the pages come from
+        """
+        self.cache_dir = cache_dir
+        self.wiki_lang = wiki_lang
+        self.blob_dir = os.path.join(cache_dir, "blobs")
+        self.meta_dir = os.path.join(cache_dir, "meta")
+        os.makedirs(self.blob_dir, exist_ok=True)
+        os.makedirs(self.meta_dir, exist_ok=True)
+
+    def _meta_path(self, title: str) -> str:
+        """Path of the metadata record for a title."""
+        key = hashlib.sha256(f"{self.wiki_lang}:{title}".encode("utf-8")).hexdigest()
+        return os.path.join(self.meta_dir, key[:2], f"{key}.json")
+
+    def _blob_path(self, digest: str) -> str:
+        """Path of the compressed page with the given content hash."""
+        return os.path.join(self.blob_dir, digest[:2], f"{digest}.html.gz")
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        """Write a file via a temporary file so readers never see partial data."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def get(self, title: str) -> Optional[Dict[str, Any]]:
+        """Get the metadata record for a title, or None if it was never cached."""
+        try:
+            with open(self._meta_path(title), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def read(self, entry: Dict[str, Any]) -> Optional[str]:
+        """Read the cached page for a metadata record (None for cached misses)."""
+        if not entry.get("sha256"):
+            return None
+        try:
+            with gzip.open(self._blob_path(entry["sha256"]), "rt", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, title: str, content: Optional[str], status: int = 200,
+            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Store a page (or a miss when content is None) and its validators."""
+        headers = headers or {}
+        digest = None
+        if content is not None:
+            data = content.encode("utf-8")
+            digest = hashlib.sha256(data).hexdigest()
+            blob_path = self._blob_path(digest)
+            if not os.path.exists(blob_path):
+                self._write_atomic(blob_path, gzip.compress(data))
+
+        entry = {
+            "title": title,
+            "status": status,
+            "sha256": digest,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "fetched_at": time.time(),
+        }
+        self._write_atomic(self._meta_path(title), json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+        return entry
+
+    def touch(self, title: str, entry: Dict[str, Any]):
+        """Mark a cached entry as freshly revalidated."""
+        entry = dict(entry, fetched_at=time.time())
+        self._write_atomic(self._meta_path(title), json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+
+
+class CachedFetcher:
+    """Fetcher that serves pages from a PageCache before going to the network."""
+
+    def __init__(self, fetcher, cache: PageCache, max_age: Optional[float] = None, offline: bool = False):
+        """Initialize the cached fetcher.
+
+        Args:
+            fetcher: Backend with fetch_response(word, headers) (curl or http wrapper)
+            cache: Page cache to read from and write to
+            max_age: Seconds a cached page is used without revalidation (None: always revalidate)
+            offline: Never touch the network; only serve cached pages
+        """
+        self.fetcher = fetcher
+        self.cache = cache
+        self.max_age = max_age
+        self.offline = offline
+
+    def __getattr__(self, name):
+        # Expose the backend's attributes (rate_limiter, close, ...) unchanged
+        if name == "fetcher":
+            raise AttributeError(name)
+        return getattr(self.fetcher, name)
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check whether an entry can be used without revalidation."""
+        return self.max_age is not None and time.time() - entry.get("fetched_at", 0) <= self.max_age
+
+    def fetch_page(self, word: str) -> Optional[str]:
+        """Fetch a Wiktionary page for a word, using the cache when possible.
+
+        Args:
+            word: The word to fetch from Wiktionary
+
+        Returns:
+            HTML content of the page or None if there is no entry
+        """
+        entry = self.cache.get(word)
+
+        if entry and (self.offline or self._is_fresh(entry)):
+            content = self.cache.read(entry)
+            return None if is_missing_entry(content) else content
+
+        if self.offline:
+            print(f"No cached page for {word} (offline)")
+            return None
+
+        headers = {}
+        if entry and entry.get("sha256"):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.fetcher.fetch_response(word, headers)
+        if response is None:
+            # Network failure: fall back to a stale copy if we have one
+            content = self.cache.read(entry) if entry else None
+            return None if is_missing_entry(content) else content
+
+        if response.status == 304 and entry:
+            self.cache.touch(word, entry)
+            content = self.cache.read(entry)
+            return None if is_missing_entry(content) else content
+
+        if response.status == 404 or (response.status < 400 and is_missing_entry(response.content)):
+            self.cache.put(word, None, 404, response.headers)
+            print(f"No entry found for {word}")
+            return None
+
+        if response.status >= 400:
+            # Still failing after retries: a stale copy beats nothing
+            print(f"HTTP error for {word}: {response.status}")
+            content = self.cache.read(entry) if entry else None
+            return None if is_missing_entry(content) else content
+
+        self.cache.put(word, response.content, response.status, response.headers)
+        return response.content
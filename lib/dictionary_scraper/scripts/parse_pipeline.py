@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Parse Pipeline - Decouple fetching Wiktionary pages from parsing them
+
+Fetched HTML is handed through a bounded queue to a pool of parser processes,
+each running its own WiktionaryScraper, so BeautifulSoup parsing and the
+_extract_* passes scale across cores instead of sharing the fetching thread.
+When timing metrics are enabled, each worker returns its per-page timings with
+the result and they are merged into the main process's collector.
+"""
+
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from scrape_metrics import metrics
+from wikitext_renderer import render_wikitext
+
+# Per-process scraper, created once by the pool initializer
+_worker_scraper = None
+
+_DONE = object()
+
+
+def _init_worker(lang_code: str, parser: str, collect_metrics: bool = False):
+    """Create the scraper used by this parser process."""
+    global _worker_scraper
+    from wiktionary_scraper import WiktionaryScraper
+    _worker_scraper = WiktionaryScraper(lang_code=lang_code, parser=parser)
+    metrics.reset(enabled=collect_metrics)
+
+
+def _parse_in_worker(word: str, html_content: str) -> Tuple[str, Dict[str, Any], List]:
+    """Parse one page inside a worker process, returning its timings too."""
+    with metrics.capture() as timings:
+        try:
+            return word, _worker_scraper.parse_page(word, html_content), timings
+        except Exception as e:
+            print(f"Error parsing '{word}': {str(e)}")
+            return word, {}, timings
+
+
+def _parse_wikitext_in_worker(word: str, wikitext: str) -> Tuple[str, Dict[str, Any], List]:
+    """Render and parse one page of wikitext inside a worker process."""
+    with metrics.capture() as timings:
+        try:
+            with metrics.timer("render_wikitext"):
+                html_content = render_wikitext(wikitext, word)
+            return word, _worker_scraper.parse_page(word, html_content), timings
+        except Exception as e:
+            print(f"Error parsing '{word}': {str(e)}")
+            return word, {}, timings
+
+
+def iter_html_dir(html_dir: str) -> Iterator[Tuple[str, str]]:
+    """Yield (word, html) pairs from a directory of saved pages.
+
+    Files are expected to be named "<word>.html" or "<word>_wiktionary.html".
+    """
+    for name in sorted(os.listdir(html_dir)):
+        if not name.endswith(".html"):
+            continue
+        word = name[:-len(".html")]
+        if word.endswith("_wiktionary"):
+            word = word[:-len("_wiktionary")]
+        with open(os.path.join(html_dir, name), "r", encoding="utf-8", errors="replace") as f:
+            yield word, f.read()
+
+
+class ParsePipeline:
+    """Producer/consumer pipeline with a process pool of page parsers."""
+
+    def __init__(self, lang_code: str = "es", workers: Optional[int] = None, queue_size: int = 64,
+                 parser: str = "html.parser"):
+        """Initialize the pipeline.
+
+        Args:
+            lang_code: The language code to extract
+            workers: Number of parser processes (default: CPU count)
+            queue_size: Maximum number of pages waiting to be parsed
+            parser: HTML parser backend used by the workers
+        """
+        self.lang_code = lang_code
+        self.parser = parser
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = max(queue_size, 1)
+
+    def parse_pages(self, pages: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Parse (word, html) pairs in parallel, yielding (word, word_data) in input order.
+
+        At most queue_size pages are submitted at once, so a fast producer
+        blocks instead of buffering the whole corpus in memory. Pages without
+        content yield an empty word_data.
+        """
+        return self._parse_all(pages, _parse_in_worker)
+
+    def parse_wikitext_pages(self, pages: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Render and parse (title, wikitext) pairs in parallel, like parse_pages."""
+        return self._parse_all(pages, _parse_wikitext_in_worker)
+
+    def _parse_all(self, pages: Iterable[Tuple[str, str]],
+                   parse: Callable[[str, str], Tuple[str, Dict[str, Any], List]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Run a worker parse function over pages with at most queue_size in flight."""
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.lang_code, self.parser, metrics.enabled)) as executor:
+            in_flight = deque()
+            for word, html_content in pages:
+                if len(in_flight) >= self.queue_size:
+                    yield self._result(in_flight.popleft())
+                if html_content:
+                    in_flight.append(executor.submit(parse, word, html_content))
+                else:
+                    in_flight.append((word, {}))
+
+            while in_flight:
+                yield self._result(in_flight.popleft())
+
+    @staticmethod
+    def _result(item) -> Tuple[str, Dict[str, Any]]:
+        """Resolve an in-flight entry: either a parse future or an already empty result."""
+        if isinstance(item, tuple):
+            return item
+        word, word_data, timings = item.result()
+        metrics.merge_timings(timings)
+        return word, word_data
+
+    def fetch_pages(self, fetcher, words: List[str], fetch_threads: int = 1) -> Iterator[Tuple[str, Optional[str]]]:
+        """Fetch pages on background threads, yielding (word, html) through a bounded queue.
+
+        Args:
+            fetcher: Object with a fetch_page(word) method (or fetch_batch(words))
+            words: Words to fetch
+            fetch_threads: Number of fetches to run concurrently
+        """
+        pages = queue.Queue(maxsize=self.queue_size)
+
+        def produce():
+            workers = max(fetch_threads, 1)
+            try:
+                if hasattr(fetcher, "fetch_batch"):
+                    # Batch fetcher: one request covers many words
+                    batch_size = getattr(fetcher, "batch_size", 50)
+                    for start in range(0, len(words), batch_size):
+                        batch = words[start:start + batch_size]
+                        fetched = fetcher.fetch_batch(batch)
+                        for word in batch:
+                            pages.put((word, fetched.get(word)))
+                    return
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # Submit fetches a few at a time so a slow consumer stalls the fetchers too
+                    in_flight = deque()
+                    for word in words:
+                        if len(in_flight) >= workers:
+                            done_word, future = in_flight.popleft()
+                            pages.put((done_word, future.result()))
+                        in_flight.append((word, executor.submit(fetcher.fetch_page, word)))
+                    while in_flight:
+                        done_word, future = in_flight.popleft()
+                        pages.put((done_word, future.result()))
+            except Exception as e:
+                print(f"Error fetching pages: {str(e)}")
+            finally:
+                pages.put(_DONE)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                break
+            yield item
+
+        producer.join()
+
+    def scrape_words(self, fetcher, words: List[str], fetch_threads: int = 1) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Fetch and parse words, overlapping network I/O with multi-process parsing."""
+        return self.parse_pages(self._logged(self.fetch_pages(fetcher, words, fetch_threads), len(words)))
+
+    @staticmethod
+    def _logged(pages: Iterator[Tuple[str, Optional[str]]], total: int) -> Iterator[Tuple[str, Optional[str]]]:
+        """Pass pages through while printing fetch progress."""
+        for i, (word, html_content) in enumerate(pages):
+            print(f"[{i+1}/{total}] Fetched '{word}'")
+            if not html_content:
+                print(f"Failed to retrieve page for '{word}'")
+            yield word, html_content
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter - Token bucket for throttling requests to Wiktionary
+
+A single TokenBucket can be shared by every fetcher thread or coroutine so the
+aggregate request rate stays within budget no matter how many requests are in
+flight at once. AdaptiveRateLimiter adjusts that budget from server feedback
+(additive increase on healthy responses, multiplicative decrease on 429/5xx),
+and backoff_delay gives the jittered exponential wait between retries.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket enforcing an aggregate requests-per-second budget."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (0 or less disables throttling)
+            capacity: Maximum number of tokens that can accumulate (burst size)
+        """
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_interval(cls, interval: float, capacity: float = 1.0) -> "TokenBucket":
+        """Create a bucket from a minimum interval between requests in seconds."""
+        return cls(1.0 / interval if interval > 0 else 0, capacity)
+
+    def pause(self, seconds: float):
+        """Hold back every request for a while (e.g. to honor a Retry-After header)."""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            paused = max(0.0, self.paused_until - now)
+            if self.rate <= 0:
+                return paused
+
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            # Tokens may go negative: each waiter reserves its own slot in the future
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return paused
+            return max(paused, -self.tokens / self.rate)
+
+    def acquire(self):
+        """Block until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """Token bucket whose rate follows server feedback (AIMD).
+
+    Every healthy response raises the rate by a fixed step up to max_rate;
+    a throttling response (429/5xx) or network failure cuts it by a factor,
+    at most once per cooldown so a burst of failures from requests already in
+    flight counts as a single congestion event.
+    """
+
+    def __init__(self, rate: float, min_rate: float = 0.1, max_rate: Optional[float] = None,
+                 increase: float = 0.05, decrease: float = 0.5, cooldown: float = 1.0,
+                 capacity: float = 1.0):
+        """Initialize the limiter.
+
+        Args:
+            rate: Starting requests per second
+            min_rate: Lowest rate a backoff can reach
+            max_rate: Highest rate to probe up to (default: 10x the starting rate)
+            increase: Requests per second added after each healthy response
+            decrease: Factor applied to the rate when the server pushes back
+            cooldown: Minimum seconds between two decreases
+            capacity: Maximum number of tokens that can accumulate (burst size)
+        """
+        super().__init__(rate, capacity)
+        self.min_rate = min(min_rate, rate) if rate > 0 else min_rate
+        self.max_rate = max_rate or max(rate * 10, self.min_rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self._last_decrease = 0.0
+
+    @classmethod
+    def from_interval(cls, interval: float, **kwargs) -> "AdaptiveRateLimiter":
+        """Create a limiter starting at a minimum interval between requests in seconds."""
+        return cls(1.0 / interval if interval > 0 else 0, **kwargs)
+
+    @property
+    def current_rate(self) -> float:
+        """Requests per second currently allowed."""
+        return self.rate
+
+    def record_success(self):
+        """Speed up a little after a healthy response."""
+        with self._lock:
+            if self.rate > 0:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def record_throttle(self):
+        """Slow down after the server pushed back or a request failed."""
+        with self._lock:
+            now = time.monotonic()
+            if self.rate > 0 and now - self._last_decrease >= self.cooldown:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._last_decrease = now
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Jittered exponential backoff: a random wait up to base * 2**attempt, capped.
+
+    Full jitter spreads retries from concurrent requests so they don't
+    hit the server again in lockstep.
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Result Writers - Output formats and checkpointing for scraped word data
+
+JsonResultWriter keeps the original behavior (one pretty-printed JSON object
+written at the end). JsonLinesResultWriter streams one word_data record per
+line and flushes after every word, so memory stays flat and a crashed run keeps
+everything scraped so far. GzipJsonLinesResultWriter writes the same records
+as a compact .jsonl.gz made of independent gzip members, with a side index of
+member offsets so single records can be read without decompressing the rest.
+ScrapeCheckpoint records which words were scraped or failed so a restarted run
+can skip them.
+"""
+
+import gzip
+import json
+import os
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+
+def _drop_partial_line(path: str):
+    """Truncate a half-written last record left behind by a crash."""
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        # Walk back to the last complete line
+        position = size - 1
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            f.seek(position)
+            chunk = f.read(step)
+            newline = chunk.rfind(b"\n")
+            if newline != -1:
+                f.truncate(position + newline + 1)
+                return
+        f.truncate(0)
+
+
+class JsonResultWriter:
+    """Collect results in memory and write them as one indented JSON object."""
+
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self.results: Dict[str, Any] = {}
+
+    def add(self, word: str, word_data: Dict[str, Any]):
+        """Add the data for one word."""
+        self.results[word] = word_data
+
+    def close(self) -> int:
+        """Write the output file and return the number of words written."""
+        with open(self.output_file, "w", encoding="utf-8") as f:
+            json.dump(self.results, f, ensure_ascii=False, indent=2)
+        return len(self.results)
+
+
+class JsonLinesResultWriter:
+    """Stream results as JSON Lines, one word_data record per line."""
+
+    def __init__(self, output_file: str, append: bool = False):
+        """Open the output file.
+
+        Args:
+            output_file: Path of the .jsonl file
+            append: Continue an existing file instead of overwriting it
+        """
+        self.output_file = output_file
+        self.count = 0
+        if append and os.path.exists(output_file):
+            _drop_partial_line(output_file)
+        self._file = open(output_file, "a" if append else "w", encoding="utf-8")
+
+    def add(self, word: str, word_data: Dict[str, Any]):
+        """Write the data for one word and flush it to disk."""
+        self._file.write(json.dumps(word_data, ensure_ascii=False))
+        self._file.write("\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self) -> int:
+        """Close the output file and return the number of words written by this run."""
+        self._file.close()
+        return self.count
+
+
+class GzipJsonLinesResultWriter:
+    """Write results as gzip-compressed JSON Lines with a random-access index.
+
+    Records are buffered and written as one gzip member per records_per_member
+    words. The concatenated members form a valid .gz file that any gzip reader
+    can stream. After each member, one line is added to "<output>.index" with
+    the member's byte offset, compressed length and the words it holds.
+    """
+
+    def __init__(self, output_file: str, append: bool = False, records_per_member: int = 64):
+        """Open the output file.
+
+        Args:
+            output_file: Path of the .jsonl.gz file
+            append: Continue an existing file instead of overwriting it
+            records_per_member: Number of records compressed together
+        """
+        self.output_file = output_file
+        self.index_file = f"{output_file}.index"
+        self.records_per_member = max(records_per_member, 1)
+        self.count = 0
+        self.stored_words: Set[str] = set()
+        self._lines: List[str] = []
+        self._words: List[str] = []
+
+        if append and os.path.exists(output_file):
+            if os.path.exists(self.index_file):
+                _drop_partial_line(self.index_file)
+                entries = list(_read_index(self.index_file))
+            else:
+                # Rebuild a lost index from the members themselves
+                entries = list(_scan_members(output_file))
+                with open(self.index_file, "w", encoding="utf-8") as f:
+                    for entry in entries:
+                        f.write(json.dumps(entry, ensure_ascii=False))
+                        f.write("\n")
+            end = 0
+            for entry in entries:
+                end = max(end, entry["offset"] + entry["length"])
+                self.stored_words.update(entry["words"])
+            # Drop a member whose index line never made it to disk
+            with open(output_file, "rb+") as f:
+                f.truncate(end)
+        else:
+            append = False
+
+        self._file = open(output_file, "ab" if append else "wb")
+        self._index = open(self.index_file, "a" if append else "w", encoding="utf-8")
+
+    def add(self, word: str, word_data: Dict[str, Any]):
+        """Buffer the data for one word, writing a member once enough are collected."""
+        self._lines.append(json.dumps(word_data, ensure_ascii=False))
+        self._words.append(word)
+        self.count += 1
+        if len(self._lines) >= self.records_per_member:
+            self._write_member()
+
+    def _write_member(self):
+        """Compress the buffered records into one gzip member and index it."""
+        if not self._lines:
+            return
+        data = gzip.compress(("\n".join(self._lines) + "\n").encode("utf-8"), mtime=0)
+        offset = self._file.tell()
+        self._file.write(data)
+        self._file.flush()
+        self._index.write(json.dumps({"offset": offset, "length": len(data), "words": self._words},
+                                     ensure_ascii=False))
+        self._index.write("\n")
+        self._index.flush()
+        self.stored_words.update(self._words)
+        self._lines = []
+        self._words = []
+
+    def close(self) -> int:
+        """Write any buffered records, close the files and return the number of words added by this run."""
+        self._write_member()
+        self._file.close()
+        self._index.close()
+        return self.count
+
+
+def _read_index(index_file: str) -> Iterator[Dict[str, Any]]:
+    """Read the member records of a .jsonl.gz index, skipping a partial last line."""
+    with open(index_file, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def _scan_members(output_file: str) -> Iterator[Dict[str, Any]]:
+    """Recover the index records of a .jsonl.gz by decompressing its members in turn.
+
+    Stops at the first member that is truncated or corrupt, so the records
+    cover only the complete members at the start of the file.
+    """
+    with open(output_file, "rb") as f:
+        offset = 0
+        pending = b""
+        while True:
+            decompressor = zlib.decompressobj(wbits=31)
+            parts = []
+            consumed = 0
+            try:
+                while not decompressor.eof:
+                    chunk = pending or f.read(1 << 16)
+                    pending = b""
+                    if not chunk:
+                        return
+                    parts.append(decompressor.decompress(chunk))
+                    consumed += len(chunk)
+                lines = b"".join(parts).decode("utf-8").splitlines()
+                words = [json.loads(line).get("text") for line in lines if line]
+            except (zlib.error, ValueError):
+                return
+            pending = decompressor.unused_data
+            length = consumed - len(pending)
+            yield {"offset": offset, "length": length, "words": words}
+            offset += length
+
+
+class GzipJsonLinesReader:
+    """Random access to single records of a .jsonl.gz written by GzipJsonLinesResultWriter."""
+
+    def __init__(self, output_file: str):
+        """Load the member index of an output file."""
+        self.output_file = output_file
+        self._locations: Dict[str, Tuple[int, int, int]] = {}
+        for entry in _read_index(f"{output_file}.index"):
+            for line, word in enumerate(entry["words"]):
+                self._locations[word] = (entry["offset"], entry["length"], line)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._locations
+
+    def words(self) -> List[str]:
+        """All words in the file, in the order they were written."""
+        return list(self._locations)
+
+    def get(self, word: str) -> Optional[Dict[str, Any]]:
+        """Read the record for one word, decompressing only the member that holds it."""
+        location = self._locations.get(word)
+        if location is None:
+            return None
+        offset, length, line = location
+        with open(self.output_file, "rb") as f:
+            f.seek(offset)
+            member = gzip.decompress(f.read(length))
+        return json.loads(member.decode("utf-8").split("\n")[line])
+
+
+def iter_results(output_file: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Stream (word, word_data) pairs from a .json, .jsonl or .jsonl.gz output file."""
+    if output_file.endswith(".json"):
+        with open(output_file, "r", encoding="utf-8") as f:
+            yield from json.load(f).items()
+        return
+
+    opener = gzip.open if output_file.endswith(".gz") else open
+    with opener(output_file, "rt", encoding="utf-8") as f:
+        for line in f:
+            try:
+                word_data = json.loads(line)
+            except ValueError:
+                # Partial line from an interrupted write
+                continue
+            yield word_data.get("text"), word_data
+
+
+class ScrapeCheckpoint:
+    """Append-only manifest of words already scraped or failed in a run."""
+
+    SCRAPED = "scraped"
+    FAILED = "failed"
+
+    def __init__(self, output_file: str):
+        """Open the checkpoint that belongs to an output file."""
+        self.path = f"{output_file}.checkpoint"
+        self.status: Dict[str, str] = {}
+        self._file = None
+
+    def load(self) -> Dict[str, str]:
+        """Read the words recorded by previous runs."""
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Partial line from an interrupted write
+                        continue
+                    self.status[record["word"]] = record["status"]
+        return self.status
+
+    def reset(self):
+        """Forget previous runs by removing the checkpoint file."""
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self.status = {}
+
+    def record(self, word: str, status: str):
+        """Record the outcome for a word and flush it to disk."""
+        if self._file is None:
+            if os.path.exists(self.path):
+                _drop_partial_line(self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps({"word": word, "status": status}, ensure_ascii=False))
+        self._file.write("\n")
+        self._file.flush()
+        self.status[word] = status
+
+    def close(self):
+        """Close the checkpoint file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+OUTPUT_FORMATS = ("json", "jsonl", "jsonl.gz")
+
+
+def output_format_for(output_file: str) -> str:
+    """Infer the output format from a file name."""
+    for output_format in ("jsonl.gz", "jsonl"):
+        if output_file.endswith(f".{output_format}"):
+            return output_format
+    return "json"
+
+
+def open_result_writer(output_file: str, output_format: Optional[str] = None, append: bool = False):
+    """Create the writer for an output format ("json", "jsonl" or "jsonl.gz", inferred from the file name if omitted)."""
+    output_format = output_format or output_format_for(output_file)
+    if output_format == "jsonl.gz":
+        return GzipJsonLinesResultWriter(output_file, append=append)
+    if output_format == "jsonl":
+        return JsonLinesResultWriter(output_file, append=append)
+    if output_format == "json":
+        return JsonResultWriter(output_file)
+    raise ValueError(f"Unknown output format '{output_format}'")
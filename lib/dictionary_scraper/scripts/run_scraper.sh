@@ -4,6 +4,7 @@
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" &> /dev/null && pwd )"
 DATA_DIR="$SCRIPT_DIR/../data"
 RESULTS_DIR="$DATA_DIR/results"
+CACHE_DIR="$DATA_DIR/page_cache"
 
 # Create directories if they don't exist
 mkdir -p "$DATA_DIR"
@@ -22,6 +23,9 @@ function show_usage() {
   echo "  --frequency N      Scrape top N frequent words"
   echo "  --wordclass CLASS  Filter by word class (e.g. verb, noun)"
   echo "  --combine          Combine all frequency sources"
+  echo "  --backend NAME     Fetcher backend: curl, http or api (default: curl)"
+  echo "                     api looks up revisions 50 words per request through the MediaWiki API"
+  echo "  --offline          Only use cached Wiktionary pages"
   echo "  --help             Show this help message"
 }
 
@@ -32,6 +36,8 @@ WORDCLASS=""
 ACTION=""
 WORD=""
 COMBINE=false
+BACKEND="curl"
+CACHE_ARGS=()
 
 # Parse command line arguments
 while [[ $# -gt 0 ]]; do
@@ -59,6 +65,14 @@ while [[ $# -gt 0 ]]; do
       ACTION="combine"
       shift
       ;;
+    --backend)
+      BACKEND="$2"
+      shift 2
+      ;;
+    --offline)
+      CACHE_ARGS+=(--offline)
+      shift
+      ;;
     --help)
       show_usage
       exit 0
@@ -135,12 +149,19 @@ fi
 echo "Step 2: Scraping Wiktionary data..."
 
 if [ "$ACTION" == "word" ]; then
-  python "$SCRIPT_DIR/wiktionary_scraper.py" --lang "$LANGUAGE" --word "$WORD" --output "$WIKTIONARY_OUTPUT"
+  python "$SCRIPT_DIR/wiktionary_scraper.py" --lang "$LANGUAGE" --word "$WORD" --output "$WIKTIONARY_OUTPUT" --backend "$BACKEND" --cache-dir "$CACHE_DIR" "${CACHE_ARGS[@]}"
   
   echo "Results saved to: $WIKTIONARY_OUTPUT"
 
 elif [ "$ACTION" == "frequency" ]; then
-  python "$SCRIPT_DIR/wiktionary_scraper.py" --lang "$LANGUAGE" --word-list "$FREQUENCY_OUTPUT" --output "$WIKTIONARY_OUTPUT" --rate-limit 1.5
+  # Rank words with the binary frequency index when one was written next to the list
+  FREQUENCY_INDEX="${FREQUENCY_OUTPUT%.txt}.idx"
+  INDEX_ARGS=()
+  if [ -f "$FREQUENCY_INDEX" ]; then
+    INDEX_ARGS=(--frequency-index "$FREQUENCY_INDEX")
+  fi
+  
+  python "$SCRIPT_DIR/wiktionary_scraper.py" --lang "$LANGUAGE" --word-list "$FREQUENCY_OUTPUT" --output "$WIKTIONARY_OUTPUT" --rate-limit 1.5 --backend "$BACKEND" --cache-dir "$CACHE_DIR" "${CACHE_ARGS[@]}" "${INDEX_ARGS[@]}"
   
   # Count results
   RESULT_COUNT=$(grep -o '"text":' "$WIKTIONARY_OUTPUT" | wc -l)
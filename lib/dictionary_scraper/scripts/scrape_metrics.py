@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Scrape Metrics - Timing instrumentation for the scraping pipeline
+
+Stages (fetch, rate-limit wait, parse, each extractor) record their durations
+into log-bucketed histograms on the process-wide `metrics` collector. The
+collector is disabled by default, in which case timers cost one attribute
+check. Parser processes collect their own timings per page and hand them back
+to the main process to merge. ProgressReporter prints a periodic progress line
+with throughput and ETA.
+"""
+
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+# Upper bounds (seconds) of the histogram buckets: 0.5 ms doubling up to ~65 s
+BUCKET_BOUNDS = [0.0005 * 2 ** i for i in range(18)]
+
+
+class Histogram:
+    """Log-bucketed histogram of durations in seconds."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)  # Last bucket catches everything slower
+
+    def add(self, seconds: float, count: int = 1):
+        """Record a duration."""
+        self.count += count
+        self.total += seconds * count
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+        for i, bound in enumerate(BUCKET_BOUNDS):
+            if seconds <= bound:
+                self.buckets[i] += count
+                return
+        self.buckets[-1] += count
+
+    def merge(self, other: "Histogram"):
+        """Add another histogram's samples to this one."""
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        for i, n in enumerate(other.buckets):
+            self.buckets[i] += n
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Approximate percentile (upper bound of the bucket holding it, capped at the max)."""
+        if not self.count:
+            return None
+        target = p / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target and n:
+                bound = BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary statistics plus the non-empty buckets."""
+        return {
+            "count": self.count,
+            "total": round(self.total, 6),
+            "mean": round(self.total / self.count, 6) if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": {
+                (f"<={BUCKET_BOUNDS[i]:g}" if i < len(BUCKET_BOUNDS) else "slower"): n
+                for i, n in enumerate(self.buckets) if n
+            },
+        }
+
+
+class ScrapeMetrics:
+    """Thread-safe collection of per-stage duration histograms."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.started = time.monotonic()
+        self.stages: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._capture = threading.local()
+
+    def reset(self, enabled: Optional[bool] = None):
+        """Forget everything recorded so far (and optionally switch collection on or off)."""
+        with self._lock:
+            if enabled is not None:
+                self.enabled = enabled
+            self.started = time.monotonic()
+            self.stages = {}
+            self.counters = {}
+
+    def record(self, stage: str, seconds: float):
+        """Record one duration for a stage."""
+        captured = getattr(self._capture, "timings", None)
+        if captured is not None:
+            captured.append((stage, seconds))
+            return
+        with self._lock:
+            histogram = self.stages.get(stage)
+            if histogram is None:
+                histogram = self.stages[stage] = Histogram()
+            histogram.add(seconds)
+
+    def increment(self, counter: str, amount: int = 1):
+        """Bump a named counter (e.g. words scraped or failed)."""
+        if self.enabled:
+            with self._lock:
+                self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    @contextmanager
+    def timer(self, stage: str):
+        """Time the enclosed block as one sample of a stage."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    @contextmanager
+    def capture(self):
+        """Collect this thread's timings into a list instead of the histograms.
+
+        Used in parser processes, whose timings travel back with each result.
+        """
+        timings: List = []
+        self._capture.timings = timings
+        try:
+            yield timings
+        finally:
+            self._capture.timings = None
+
+    def merge_timings(self, timings: List):
+        """Add (stage, seconds) pairs captured elsewhere."""
+        for stage, seconds in timings:
+            self.record(stage, seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        """Machine-readable summary of everything recorded."""
+        with self._lock:
+            elapsed = time.monotonic() - self.started
+            return {
+                "elapsed_seconds": round(elapsed, 3),
+                "counters": dict(self.counters),
+                "stages": {name: histogram.to_dict() for name, histogram in sorted(self.stages.items())},
+            }
+
+    def write_summary(self, path: str):
+        """Write the summary as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+        print(f"Timing summary saved to {path}")
+
+
+# Process-wide collector used by the fetchers, the scraper and parser workers
+metrics = ScrapeMetrics()
+
+
+def timed(stage: Optional[str] = None):
+    """Decorator recording each call of a function as a sample of a stage (default: its name)."""
+    def decorator(func):
+        name = stage or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class ProgressReporter:
+    """Print "[done/total] rate, ETA" at most once per interval."""
+
+    def __init__(self, total: int, interval: float = 10.0):
+        """Initialize the reporter.
+
+        Args:
+            total: Number of words expected
+            interval: Minimum seconds between two progress lines
+        """
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.started = time.monotonic()
+        self._last = self.started
+        self._lock = threading.Lock()
+
+    def update(self, count: int = 1, extra: str = ""):
+        """Count finished words, printing a progress line when the interval has passed."""
+        with self._lock:
+            self.done += count
+            now = time.monotonic()
+            if now - self._last < self.interval and self.done < self.total:
+                return
+            self._last = now
+            elapsed = now - self.started
+            rate = self.done / elapsed if elapsed > 0 else 0.0
+            remaining = (self.total - self.done) / rate if rate > 0 else 0.0
+            eta = time.strftime("%H:%M:%S", time.gmtime(remaining))
+            print(f"Progress: {self.done}/{self.total} words, {rate:.2f} words/s, ETA {eta}{extra}")
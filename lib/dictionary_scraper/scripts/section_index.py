@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Section Index - Single-pass index over one language section of a Wiktionary page
+
+WiktionaryScraper builds one SectionIndex per page from the nodes between the
+target language's h2 and the next h2. Headings, their headline text, the part
+of speech in effect and the position of every element are recorded in a single
+walk, so the _extract_* methods look sections up instead of re-scanning the
+content and re-running find() on every heading.
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Heading levels that delimit subsections within a language section
+SECTION_TAGS = ("h3", "h4")
+
+# Headings that never name a part of speech
+NON_POS_HEADINGS = ("pronunciation", "etymology")
+
+
+class Section:
+    """A subsection heading and the nodes that follow it."""
+
+    __slots__ = ("level", "element", "title", "position", "nodes", "pos")
+
+    def __init__(self, level: str, element, title: Optional[str], position: int, pos: Optional[str]):
+        self.level = level  # Heading tag name ("h3" or "h4")
+        self.element = element  # The heading element itself
+        self.title = title  # Headline text, or None if the heading has no headline span
+        self.position = position  # Index of the heading in SectionIndex.nodes
+        self.nodes: List[Any] = []  # Nodes up to the next h3/h4
+        self.pos = pos  # Part of speech in effect under this heading
+
+    @property
+    def text(self) -> str:
+        """Full lower-cased text of the heading element."""
+        return self.element.get_text().lower()
+
+
+class SectionIndex:
+    """Index of the headings and elements in one language section."""
+
+    def __init__(self, nodes: List[Any]):
+        """Build the index in a single walk over the language section.
+
+        Args:
+            nodes: Tag nodes between the language h2 and the next h2
+        """
+        self.nodes = nodes
+        self.sections: List[Section] = []
+        self._positions: Dict[str, List[int]] = {}
+        self._pos_at: List[Optional[str]] = []
+
+        current_pos = None
+        current_section = None
+        for position, elem in enumerate(nodes):
+            self._positions.setdefault(elem.name, []).append(position)
+
+            if elem.name in SECTION_TAGS:
+                headline = elem.find("span", {"class": "mw-headline"})
+                title = headline.text if headline else None
+                if title is not None and title.lower() not in NON_POS_HEADINGS:
+                    current_pos = title.lower()
+                current_section = Section(elem.name, elem, title, position, current_pos)
+                self.sections.append(current_section)
+            elif current_section is not None:
+                current_section.nodes.append(elem)
+
+            self._pos_at.append(current_pos)
+
+    def headings(self, level: Optional[str] = None, title: Optional[str] = None) -> Iterator[Section]:
+        """Iterate over sections, optionally filtered by heading level and exact title."""
+        for section in self.sections:
+            if level and section.level != level:
+                continue
+            if title is not None and section.title != title:
+                continue
+            yield section
+
+    def elements(self, *names: str) -> List[Any]:
+        """All nodes with one of the given tag names, in document order."""
+        positions = []
+        for name in names:
+            positions.extend(self._positions.get(name, ()))
+        if len(names) > 1:
+            positions.sort()
+        return [self.nodes[position] for position in positions]
+
+    def elements_with_pos(self, name: str) -> List[Tuple[Optional[str], Any]]:
+        """Nodes with the given tag name paired with the part of speech in effect."""
+        return [(self._pos_at[position], self.nodes[position]) for position in self._positions.get(name, ())]
+
+    def first_after(self, section: Section, name: str) -> Optional[Any]:
+        """First node with the given tag name after a section heading."""
+        positions = self._positions.get(name, [])
+        i = bisect_right(positions, section.position)
+        return self.nodes[positions[i]] if i < len(positions) else None
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Text Normalization - Precompiled patterns and lookup tables for the extractors
+
+Everything the extractors run once per heading, list item or definition lives
+here as module-level constants, compiled or built once at import: whitespace
+and parenthetical cleanup, the part-of-speech table and the usage-label matcher
+(all labels in one combined regex, a single scan per text instead of one
+substring search per label).
+"""
+
+import re
+from types import MappingProxyType
+from typing import Optional, Set
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+PARENTHETICAL_PATTERN = re.compile(r'\([^)]*\)')
+IPA_DELIMITER_PATTERN = re.compile(r'[/\[\]]')
+
+# Wiktionary part of speech headings -> our standardized categories
+POS_MAPPING = MappingProxyType({
+    "noun": "noun",
+    "verb": "verb",
+    "adjective": "adjective",
+    "adverb": "adverb",
+    "pronoun": "pronoun",
+    "preposition": "preposition",
+    "conjunction": "conjunction",
+    "interjection": "interjection",
+    "article": "article",
+    "numeral": "numeral",
+})
+# Longest names first, so "adverb" and "pronoun" are not reported as "verb" and "noun"
+POS_PATTERN = re.compile("|".join(sorted(POS_MAPPING, key=len, reverse=True)))
+
+# Usage and register labels recognized in usage notes and definitions
+TAG_LABELS = ("formal", "informal", "colloquial", "slang", "archaic", "literary",
+              "regional", "technical", "vulgar", "offensive")
+_TAG_ALTERNATION = "|".join(TAG_LABELS)
+# Zero-width lookahead so overlapping labels are all found ("informal" also contains "formal")
+TAG_PATTERN = re.compile(f"(?=({_TAG_ALTERNATION}))")
+# Labels written as a parenthesized qualifier, e.g. "(colloquial)"
+TAG_LABEL_PATTERN = re.compile(rf"\(({_TAG_ALTERNATION})\)")
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of whitespace into single spaces."""
+    return WHITESPACE_PATTERN.sub(' ', text)
+
+
+def clean_definition(text: str) -> str:
+    """Drop parenthetical qualifiers from a definition and normalize its whitespace."""
+    return WHITESPACE_PATTERN.sub(' ', PARENTHETICAL_PATTERN.sub('', text))
+
+
+def strip_ipa_delimiters(text: str) -> str:
+    """Remove the slashes and brackets around an IPA transcription."""
+    return IPA_DELIMITER_PATTERN.sub('', text)
+
+
+def standard_pos(heading: str) -> Optional[str]:
+    """Standardized part of speech named in a (lowercase) heading, or None."""
+    match = POS_PATTERN.search(heading)
+    return POS_MAPPING[match.group()] if match else None
+
+
+def find_tags(text: str) -> Set[str]:
+    """Usage labels mentioned anywhere in a (lowercase) text."""
+    return set(TAG_PATTERN.findall(text))
+
+
+def find_tag_labels(text: str) -> Set[str]:
+    """Usage labels given as parenthesized qualifiers in a (lowercase) text."""
+    return set(TAG_LABEL_PATTERN.findall(text))
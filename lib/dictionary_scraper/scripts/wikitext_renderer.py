@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Wikitext Renderer - Turn Wiktionary wikitext into the HTML the extractors expect
+
+Wiktionary dumps hold raw wikitext, but WiktionaryScraper's extractors work on
+rendered HTML. This renderer covers the subset of markup and templates that
+the extractors look at: headings with mw-headline spans, definition/example/
+bullet lists, paragraphs, links, pronunciation, labels, usage examples, column
+lists and translation tables.
+
+Templates whose output is computed by Lua modules (conjugation/declension
+tables, automatic pronunciation such as {{es-pr}}) cannot be reproduced and
+are dropped, so entries rendered here lack word forms and, unless the page
+also uses a plain {{IPA}}, IPA transcriptions. The names of the dropped
+templates are listed in an "unrendered-templates" meta tag at the end of the
+output, from which WiktionaryScraper.parse_page reports the missing fields.
+"""
+
+import html
+import re
+from typing import List, Set, Tuple
+
+HEADING_PATTERN = re.compile(r"^(={2,6})\s*(.+?)\s*\1\s*$")
+LIST_PATTERN = re.compile(r"^([*#:;]+)\s*(.*)$")
+COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.DOTALL)
+REF_PATTERN = re.compile(r"<ref[^>/]*/>|<ref[^>]*>.*?</ref>", re.DOTALL | re.IGNORECASE)
+HTML_TAG_PATTERN = re.compile(r"</?[a-zA-Z][^>]*>")
+LINK_PATTERN = re.compile(r"\[\[([^\[\]|]*)(?:\|([^\[\]]*))?\]\]")
+EXTERNAL_LINK_PATTERN = re.compile(r"\[(?:https?:)?//[^\s\]]+(?:\s+([^\]]*))?\]")
+BOLD_PATTERN = re.compile(r"'''(.+?)'''")
+ITALIC_PATTERN = re.compile(r"''(.+?)''")
+# Private-use characters mark where rendered fragments are held during inline rendering
+PLACEHOLDER_PATTERN = re.compile("\\ue000(\\d+)\\ue001")
+ANCHOR_TAG_PATTERN = re.compile(r"<[^>]+>")
+NAMED_PARAM_PATTERN = re.compile(r"^\s*([\w-]+)\s*=(.*)$", re.DOTALL)
+# Link targets outside the main namespace (categories, files, interwiki, ...)
+NAMESPACED_LINK_PATTERN = re.compile(r"^(Category|File|Image|Thesaurus|Appendix|Wiktionary|[a-z]{2,3}):")
+TRANSLATIONS_START_PATTERN = re.compile(r"^\{\{(check)?trans-top")
+TRANSLATIONS_BREAK_PATTERN = re.compile(r"^\{\{(trans-(bottom|mid)|multitrans\|data=)")
+
+# Column list templates rendered as bullet lists ({{col3|es|a|b}}, {{der3|es|...}})
+COLUMN_TEMPLATE_PATTERN = re.compile(r"^(col(\d|-auto|-u)?|(der|rel)\d)$")
+# Headword-line templates rendered as the bold page title ({{es-verb}}, {{head|es|noun}})
+HEAD_TEMPLATE_PATTERN = re.compile(r"^(head|[a-z]{2,3}-(verb|noun|adj|adv|pron|prep|intj|num|det|art|proper noun))\b")
+# Templates that generate tables or computed content we cannot reproduce
+UNRENDERED_TEMPLATE_PATTERN = re.compile(r"-(conj|decl|infl|pr|IPA)\b")
+# Layout templates with no content of their own
+LAYOUT_TEMPLATE_PATTERN = re.compile(r"^(trans-|der-|rel-|col-)(top|mid|bottom)$")
+
+LINK_TEMPLATES = {"l", "l-self", "ll", "m", "m-self", "link", "mention"}
+TRANSLATION_TEMPLATES = {"t", "t+", "tt", "tt+", "t-simple", "t-check", "t+check"}
+LABEL_TEMPLATES = {"lb", "lbl", "label", "context", "cx"}
+QUALIFIER_TEMPLATES = {"i", "q", "qual", "qualifier", "gloss", "gl", "sense", "s"}
+USAGE_EXAMPLE_TEMPLATES = {"ux", "uxi", "usex", "eg"}
+NYM_TEMPLATES = {"syn": "Synonyms", "synonyms": "Synonyms", "ant": "Antonyms", "antonyms": "Antonyms"}
+ETYMOLOGY_TEMPLATES = {"inh", "inh+", "der", "der+", "bor", "bor+", "lbor", "cog", "noncog", "calque", "uder"}
+
+
+def _split_template(inner: str) -> List[str]:
+    """Split template contents on top-level pipes (ignoring nested templates and links)."""
+    parts = []
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(inner):
+        pair = inner[i:i + 2]
+        if pair in ("{{", "[["):
+            depth += 1
+            i += 2
+        elif pair in ("}}", "]]") and depth:
+            depth -= 1
+            i += 2
+        elif inner[i] == "|" and depth == 0:
+            parts.append(inner[start:i])
+            start = i + 1
+            i += 1
+        else:
+            i += 1
+    parts.append(inner[start:])
+    return parts
+
+
+def _positional(params: List[str]) -> List[str]:
+    """Positional (unnamed) template parameters."""
+    return [p.strip() for p in params if not NAMED_PARAM_PATTERN.match(p)]
+
+
+def _named(params: List[str]) -> dict:
+    """Named template parameters."""
+    named = {}
+    for p in params:
+        match = NAMED_PARAM_PATTERN.match(p)
+        if match:
+            named[match.group(1)] = match.group(2).strip()
+    return named
+
+
+def _find_templates(text: str) -> List[Tuple[int, int]]:
+    """Spans of top-level {{...}} templates in text."""
+    spans = []
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(text):
+        if text.startswith("{{", i):
+            if depth == 0:
+                start = i
+            depth += 1
+            i += 2
+        elif text.startswith("}}", i) and depth:
+            depth -= 1
+            i += 2
+            if depth == 0:
+                spans.append((start, i))
+        else:
+            i += 1
+    return spans
+
+
+class WikitextRenderer:
+    """Render one page of Wiktionary wikitext to simplified MediaWiki HTML."""
+
+    def __init__(self, title: str):
+        """Initialize the renderer.
+
+        Args:
+            title: Page title (used for headword lines)
+        """
+        self.title = title
+        # Names of the computed templates dropped while rendering
+        self.unrendered: Set[str] = set()
+
+    # Inline markup
+
+    def render_inline(self, text: str) -> str:
+        """Render templates, links and bold/italic within a line of text."""
+        fragments: List[str] = []
+
+        def hold(markup: str) -> str:
+            fragments.append(markup)
+            return f"\ue000{len(fragments) - 1}\ue001"
+
+        # Templates first (outermost only; they render their own parameters)
+        spans = _find_templates(text)
+        if spans:
+            pieces = []
+            last = 0
+            for start, end in spans:
+                pieces.append(text[last:start])
+                pieces.append(hold(self._render_template(text[start + 2:end - 2])))
+                last = end
+            pieces.append(text[last:])
+            text = "".join(pieces)
+
+        text = LINK_PATTERN.sub(lambda m: hold(self._render_link(m.group(1), m.group(2))), text)
+        text = EXTERNAL_LINK_PATTERN.sub(lambda m: m.group(1) or "", text)
+        text = HTML_TAG_PATTERN.sub("", text)
+        text = html.escape(text, quote=False)
+        text = BOLD_PATTERN.sub(r"<b>\1</b>", text)
+        text = ITALIC_PATTERN.sub(r"<i>\1</i>", text)
+
+        # Restore held fragments (they may nest placeholders of their own)
+        while PLACEHOLDER_PATTERN.search(text):
+            text = PLACEHOLDER_PATTERN.sub(lambda m: fragments[int(m.group(1))], text)
+        return text
+
+    def _render_link(self, target: str, label: str) -> str:
+        """Render an internal link, dropping categories, files and interwiki links."""
+        target = target.strip()
+        if NAMESPACED_LINK_PATTERN.match(target) and label is None:
+            if target.startswith("Thesaurus:"):
+                return f"<a>{html.escape(target, quote=False)}</a>"
+            return ""
+        text = label if label is not None else target.split("#")[0]
+        return f"<a>{self.render_inline(text)}</a>"
+
+    def _render_template(self, inner: str) -> str:
+        """Render a single template from its contents (without braces)."""
+        params = _split_template(inner)
+        name = params[0].strip()
+        args = params[1:]
+        positional = _positional(args)
+        named = _named(args)
+
+        if UNRENDERED_TEMPLATE_PATTERN.search(name):
+            self.unrendered.add(name)
+            return ""
+        if LAYOUT_TEMPLATE_PATTERN.search(name):
+            return ""
+
+        if name == "IPA":
+            # {{IPA|es|/aˈbeɾ/|[aˈβ̞eɾ]}}
+            spans = [f'<span class="IPA">{html.escape(p, quote=False)}</span>' for p in positional[1:] if p]
+            return "IPA: " + ", ".join(spans) if spans else ""
+
+        if name in LINK_TEMPLATES:
+            # {{l|es|word|alt text}}
+            if len(positional) < 2:
+                return ""
+            text = positional[2] if len(positional) > 2 and positional[2] else positional[1]
+            return f"<a>{self.render_inline(text)}</a>"
+
+        if name in TRANSLATION_TEMPLATES:
+            # {{t+|de|haben|n}}
+            if len(positional) < 2:
+                return ""
+            lang = html.escape(positional[0])
+            text = named.get("alt") or positional[1]
+            return f'<span lang="{lang}">{self.render_inline(text)}</span>'
+
+        if name in LABEL_TEMPLATES:
+            # {{lb|es|formal|archaic}}
+            labels = [p for p in positional[1:] if p and p not in ("_", "and", "or")]
+            return f"({self.render_inline(', '.join(labels))})" if labels else ""
+
+        if name in QUALIFIER_TEMPLATES:
+            labels = [p for p in positional if p]
+            return f"({self.render_inline(', '.join(labels))})" if labels else ""
+
+        if name in USAGE_EXAMPLE_TEMPLATES:
+            # {{ux|es|Hay un gato.|There is a cat.}}
+            if len(positional) < 2:
+                return ""
+            text = self.render_inline(positional[1])
+            translation = named.get("t") or named.get("translation") or (positional[2] if len(positional) > 2 else "")
+            if translation:
+                text += " ― " + self.render_inline(translation)
+            return text
+
+        if name in NYM_TEMPLATES:
+            # {{syn|es|tener|poseer}}
+            words = [f"<a>{self.render_inline(p)}</a>" for p in positional[1:] if p]
+            return f"{NYM_TEMPLATES[name]}: " + ", ".join(words) if words else ""
+
+        if name in ETYMOLOGY_TEMPLATES:
+            # {{inh|es|la|habeō}}: render the source term
+            term_index = 1 if name in ("cog", "noncog") else 2
+            if len(positional) > term_index + 1 and positional[term_index + 1]:
+                return f"<i>{self.render_inline(positional[term_index + 1])}</i>"
+            if len(positional) > term_index and positional[term_index]:
+                return f"<i>{self.render_inline(positional[term_index])}</i>"
+            return ""
+
+        if HEAD_TEMPLATE_PATTERN.match(name):
+            return f"<b>{html.escape(named.get('head') or self.title, quote=False)}</b>"
+
+        if name in ("w", "pedia", "wikipedia"):
+            return self.render_inline(positional[1] if len(positional) > 1 else (positional[0] if positional else ""))
+
+        return ""
+
+    # Block structure
+
+    def _column_list(self, line: str) -> str:
+        """Render a whole-line column template ({{col3|es|a|b}}) as a bullet list, or "" if not one."""
+        spans = _find_templates(line)
+        if len(spans) != 1 or spans[0] != (0, len(line)):
+            return ""
+        params = _split_template(line[2:-2])
+        if not COLUMN_TEMPLATE_PATTERN.match(params[0].strip()):
+            return ""
+        items = [p for p in _positional(params[1:])[1:] if p]
+        return "<ul>" + "".join(f"<li><a>{self.render_inline(p)}</a></li>" for p in items) + "</ul>"
+
+    def render(self, wikitext: str) -> str:
+        """Render a full page of wikitext."""
+        wikitext = COMMENT_PATTERN.sub("", wikitext)
+        wikitext = REF_PATTERN.sub("", wikitext)
+
+        out: List[str] = ['<div class="mw-parser-output">']
+        paragraph: List[str] = []
+        list_stack: List[str] = []  # Open list prefix characters
+        in_translations = False
+
+        def close_paragraph():
+            if paragraph:
+                out.append("<p>" + " ".join(paragraph) + "</p>")
+                paragraph.clear()
+
+        def close_lists(depth=0):
+            while len(list_stack) > depth:
+                char = list_stack.pop()
+                out.append(self._item_close(char) + self._list_close(char))
+
+        for raw_line in wikitext.split("\n"):
+            line = raw_line.strip()
+
+            # Translation tables
+            if TRANSLATIONS_START_PATTERN.match(line):
+                close_paragraph()
+                close_lists()
+                out.append('<div class="translations">')
+                in_translations = True
+                continue
+            if TRANSLATIONS_BREAK_PATTERN.match(line) or \
+               (in_translations and line == "}}"):
+                close_lists()
+                if line.startswith("{{trans-bottom"):
+                    out.append("</div>")
+                    in_translations = False
+                continue
+
+            heading = HEADING_PATTERN.match(line)
+            if heading:
+                close_paragraph()
+                close_lists()
+                level = len(heading.group(1))
+                title = self.render_inline(heading.group(2))
+                anchor = html.escape(ANCHOR_TAG_PATTERN.sub("", title).replace(" ", "_"))
+                out.append(f'<h{level}><span class="mw-headline" id="{anchor}">{title}</span></h{level}>')
+                continue
+
+            if not line:
+                close_paragraph()
+                close_lists()
+                continue
+
+            column_list = self._column_list(line)
+            if column_list:
+                close_paragraph()
+                close_lists()
+                out.append(column_list)
+                continue
+
+            list_item = LIST_PATTERN.match(line)
+            if list_item:
+                close_paragraph()
+                prefix, text = list_item.groups()
+                opening = self._open_item(out, list_stack, prefix)
+                if in_translations and ":" in text:
+                    # "* German: {{t+|de|haben}}"
+                    language, _, rest = text.partition(":")
+                    out.append(f'{opening}<a class="language">{html.escape(language.strip())}</a>: '
+                               f"{self.render_inline(rest.strip())}")
+                else:
+                    out.append(opening + self.render_inline(text))
+                continue
+
+            close_lists()
+            rendered = self.render_inline(line)
+            if rendered.strip():
+                paragraph.append(rendered)
+
+        close_paragraph()
+        close_lists()
+        if in_translations:
+            out.append("</div>")
+        out.append("</div>")
+        if self.unrendered:
+            names = html.escape(",".join(sorted(self.unrendered)))
+            out.append(f'<meta name="unrendered-templates" content="{names}">')
+        return "\n".join(out)
+
+    @staticmethod
+    def _list_open(char: str) -> str:
+        return {"*": "<ul>", "#": "<ol>", ":": "<dl>", ";": "<dl>"}[char]
+
+    @staticmethod
+    def _list_close(char: str) -> str:
+        return {"*": "</ul>", "#": "</ol>", ":": "</dl>", ";": "</dl>"}[char]
+
+    @staticmethod
+    def _item_open(char: str) -> str:
+        return {"*": "<li>", "#": "<li>", ":": "<dd>", ";": "<dt>"}[char]
+
+    @staticmethod
+    def _item_close(char: str) -> str:
+        return {"*": "</li>", "#": "</li>", ":": "</dd>", ";": "</dt>"}[char]
+
+    def _open_item(self, out: List[str], list_stack: List[str], prefix: str) -> str:
+        """Adjust the open lists to a line's prefix, returning the markup that opens its item.
+
+        Lists deeper than the prefix are closed into out, mirroring MediaWiki's nesting.
+        """
+        common = 0
+        while common < len(list_stack) and common < len(prefix) and \
+                self._list_open(list_stack[common]) == self._list_open(prefix[common]):
+            common += 1
+
+        # Close lists deeper than the shared prefix
+        while len(list_stack) > common:
+            char = list_stack.pop()
+            out.append(self._item_close(char) + self._list_close(char))
+
+        if common == len(prefix) and common:
+            # Same depth: new sibling item
+            char = list_stack[-1]
+            list_stack[-1] = prefix[-1]
+            return self._item_close(char) + self._item_open(prefix[-1])
+
+        opening = ""
+        for char in prefix[common:]:
+            opening += self._list_open(char) + self._item_open(char)
+            list_stack.append(char)
+        return opening
+
+
+def render_wikitext(wikitext: str, title: str) -> str:
+    """Render a page of Wiktionary wikitext to HTML."""
+    return WikitextRenderer(title).render(wikitext)
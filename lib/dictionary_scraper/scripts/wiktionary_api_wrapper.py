@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Wiktionary API Wrapper - Batch page fetching through the MediaWiki Action API
+
+Instead of downloading one skinned HTML page per word, this backend asks
+api.php for the revisions of up to 50 titles per request (following
+continuation) and maps normalized and redirected titles back to the input
+words. Each page found is then rendered by Wiktionary itself (action=parse of
+that exact revision), once per distinct page, so the HTML holds everything
+the article does, conjugation tables and computed pronunciations included,
+and runs through the same extractors as the other backends.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+from fetch_response import FetchResponse, fetch_with_retries
+from wiktionary_http_wrapper import WiktionaryHttpWrapper
+
+
+class WiktionaryApiWrapper(WiktionaryHttpWrapper):
+    """Fetch many Wiktionary pages per request via action=query."""
+
+    API_PATH = "/w/api.php"
+    MAX_BATCH_SIZE = 50  # Title limit per query for regular clients
+
+    def __init__(self, rate_limit: float = 1.0, user_agent: Optional[str] = None,
+                 base_url: Optional[str] = None, batch_size: int = MAX_BATCH_SIZE, **kwargs):
+        """Initialize the wrapper.
+
+        Args:
+            rate_limit: Time in seconds to wait between API requests
+            user_agent: Custom user agent string (optional)
+            base_url: Wiktionary server to talk to (default: en.wiktionary.org)
+            batch_size: Number of titles per API request (at most 50)
+            **kwargs: Passed on to WiktionaryHttpWrapper (max_connections, timeout, rate_limiter,
+                max_retries)
+        """
+        super().__init__(rate_limit=rate_limit, user_agent=user_agent, base_url=base_url, **kwargs)
+        self.batch_size = max(1, min(batch_size, self.MAX_BATCH_SIZE))
+
+    def _api_get(self, params: Dict[str, str]) -> Dict[str, Any]:
+        """Perform one rate-limited API request (with retries) and decode the JSON response."""
+        url = f"{self.base_url}{self.API_PATH}?{urlencode(params)}"
+
+        def send():
+            status, headers, body = self._request(url)
+            return FetchResponse(status, headers, body.decode("utf-8", errors="replace"), url)
+
+        response = fetch_with_retries(send, self.rate_limiter, self.max_retries, "API request")
+        if response is None:
+            raise IOError("API request failed")
+        if response.status >= 400:
+            raise IOError(f"API request failed with HTTP {response.status}")
+        data = json.loads(response.content)
+        if "error" in data:
+            raise IOError(f"API error: {data['error'].get('info', data['error'])}")
+        return data
+
+    def query_pages(self, titles: List[str], content: bool = True) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Look up the current revision of many pages.
+
+        Args:
+            titles: Page titles (words) to look up
+            content: Also download the wikitext (False only fetches revision metadata)
+
+        Returns:
+            Dictionary mapping each input title to a page record with "title"
+            (canonical title after normalization and redirects), "wikitext"
+            (None when content is False), "revid" and "timestamp", or None if
+            the page does not exist
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        for start in range(0, len(titles), self.batch_size):
+            batch = titles[start:start + self.batch_size]
+            try:
+                results.update(self._query_batch(batch, content))
+            except Exception as e:
+                print(f"Error fetching batch starting at '{batch[0]}': {str(e)}")
+                for title in batch:
+                    results.setdefault(title, None)
+        return results
+
+    def resolve_titles(self, titles: List[str]) -> Dict[str, Optional[str]]:
+        """Resolve many titles to the canonical title of their page (metadata only).
+
+        Args:
+            titles: Page titles (words) to resolve
+
+        Returns:
+            Dictionary mapping each input title to the title of the page it
+            normalizes or redirects to, or None if there is no such page;
+            titles in batches that failed are left out
+        """
+        results: Dict[str, Optional[str]] = {}
+        for start in range(0, len(titles), self.batch_size):
+            batch = titles[start:start + self.batch_size]
+            try:
+                records = self._query_batch(batch, content=False)
+            except Exception as e:
+                print(f"Error resolving batch starting at '{batch[0]}': {str(e)}")
+                continue
+            for title, record in records.items():
+                results[title] = record["title"] if record else None
+        return results
+
+    def _query_batch(self, titles: List[str], content: bool = True) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Query one batch of titles, following continuation until complete."""
+        params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": "2",
+            "prop": "revisions",
+            "rvprop": "ids|timestamp|content" if content else "ids|timestamp",
+            "rvslots": "main",
+            "redirects": "1",
+            "titles": "|".join(titles),
+        }
+
+        aliases: Dict[str, str] = {}
+        pages: Dict[str, Dict[str, Any]] = {}
+        missing = set()
+        continuation: Dict[str, str] = {}
+
+        while True:
+            data = self._api_get({**params, **continuation})
+            query = data.get("query", {})
+
+            # Title normalization ("a_b" -> "a b") and redirects, applied in that order
+            for mapping in query.get("normalized", []) + query.get("redirects", []):
+                aliases[mapping["from"]] = mapping["to"]
+
+            for page in query.get("pages", []):
+                title = page["title"]
+                if page.get("missing") or page.get("invalid"):
+                    missing.add(title)
+                    continue
+                record = pages.setdefault(title, {"title": title, "wikitext": None, "revid": None, "timestamp": None})
+                revisions = page.get("revisions") or []
+                if revisions:
+                    revision = revisions[0]
+                    record["revid"] = revision.get("revid")
+                    record["timestamp"] = revision.get("timestamp")
+                    slot = revision.get("slots", {}).get("main", {})
+                    record["wikitext"] = slot.get("content", revision.get("content"))
+
+            if "continue" not in data:
+                break
+            continuation = data["continue"]
+
+        results = {}
+        for title in titles:
+            # Follow normalization then redirect (guarding against loops)
+            canonical = title
+            for _ in range(3):
+                if canonical not in aliases:
+                    break
+                canonical = aliases[canonical]
+            record = pages.get(canonical)
+            if record and content and record["wikitext"] is None:
+                record = None
+            results[title] = record if record and record["revid"] is not None else None
+        return results
+
+    def parse_revision(self, revid: int) -> Optional[str]:
+        """Rendered HTML of one page revision, as it appears in the article body.
+
+        Args:
+            revid: Revision ID of the page
+
+        Returns:
+            The parser output (without edit-section links), or None if the revision is gone
+        """
+        data = self._api_get({
+            "action": "parse",
+            "format": "json",
+            "formatversion": "2",
+            "oldid": str(revid),
+            "prop": "text",
+            "disableeditsection": "1",
+            "disablelimitreport": "1",
+        })
+        return data.get("parse", {}).get("text")
+
+    def fetch_batch(self, words: List[str]) -> Dict[str, Optional[str]]:
+        """Fetch many Wiktionary pages as rendered by Wiktionary.
+
+        Revisions are looked up for the whole batch at once; each distinct page
+        is then parsed with one request.
+
+        Args:
+            words: Words to fetch
+
+        Returns:
+            Dictionary mapping each word to rendered HTML, or None if it has no entry
+        """
+        pages = {}
+        rendered: Dict[int, Optional[str]] = {}
+        for word, record in self.query_pages(words, content=False).items():
+            if record is None:
+                print(f"No entry found for {word}")
+                pages[word] = None
+                continue
+            revid = record["revid"]
+            if revid not in rendered:
+                try:
+                    rendered[revid] = self.parse_revision(revid)
+                except Exception as e:
+                    print(f"Error rendering '{record['title']}': {str(e)}")
+                    rendered[revid] = None
+            if rendered[revid] is None:
+                pages[word] = None
+                continue
+            # Mirror the page config MediaWiki embeds in article HTML
+            page_name = json.dumps(record["title"].replace(" ", "_"), ensure_ascii=False)
+            pages[word] = (f'<script>RLCONF={{"wgPageName":{page_name},'
+                           f'"wgRevisionId":{revid}}};</script>\n' + rendered[revid])
+        return pages
+
+    def fetch_page(self, word: str) -> Optional[str]:
+        """Fetch a single Wiktionary page through the API.
+
+        Args:
+            word: The word to fetch from Wiktionary
+
+        Returns:
+            Rendered HTML content of the page or None if the request failed
+        """
+        return self.fetch_batch([word]).get(word)
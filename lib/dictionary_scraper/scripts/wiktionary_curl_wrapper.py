@@ -9,59 +9,72 @@ may be necessary in environments where Python's requests library is restricted.
 import os
 import subprocess
 import tempfile
-import time
-from typing import Optional
+from typing import Dict, Optional
 from urllib.parse import quote
 
+from fetch_response import FetchResponse, fetch_with_retries, is_missing_entry
+from rate_limiter import TokenBucket
+
 
 class WiktionaryCurlWrapper:
     """Wrapper around curl for fetching Wiktionary pages."""
     
-    def __init__(self, rate_limit: float = 1.0, user_agent: Optional[str] = None):
+    def __init__(self, rate_limit: float = 1.0, user_agent: Optional[str] = None,
+                 rate_limiter: Optional[TokenBucket] = None, max_retries: int = 3):
         """Initialize the wrapper.
         
         Args:
             rate_limit: Time in seconds to wait between requests
             user_agent: Custom user agent string (optional)
+            rate_limiter: Shared token bucket (optional, built from rate_limit if omitted)
+            max_retries: Retries for curl failures and 429/5xx responses
         """
         self.rate_limit = rate_limit
         self.user_agent = user_agent or "Notura Language Learning App/1.0 (Dictionary Data Collection)"
-        self.last_request_time = 0
+        self.rate_limiter = rate_limiter or TokenBucket.from_interval(rate_limit)
+        self.max_retries = max_retries
     
-    def fetch_page(self, word: str) -> Optional[str]:
-        """Fetch a Wiktionary page for a word using curl.
+    def fetch_response(self, word: str, headers: Optional[Dict[str, str]] = None) -> Optional[FetchResponse]:
+        """Request a Wiktionary page for a word using curl.
         
         Args:
             word: The word to fetch from Wiktionary
+            headers: Extra request headers (e.g. conditional request headers)
             
         Returns:
-            HTML content of the page or None if the request failed
+            FetchResponse with status, headers and body, or None if curl failed
         """
-        # Rate limiting
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        
+        # Rate limiting and retries (shared across threads when the limiter is shared)
+        return fetch_with_retries(lambda: self._send(word, headers), self.rate_limiter, self.max_retries, word)
+    
+    def _send(self, word: str, headers: Optional[Dict[str, str]] = None) -> FetchResponse:
+        """Run curl once for a page; raises if curl fails."""
         # URL encode the word
         encoded_word = quote(word)
         url = f"https://en.wiktionary.org/wiki/{encoded_word}"
         
-        # Create a temporary file to store the response
+        # Create temporary files to store the response body and headers
         with tempfile.NamedTemporaryFile(delete=False) as temp_file:
             temp_path = temp_file.name
+        with tempfile.NamedTemporaryFile(delete=False) as header_file:
+            header_path = header_file.name
         
         try:
             # Build the curl command
             curl_cmd = [
                 "curl",
                 "-s",  # Silent mode
+                "-S",  # But still report errors
                 "-o", temp_path,  # Output to file
+                "-D", header_path,  # Dump response headers to file
+                "-w", "%{http_code} %{url_effective}",  # Report status and final URL
                 "-A", self.user_agent,  # User agent
                 "-L",  # Follow redirects
                 "--max-time", "30",  # Timeout
-                url
             ]
+            for name, value in (headers or {}).items():
+                curl_cmd.extend(["-H", f"{name}: {value}"])
+            curl_cmd.append(url)
             
             # Execute curl command
             process = subprocess.run(
@@ -73,32 +86,66 @@ class WiktionaryCurlWrapper:
             
             # Check if curl succeeded
             if process.returncode != 0:
-                error = process.stderr.decode('utf-8', errors='replace')
-                print(f"Curl error for {word}: {error}")
-                return None
+                error = process.stderr.decode('utf-8', errors='replace').strip()
+                raise IOError(f"curl exited with code {process.returncode}: {error}")
+            
+            status_text, _, final_url = process.stdout.decode('utf-8', errors='replace').partition(" ")
             
-            # Read the response from the temporary file
+            # Read the response from the temporary files
             with open(temp_path, 'r', encoding='utf-8', errors='replace') as f:
                 content = f.read()
+            with open(header_path, 'r', encoding='utf-8', errors='replace') as f:
+                response_headers = self._parse_headers(f.read())
             
-            # Update the last request time
-            self.last_request_time = time.time()
-            
-            # Check if the page exists (Wiktionary returns 200 even for missing pages)
-            if "Wiktionary does not have an entry for this term" in content:
-                print(f"No entry found for {word}")
-                return None
+            return FetchResponse(int(status_text), response_headers, content, final_url or url)
+        
+        finally:
+            # Clean up the temporary files
+            for path in (temp_path, header_path):
+                if os.path.exists(path):
+                    os.unlink(path)
+    
+    @staticmethod
+    def _parse_headers(raw: str) -> Dict[str, str]:
+        """Parse the headers of the last response in a curl header dump."""
+        # With -L curl writes one header block per hop; keep the final one
+        blocks = [block for block in raw.replace("\r\n", "\n").split("\n\n") if block.strip()]
+        headers = {}
+        if blocks:
+            for line in blocks[-1].split("\n")[1:]:
+                name, sep, value = line.partition(":")
+                if sep:
+                    headers[name.strip().lower()] = value.strip()
+        return headers
+    
+    @property
+    def current_rate(self) -> float:
+        """Requests per second the rate limiter currently allows (0 = unlimited)."""
+        return self.rate_limiter.rate
+    
+    def fetch_page(self, word: str) -> Optional[str]:
+        """Fetch a Wiktionary page for a word using curl.
+        
+        Args:
+            word: The word to fetch from Wiktionary
             
-            return content
+        Returns:
+            HTML content of the page or None if the request failed
+        """
+        response = self.fetch_response(word)
+        if response is None:
+            return None
         
-        except Exception as e:
-            print(f"Error fetching {word}: {str(e)}")
+        if response.status >= 400 and response.status != 404:
+            print(f"HTTP error for {word}: {response.status}")
             return None
         
-        finally:
-            # Clean up the temporary file
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        # Check if the page exists (Wiktionary returns 404 or a placeholder for missing pages)
+        if response.status == 404 or is_missing_entry(response.content):
+            print(f"No entry found for {word}")
+            return None
+        
+        return response.content
 
 
 # Example usage
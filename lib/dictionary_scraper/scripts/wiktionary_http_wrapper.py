@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Wiktionary HTTP Wrapper - In-process HTTP client for fetching Wiktionary pages
+
+This script provides a drop-in alternative to WiktionaryCurlWrapper that keeps
+persistent HTTP/1.1 connections open in a small pool, so consecutive fetches
+reuse the same TCP+TLS session instead of spawning a curl process (and a
+temporary file) for every word.
+"""
+
+import gzip
+import http.client
+import queue
+import threading
+import zlib
+from typing import Dict, Optional
+from urllib.parse import quote, urljoin, urlsplit
+
+from fetch_response import FetchResponse, fetch_with_retries, is_missing_entry
+from rate_limiter import TokenBucket
+
+
+class HttpConnectionPool:
+    """Thread-safe pool of keep-alive connections to a single host."""
+
+    def __init__(self, base_url: str, max_connections: int = 4, timeout: float = 30.0):
+        """Initialize the pool.
+
+        Args:
+            base_url: Scheme and host of the server (e.g. "https://en.wiktionary.org")
+            max_connections: Maximum number of idle connections kept open
+            timeout: Socket timeout in seconds
+        """
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or "https"
+        self.host = parts.hostname
+        self.port = parts.port
+        self.timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=max_connections)
+        self._lock = threading.Lock()
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """Open a new connection to the pool's host."""
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def acquire(self) -> http.client.HTTPConnection:
+        """Take an idle connection from the pool or open a new one."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def release(self, conn: http.client.HTTPConnection):
+        """Return a connection to the pool, closing it if the pool is full."""
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self):
+        """Close every idle connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class WiktionaryHttpWrapper:
+    """Pooled keep-alive HTTP client for fetching Wiktionary pages."""
+
+    BASE_URL = "https://en.wiktionary.org"
+    MAX_REDIRECTS = 5
+
+    def __init__(self, rate_limit: float = 1.0, user_agent: Optional[str] = None,
+                 base_url: Optional[str] = None, max_connections: int = 4,
+                 timeout: float = 30.0, rate_limiter: Optional[TokenBucket] = None,
+                 max_retries: int = 3):
+        """Initialize the wrapper.
+
+        Args:
+            rate_limit: Time in seconds to wait between requests
+            user_agent: Custom user agent string (optional)
+            base_url: Wiktionary server to talk to (default: en.wiktionary.org)
+            max_connections: Number of keep-alive connections to keep open
+            timeout: Socket timeout in seconds
+            rate_limiter: Shared token bucket (optional, built from rate_limit if omitted)
+            max_retries: Retries for network failures and 429/5xx responses
+        """
+        self.rate_limit = rate_limit
+        self.user_agent = user_agent or "Notura Language Learning App/1.0 (Dictionary Data Collection)"
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.rate_limiter = rate_limiter or TokenBucket.from_interval(rate_limit)
+        self.max_retries = max_retries
+        self._pools: Dict[str, HttpConnectionPool] = {}
+        self._pools_lock = threading.Lock()
+
+    def _pool_for(self, url: str) -> HttpConnectionPool:
+        """Get (or lazily create) the connection pool for a URL's origin."""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        with self._pools_lock:
+            pool = self._pools.get(origin)
+            if pool is None:
+                pool = HttpConnectionPool(origin, self.max_connections, self.timeout)
+                self._pools[origin] = pool
+            return pool
+
+    def _request(self, url: str, headers: Optional[Dict[str, str]] = None):
+        """Perform a single GET on a pooled connection.
+
+        Returns:
+            Tuple of (status, headers, body bytes)
+        """
+        pool = self._pool_for(url)
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        request_headers = {
+            "User-Agent": self.user_agent,
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+        if headers:
+            request_headers.update(headers)
+
+        # A pooled connection may have been closed by the server while idle,
+        # so retry once on a fresh connection before giving up.
+        for attempt in range(2):
+            conn = pool.acquire() if attempt == 0 else pool._new_connection()
+            try:
+                conn.request("GET", path, headers=request_headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, ConnectionError, OSError):
+                conn.close()
+                if attempt == 1:
+                    raise
+                continue
+
+            if response.will_close:
+                conn.close()
+            else:
+                pool.release(conn)
+
+            encoding = (response.getheader("Content-Encoding") or "").lower()
+            if encoding == "gzip":
+                body = gzip.decompress(body)
+            elif encoding == "deflate":
+                body = zlib.decompress(body)
+
+            return response.status, {k.lower(): v for k, v in response.getheaders()}, body
+
+    def fetch_response(self, word: str, headers: Optional[Dict[str, str]] = None) -> Optional[FetchResponse]:
+        """Request a Wiktionary page for a word over a pooled connection.
+
+        Args:
+            word: The word to fetch from Wiktionary
+            headers: Extra request headers (e.g. conditional request headers)
+
+        Returns:
+            FetchResponse with status, headers and body, or None if the request failed
+        """
+        # Rate limiting and retries (shared across threads when the limiter is shared)
+        return fetch_with_retries(lambda: self._send(word, headers), self.rate_limiter, self.max_retries, word)
+
+    def _send(self, word: str, headers: Optional[Dict[str, str]] = None) -> FetchResponse:
+        """Request a page once, following redirects; raises on network failure."""
+        url = f"{self.base_url}/wiki/{quote(word)}"
+
+        for _ in range(self.MAX_REDIRECTS + 1):
+            status, response_headers, body = self._request(url, headers)
+            if status in (301, 302, 303, 307, 308) and "location" in response_headers:
+                url = urljoin(url, response_headers["location"])
+                continue
+            break
+
+        content = body.decode("utf-8", errors="replace")
+        return FetchResponse(status, response_headers, content, url)
+
+    def fetch_page(self, word: str) -> Optional[str]:
+        """Fetch a Wiktionary page for a word over a pooled connection.
+
+        Args:
+            word: The word to fetch from Wiktionary
+
+        Returns:
+            HTML content of the page or None if the request failed
+        """
+        response = self.fetch_response(word)
+        if response is None:
+            return None
+
+        if response.status >= 400 and response.status != 404:
+            print(f"HTTP error for {word}: {response.status}")
+            return None
+
+        # Check if the page exists (Wiktionary returns 404 or a placeholder for missing pages)
+        if response.status == 404 or is_missing_entry(response.content):
+            print(f"No entry found for {word}")
+            return None
+
+        return response.content
+
+    @property
+    def current_rate(self) -> float:
+        """Requests per second the rate limiter currently allows (0 = unlimited)."""
+        return self.rate_limiter.rate
+
+    def close(self):
+        """Close all pooled connections."""
+        with self._pools_lock:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
+
+
+# Example usage
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} <word>")
+        sys.exit(1)
+
+    word = sys.argv[1]
+    wrapper = WiktionaryHttpWrapper()
+    content = wrapper.fetch_page(word)
+
+    if content:
+        output_file = f"{word}_wiktionary.html"
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        print(f"Saved content to {output_file}")
+    else:
+        print(f"Failed to fetch content for {word}")
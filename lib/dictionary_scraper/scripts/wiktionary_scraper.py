@@ -7,29 +7,99 @@ compatible with the Notura dictionary system.
 """
 
 import argparse
+import asyncio
+import html
 import json
 import os
 import re
 import time
-from typing import Dict, List, Any, Optional
-from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Set
 
-from bs4 import BeautifulSoup
-
-# Import the curl wrapper for HTTP requests
+# Import the fetcher backends for HTTP requests
 from wiktionary_curl_wrapper import WiktionaryCurlWrapper
+from wiktionary_http_wrapper import WiktionaryHttpWrapper
+from wiktionary_api_wrapper import WiktionaryApiWrapper
+from alias_map import AliasMap
+from crawl_frontier import CrawlFrontier
+from html_parsers import PARSER_BACKENDS, get_page_parser
+from wikitext_renderer import UNRENDERED_TEMPLATE_PATTERN
+from inflection_tables import is_inflection_box, is_inflection_table, merge_forms, read_inflection_table
+from dump_reader import iter_dump_pages
+from frequency_index import FrequencyIndex
+from page_cache import CachedFetcher, PageCache
+from parse_pipeline import ParsePipeline, iter_html_dir
+from rate_limiter import AdaptiveRateLimiter
+from scrape_metrics import ProgressReporter, metrics, timed
+from result_writers import (OUTPUT_FORMATS, GzipJsonLinesResultWriter, JsonLinesResultWriter,
+                            ScrapeCheckpoint, iter_results, open_result_writer, output_format_for)
+from language_registry import languages
+from section_index import SectionIndex
+from text_normalization import (clean_definition, find_tag_labels, find_tags, normalize_whitespace,
+                                standard_pos, strip_ipa_delimiters)
+
+# Available fetcher backends, all sharing the fetch_page(word) contract
+# (the api backend also fetches whole batches via fetch_batch(words), looking up 50 pages'
+# revisions per request)
+FETCHER_BACKENDS = {
+    "curl": WiktionaryCurlWrapper,
+    "http": WiktionaryHttpWrapper,
+    "api": WiktionaryApiWrapper,
+}
+
+# Fields of a scraped entry whose words are queued when crawling
+CRAWL_LINK_FIELDS = ("related_words", "synonyms", "antonyms")
+# Words taken from the frontier per round (the API's title limit per request)
+CRAWL_ROUND_SIZE = 50
+# Seconds between saves of the crawl state
+CRAWL_SAVE_INTERVAL = 60.0
+
+# MediaWiki page config embedded in every article's HTML
+REVISION_ID_PATTERN = re.compile(r'"wgRevisionId":(\d+)')
+# Computed templates the wikitext renderer (dump ingestion) had to drop
+UNRENDERED_TEMPLATES_PATTERN = re.compile(r'<meta name="unrendered-templates" content="([^"]*)"')
+UNRENDERED_TEMPLATE_FIELDS = {
+    "conj": "word_forms",
+    "decl": "word_forms",
+    "infl": "word_forms",
+    "pr": "ipa_transcriptions",
+    "IPA": "ipa_transcriptions",
+}
+# Printed whenever entries come from locally rendered wikitext
+WIKITEXT_WARNING = ("Warning: pages are rendered from wikitext without Wiktionary's Lua modules, so "
+                    "conjugation/declension tables and automatic pronunciations (e.g. {{es-conj}}, "
+                    "{{es-pr}}) are dropped: records lack word_forms and often ipa_transcriptions, and "
+                    "list the missing fields under \"incomplete_fields\". Dump records are not a "
+                    "substitute for scraped ones; the words concerned are listed for re-scraping online.")
+# Title of the page actually served (the redirect target when a word redirects)
+PAGE_NAME_PATTERN = re.compile(r'"wgPageName":("(?:[^"\\]|\\.)*")')
 
 
 class WiktionaryScraper:
     """Scraper for extracting word data from Wiktionary pages."""
 
-    def __init__(self, lang_code="es", output_dir="data", rate_limit=1.0):
+    def __init__(self, lang_code="es", output_dir="data", rate_limit=1.0, backend="curl",
+                 cache_dir=None, cache_max_age=None, offline=False, parser="html.parser",
+                 frequency_index=None, adaptive_rate=False, max_rate=None, alias_file=None,
+                 resolve_aliases=False):
         """Initialize the scraper.
         
         Args:
             lang_code: The language code to scrape (e.g., "es" for Spanish)
             output_dir: Directory to save scraped data
             rate_limit: Time in seconds to wait between requests
+            backend: Fetcher backend to use ("curl", "http" or "api")
+            cache_dir: Directory for the persistent page cache (None disables caching)
+            cache_max_age: Seconds a cached page is used without revalidation
+            offline: Only serve pages from the cache, never the network
+            parser: HTML parser backend ("html.parser", "lxml" or "fast")
+            frequency_index: Path of a frequency index (.idx) used to rank words
+            adaptive_rate: Start at rate_limit and adjust the request rate to server feedback
+            max_rate: Upper bound in requests per second for the adaptive rate
+            alias_file: JSON file recording the page each word resolves to
+                (default: wiktionary_aliases.json in the output directory)
+            resolve_aliases: Look up the canonical titles of unknown words through the
+                MediaWiki API (Python HTTP client, whatever the backend) before scraping
         """
         self.lang_code = lang_code
         self.output_dir = os.path.join(
@@ -37,28 +107,53 @@ class WiktionaryScraper:
             output_dir
         )
         self.rate_limit = rate_limit
+        self.parser = parser
+        self.page_parser = get_page_parser(parser)
+        self.frequency_index = FrequencyIndex(frequency_index) if frequency_index else None
+        
+        # Initialize the fetcher backend
+        if backend not in FETCHER_BACKENDS:
+            raise ValueError(f"Unknown fetcher backend '{backend}'")
+        rate_limiter = AdaptiveRateLimiter.from_interval(rate_limit, max_rate=max_rate) if adaptive_rate else None
+        self.curl_wrapper = FETCHER_BACKENDS[backend](rate_limit=rate_limit, rate_limiter=rate_limiter)
+        if cache_dir and hasattr(self.curl_wrapper, "fetch_batch"):
+            # Batch fetches bypass the per-page cache
+            if offline:
+                raise ValueError(f"Offline mode is not available with the {backend} backend")
+            print(f"Page cache is not used with the {backend} backend")
+        elif cache_dir:
+            self.curl_wrapper = CachedFetcher(
+                self.curl_wrapper, PageCache(cache_dir), max_age=cache_max_age, offline=offline
+            )
+        elif offline:
+            raise ValueError("Offline mode requires a cache directory")
         
-        # Initialize the curl wrapper
-        self.curl_wrapper = WiktionaryCurlWrapper(rate_limit=rate_limit)
+        self.offline = offline
         
         # Ensure output directory exists
         os.makedirs(self.output_dir, exist_ok=True)
         
+        # Words that Wiktionary normalizes or redirects to another page
+        self.aliases = AliasMap(alias_file or os.path.join(self.output_dir, "wiktionary_aliases.json"))
+        self.resolve_aliases = resolve_aliases
+        
         # Language-specific settings
-        self.language_name = self._get_language_name(lang_code)
-    
-    def _get_language_name(self, lang_code: str) -> str:
-        """Get full language name from code."""
-        language_map = {
-            "es": "Spanish",
-            "en": "English",
-            "fr": "French",
-            "de": "German",
-            "it": "Italian",
-            "pt": "Portuguese",
-            "la": "Latin",
-        }
-        return language_map.get(lang_code, lang_code.upper())
+        self.language_name = languages.heading(lang_code)
+    
+    def annotate_frequency(self, word: str, word_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the word's frequency rank (1 = most common) from the frequency index, if known."""
+        if word_data and self.frequency_index:
+            rank = self.frequency_index.rank(word)
+            if rank is not None:
+                word_data["frequency"] = rank
+        return word_data
+    
+    def order_by_frequency(self, words: List[str]) -> List[str]:
+        """Sort words most frequent first; words missing from the index keep their order at the end."""
+        if not self.frequency_index:
+            return words
+        ranks = {word: self.frequency_index.rank(word) for word in words}
+        return sorted(words, key=lambda word: (ranks[word] is None, ranks[word] or 0))
     
     def scrape_word(self, word: str) -> Dict[str, Any]:
         """Scrape data for a specific word.
@@ -71,134 +166,153 @@ class WiktionaryScraper:
         """
         print(f"Scraping '{word}'...")
         
-        # Fetch the page content using curl
+        # Fetch the page content using the configured backend
         html_content = self.curl_wrapper.fetch_page(word)
         if not html_content:
             print(f"Failed to retrieve page for '{word}'")
             return {}
         
-        soup = BeautifulSoup(html_content, "html.parser")
+        return self.parse_page(word, html_content)
+    
+    @timed("parse")
+    def parse_page(self, word: str, html_content: str) -> Dict[str, Any]:
+        """Extract word data from an already fetched Wiktionary page.
         
-        # Find the language section
-        lang_section = None
-        for h2 in soup.find_all("h2"):
-            if h2.find("span", {"class": "mw-headline"}) and \
-               h2.find("span", {"class": "mw-headline"}).text == self.language_name:
-                lang_section = h2
-                break
+        Args:
+            word: The word the page belongs to
+            html_content: HTML content of the Wiktionary page
+            
+        Returns:
+            A dictionary containing the scraped word data
+        """
+        # Get all content in the language section (until the next h2)
+        with metrics.timer("language_section"):
+            lang_content = self.page_parser.language_section(html_content, self.language_name)
         
-        if not lang_section:
+        if lang_content is None:
             print(f"No {self.language_name} section found for {word}")
             return {}
         
-        # Get all content in this language section (until the next h2)
-        lang_content = []
-        current = lang_section.next_sibling
-        while current and not (current.name == "h2"):
-            if current.name:
-                lang_content.append(current)
-            current = current.next_sibling
+        # Index the headings once so extractors don't re-scan the content
+        with metrics.timer("section_index"):
+            index = SectionIndex(lang_content)
         
         # Build the word data
         word_data = {
             "text": word,
             "language_code": self.lang_code,
-            "translations": self._extract_translations(lang_content),
-            "ipa_transcriptions": self._extract_pronunciations(lang_content),
-            "definitions": self._extract_definitions(lang_content),
-            "examples": self._extract_examples(lang_content),
-            "word_class": self._extract_word_class(lang_content),
-            "word_forms": self._extract_word_forms(lang_content, word),
-            "synonyms": self._extract_synonyms(lang_content),
-            "antonyms": self._extract_antonyms(lang_content),
-            "etymology": self._extract_etymology(lang_content),
-            "related_words": self._extract_related_words(lang_content),
-            "tags": self._extract_tags(lang_content),
+            "translations": self._extract_translations(index),
+            "ipa_transcriptions": self._extract_pronunciations(index),
+            "definitions": self._extract_definitions(index),
+            "examples": self._extract_examples(index),
+            "word_class": self._extract_word_class(index),
+            "word_forms": self._extract_word_forms(index, word),
+            "synonyms": self._extract_synonyms(index),
+            "antonyms": self._extract_antonyms(index),
+            "etymology": self._extract_etymology(index),
+            "related_words": self._extract_related_words(index),
+            "tags": self._extract_tags(index),
         }
         
+        # Revision of the page, used to skip unchanged pages on later refreshes
+        revision = REVISION_ID_PATTERN.search(html_content)
+        if revision:
+            word_data["revision_id"] = int(revision.group(1))
+        
+        # Fields left empty because the templates filling them could not be rendered
+        unrendered = UNRENDERED_TEMPLATES_PATTERN.search(html_content)
+        if unrendered:
+            incomplete = self._incomplete_fields(html.unescape(unrendered.group(1)).split(","), word_data)
+            if incomplete:
+                word_data["incomplete_fields"] = incomplete
+        
+        # Canonical title, when the word was normalized or redirected to another page
+        page_name = PAGE_NAME_PATTERN.search(html_content)
+        if page_name:
+            title = json.loads(page_name.group(1)).replace("_", " ")
+            if title != word:
+                word_data["canonical_title"] = title
+        
         return word_data
     
-    def _extract_word_class(self, content) -> str:
+    def _incomplete_fields(self, templates: List[str], word_data: Dict[str, Any]) -> List[str]:
+        """Empty fields of an entry that this language's dropped templates would have filled."""
+        fields = set()
+        for name in templates:
+            match = UNRENDERED_TEMPLATE_PATTERN.search(name)
+            if match and name.startswith(f"{self.lang_code}-"):
+                field = UNRENDERED_TEMPLATE_FIELDS[match.group(1)]
+                if not word_data.get(field):
+                    fields.add(field)
+        return sorted(fields)
+    
+    @staticmethod
+    def _report_incomplete(incomplete: int, total: int, word_list_file: str):
+        """Warn about records written with fields missing, and where their words are listed."""
+        if incomplete:
+            print(f"Warning: {incomplete} of {total} records are missing fields the wikitext renderer "
+                  f"cannot produce (see \"incomplete_fields\"). For complete records, scrape their words "
+                  f"online: --word-list {word_list_file}")
+    
+    @timed()
+    def _extract_word_class(self, index: SectionIndex) -> str:
         """Extract word class (part of speech) from the content."""
-        for elem in content:
-            if elem.name == "h3":
-                pos_span = elem.find("span", {"class": "mw-headline"})
-                if pos_span:
-                    pos_text = pos_span.text.lower()
-                    # Map Wiktionary part of speech to our standardized categories
-                    pos_mapping = {
-                        "noun": "noun",
-                        "verb": "verb",
-                        "adjective": "adjective",
-                        "adverb": "adverb",
-                        "pronoun": "pronoun",
-                        "preposition": "preposition",
-                        "conjunction": "conjunction",
-                        "interjection": "interjection",
-                        "article": "article",
-                        "numeral": "numeral",
-                    }
-                    for wikt_pos, standard_pos in pos_mapping.items():
-                        if wikt_pos in pos_text:
-                            return standard_pos
+        for section in index.headings("h3"):
+            if section.title is not None:
+                # Map Wiktionary part of speech to our standardized categories
+                pos = standard_pos(section.title.lower())
+                if pos:
+                    return pos
         return "unknown"
     
-    def _extract_pronunciations(self, content) -> List[str]:
+    @timed()
+    def _extract_pronunciations(self, index: SectionIndex) -> List[str]:
         """Extract IPA transcriptions from the content."""
         ipa_list = []
-        for elem in content:
-            if elem.name == "h3" and elem.find("span", {"class": "mw-headline"}, text="Pronunciation"):
-                # Find the next <ul> element
-                current = elem.next_sibling
-                while current and current.name != "ul":
-                    current = current.next_sibling
-                
-                if current and current.name == "ul":
-                    for li in current.find_all("li"):
-                        # Look for IPA notation
-                        ipa_span = li.find("span", {"class": "IPA"})
-                        if ipa_span:
-                            ipa_text = ipa_span.text.strip()
-                            # Remove brackets if present
-                            ipa_text = re.sub(r'[/\[\]]', '', ipa_text)
-                            ipa_list.append(ipa_text)
+        for section in index.headings("h3", "Pronunciation"):
+            # Find the next <ul> element
+            current = index.first_after(section, "ul")
+            
+            if current:
+                for li in current.find_all("li"):
+                    # Look for IPA notation
+                    ipa_span = li.find("span", {"class": "IPA"})
+                    if ipa_span:
+                        ipa_text = ipa_span.text.strip()
+                        # Remove brackets if present
+                        ipa_text = strip_ipa_delimiters(ipa_text)
+                        ipa_list.append(ipa_text)
         
         return ipa_list
     
-    def _extract_definitions(self, content) -> List[str]:
+    @timed()
+    def _extract_definitions(self, index: SectionIndex) -> List[str]:
         """Extract definitions from the content."""
         definitions = []
-        current_pos = None
-        
-        for elem in content:
-            # Track current part of speech
-            if elem.name == "h3" or elem.name == "h4":
-                pos_span = elem.find("span", {"class": "mw-headline"})
-                if pos_span and not pos_span.text.lower() in ["pronunciation", "etymology"]:
-                    current_pos = pos_span.text.lower()
-            
-            # Look for definition lists
-            if elem.name == "ol" and current_pos:
+        
+        # Definition lists, paired with the part of speech heading they fall under
+        for current_pos, elem in index.elements_with_pos("ol"):
+            if current_pos:
                 for li in elem.find_all("li", recursive=False):
                     # Skip examples and other non-definition content
                     if li.find("dl") or li.find("ul"):
                         continue
                     
                     definition_text = li.get_text().strip()
-                    # Clean up some common formatting issues
-                    definition_text = re.sub(r'\([^)]*\)', '', definition_text)  # Remove parenthetical text
-                    definition_text = re.sub(r'\s+', ' ', definition_text)  # Normalize whitespace
+                    # Remove parenthetical text and normalize whitespace
+                    definition_text = clean_definition(definition_text)
                     
                     if definition_text:
                         definitions.append(definition_text)
         
         return definitions
     
-    def _extract_examples(self, content) -> List[str]:
+    @timed()
+    def _extract_examples(self, index: SectionIndex) -> List[str]:
         """Extract example sentences from the content."""
         examples = []
         
-        for elem in content:
+        for elem in index.elements("ol", "ul"):
             # Look for example lists (usually in a <dl> after a definition)
             if elem.name == "ol":
                 for li in elem.find_all("li", recursive=False):
@@ -208,7 +322,7 @@ class WiktionaryScraper:
                             example_text = dd.get_text().strip()
                             if example_text:
                                 # Clean up formatting
-                                example_text = re.sub(r'\s+', ' ', example_text)
+                                example_text = normalize_whitespace(example_text)
                                 examples.append(example_text)
             
             # Sometimes examples are in <ul> with class "citations"
@@ -220,214 +334,111 @@ class WiktionaryScraper:
         
         return examples
     
-    def _extract_translations(self, content) -> Dict[str, List[str]]:
+    @timed()
+    def _extract_translations(self, index: SectionIndex) -> Dict[str, List[str]]:
         """Extract translations from the content."""
         translations = {}
         
-        for elem in content:
-            if elem.name == "h4" and elem.find("span", {"class": "mw-headline"}, text="Translations"):
-                # Find the translation tables
-                current = elem.next_sibling
-                while current and not (current.name == "h3" or current.name == "h4"):
-                    if current.name == "div" and "translations" in current.get("class", []):
-                        for li in current.find_all("li"):
-                            # Each li usually has language name followed by translation
-                            lang_link = li.find("a", {"class": "language"})
-                            if lang_link:
-                                lang_name = lang_link.text.strip()
-                                lang_code = self._get_language_code(lang_name)
-                                if lang_code:
-                                    # Get all translations for this language
-                                    trans_spans = li.find_all("span", {"lang": True})
-                                    if trans_spans:
-                                        translations[lang_code] = [span.text.strip() for span in trans_spans]
-                    
-                    current = current.next_sibling
+        for section in index.headings("h4", "Translations"):
+            # Find the translation tables
+            for current in section.nodes:
+                if current.name == "div" and "translations" in current.get("class", []):
+                    for li in current.find_all("li"):
+                        # Each li usually has language name followed by translation
+                        lang_link = li.find("a", {"class": "language"})
+                        if lang_link:
+                            # Get all translations for this language
+                            trans_spans = li.find_all("span", {"lang": True})
+                            if trans_spans:
+                                # Languages missing from the registry keep the code the page tags them with
+                                lang_code = languages.code(lang_link.text.strip()) or trans_spans[0]["lang"]
+                                translations[lang_code] = [span.text.strip() for span in trans_spans]
         
         return translations
     
-    def _get_language_code(self, language_name: str) -> Optional[str]:
-        """Convert a language name to a language code."""
-        language_map = {
-            "English": "en",
-            "Spanish": "es",
-            "French": "fr",
-            "German": "de",
-            "Italian": "it",
-            "Portuguese": "pt",
-            "Latin": "la",
-            # Add more mappings as needed
-        }
-        return language_map.get(language_name)
-    
-    def _extract_word_forms(self, content, base_word: str) -> Dict[str, Any]:
-        """Extract word forms from the content."""
+    @timed()
+    def _extract_word_forms(self, index: SectionIndex, base_word: str) -> Dict[str, Any]:
+        """Extract word forms (conjugations, declensions) from the content."""
         word_forms = {}
         
-        # For Spanish verbs
-        if self.lang_code == "es":
-            # Look for conjugation tables
-            for elem in content:
-                if elem.name == "table" and "conjugation" in elem.get("class", []):
-                    # Process Spanish verb conjugation table
-                    word_forms = self._process_spanish_verb_conjugation(elem)
-                
-                # Look for anchored conjugation tables as well
-                if elem.name == "div" and "inflection-table" in elem.get("class", []):
-                    tables = elem.find_all("table")
-                    for table in tables:
-                        if "conjugation" in table.get("class", []):
-                            forms = self._process_spanish_verb_conjugation(table)
-                            # Merge with existing forms
-                            for mood, tenses in forms.items():
-                                if mood not in word_forms:
-                                    word_forms[mood] = {}
-                                for tense, persons in tenses.items():
-                                    word_forms[mood][tense] = persons
+        # Inflection tables, on their own or inside collapsible boxes
+        for elem in index.elements("table", "div"):
+            if is_inflection_table(elem):
+                tables = [elem]
+            elif is_inflection_box(elem):
+                tables = [table for table in elem.find_all("table") if is_inflection_table(table)]
+            else:
+                continue
+            for table in tables:
+                merge_forms(word_forms, self._process_inflection_table(table))
         
         return word_forms
     
-    def _process_spanish_verb_conjugation(self, table) -> Dict[str, Any]:
-        """Process a Spanish verb conjugation table."""
-        conjugation = {}
-        current_mood = None
-        current_tense = None
-        
-        # First check if this is a conjugation table with headers
-        headers = table.find_all("th")
-        if not headers:
-            return conjugation
-        
-        # Process headers to identify moods and tenses
-        for header in headers:
-            header_text = header.text.strip().lower()
-            
-            # Identify moods
-            for mood in ["indicative", "subjunctive", "imperative", "conditional"]:
-                if mood in header_text:
-                    current_mood = mood
-                    conjugation[current_mood] = {}
-                    break
-            
-            # Identify tenses for current mood
-            if current_mood and any(tense in header_text for tense in 
-                                   ["present", "preterite", "imperfect", "future", "conditional"]):
-                # Simplify and standardize tense names
-                if "present" in header_text:
-                    current_tense = "present"
-                elif "preterite" in header_text or "past" in header_text:
-                    current_tense = "preterite"
-                elif "imperfect" in header_text:
-                    current_tense = "imperfect"
-                elif "future" in header_text:
-                    current_tense = "future"
-                elif "conditional" in header_text:
-                    current_tense = "conditional"
-                
-                if current_tense:
-                    conjugation[current_mood][current_tense] = {}
-        
-        # Process the table cells to extract conjugations
-        rows = table.find_all("tr")
-        for row in rows:
-            cells = row.find_all(["th", "td"])
-            if len(cells) < 2:
-                continue
-            
-            # First cell might have person info
-            person_cell = cells[0].text.strip().lower()
-            
-            # Map to standard person keys
-            person_key = None
-            if any(p in person_cell for p in ["yo", "i", "1s"]):
-                person_key = "1sg"
-            elif any(p in person_cell for p in ["tú", "you", "2s"]):
-                person_key = "2sg"
-            elif any(p in person_cell for p in ["él", "usted", "he", "she", "it", "3s"]):
-                person_key = "3sg"
-            elif any(p in person_cell for p in ["nosotros", "we", "1p"]):
-                person_key = "1pl"
-            elif any(p in person_cell for p in ["vosotros", "you all", "2p"]):
-                person_key = "2pl"
-            elif any(p in person_cell for p in ["ellos", "ustedes", "they", "3p"]):
-                person_key = "3pl"
-            
-            # If we have a person and a current mood and tense
-            if person_key and current_mood and current_tense:
-                # Second cell has the conjugated form
-                form = cells[1].text.strip()
-                if form:
-                    conjugation[current_mood][current_tense][person_key] = form
-        
-        return conjugation
+    @timed()
+    def _process_inflection_table(self, table) -> Dict[str, Any]:
+        """Process a conjugation or declension table."""
+        return read_inflection_table(table)
     
-    def _extract_synonyms(self, content) -> List[str]:
+    @timed()
+    def _extract_synonyms(self, index: SectionIndex) -> List[str]:
         """Extract synonyms from the content."""
         synonyms = []
-        for elem in content:
-            if elem.name == "h4" and elem.find("span", {"class": "mw-headline"}, text="Synonyms"):
-                # Find the next <ul> element
-                current = elem.next_sibling
-                while current and current.name != "ul":
-                    current = current.next_sibling
-                
-                if current and current.name == "ul":
-                    for li in current.find_all("li"):
-                        for link in li.find_all("a"):
-                            synonym = link.text.strip()
-                            if synonym and not synonym.startswith("Thesaurus:"):
-                                synonyms.append(synonym)
+        for section in index.headings("h4", "Synonyms"):
+            # Find the next <ul> element
+            current = index.first_after(section, "ul")
+            
+            if current:
+                for li in current.find_all("li"):
+                    for link in li.find_all("a"):
+                        synonym = link.text.strip()
+                        if synonym and not synonym.startswith("Thesaurus:"):
+                            synonyms.append(synonym)
         
         return synonyms
     
-    def _extract_antonyms(self, content) -> List[str]:
+    @timed()
+    def _extract_antonyms(self, index: SectionIndex) -> List[str]:
         """Extract antonyms from the content."""
         antonyms = []
-        for elem in content:
-            if elem.name == "h4" and elem.find("span", {"class": "mw-headline"}, text="Antonyms"):
-                # Find the next <ul> element
-                current = elem.next_sibling
-                while current and current.name != "ul":
-                    current = current.next_sibling
-                
-                if current and current.name == "ul":
-                    for li in current.find_all("li"):
-                        for link in li.find_all("a"):
-                            antonym = link.text.strip()
-                            if antonym:
-                                antonyms.append(antonym)
+        for section in index.headings("h4", "Antonyms"):
+            # Find the next <ul> element
+            current = index.first_after(section, "ul")
+            
+            if current:
+                for li in current.find_all("li"):
+                    for link in li.find_all("a"):
+                        antonym = link.text.strip()
+                        if antonym:
+                            antonyms.append(antonym)
         
         return antonyms
     
-    def _extract_etymology(self, content) -> Optional[str]:
+    @timed()
+    def _extract_etymology(self, index: SectionIndex) -> Optional[str]:
         """Extract etymology information from the content."""
-        for elem in content:
-            if elem.name == "h3" and elem.find("span", {"class": "mw-headline"}, text="Etymology"):
-                # Find the next <p> element
-                current = elem.next_sibling
-                while current and current.name != "p":
-                    current = current.next_sibling
-                
-                if current and current.name == "p":
-                    etymology = current.get_text().strip()
-                    # Clean up formatting
-                    etymology = re.sub(r'\s+', ' ', etymology)
-                    return etymology
+        for section in index.headings("h3", "Etymology"):
+            # Find the next <p> element
+            current = index.first_after(section, "p")
+            
+            if current:
+                etymology = current.get_text().strip()
+                # Clean up formatting
+                etymology = normalize_whitespace(etymology)
+                return etymology
         
         return None
     
-    def _extract_related_words(self, content) -> List[str]:
+    @timed()
+    def _extract_related_words(self, index: SectionIndex) -> List[str]:
         """Extract related words (derived terms, etc.) from the content."""
         related = []
-        for elem in content:
-            if elem.name == "h4" and elem.find("span", {"class": "mw-headline"}) and \
-               any(t in elem.text.lower() for t in ["derived terms", "related terms"]):
+        for section in index.headings("h4"):
+            if section.title is not None and \
+               any(t in section.text for t in ["derived terms", "related terms"]):
                 # Find the next <ul> element
-                current = elem.next_sibling
-                while current and current.name != "ul":
-                    current = current.next_sibling
+                current = index.first_after(section, "ul")
                 
-                if current and current.name == "ul":
+                if current:
                     for li in current.find_all("li"):
                         for link in li.find_all("a"):
                             related_word = link.text.strip()
@@ -436,42 +447,41 @@ class WiktionaryScraper:
         
         return related
     
-    def _extract_tags(self, content) -> List[str]:
+    @timed()
+    def _extract_tags(self, index: SectionIndex) -> List[str]:
         """Extract tags (usage, regional, etc.) from the content."""
-        tags = []
+        tags = set()
         
         # Look for usage notes
-        for elem in content:
-            if elem.name == "h4" and elem.find("span", {"class": "mw-headline"}, text="Usage notes"):
-                # Extract context labels
-                current = elem.next_sibling
-                while current and not (current.name in ["h3", "h4"]):
-                    if current.name == "p":
-                        text = current.get_text().lower()
-                        for tag in ["formal", "informal", "colloquial", "slang", "archaic", "literary", 
-                                   "regional", "technical", "vulgar", "offensive"]:
-                            if tag in text:
-                                tags.append(tag)
-                    current = current.next_sibling
+        for section in index.headings("h4", "Usage notes"):
+            # Extract context labels
+            for current in section.nodes:
+                if current.name == "p":
+                    tags |= find_tags(current.get_text().lower())
         
         # Look for context labels in definitions
-        for elem in content:
-            if elem.name == "ol":  # Definition lists
-                for li in elem.find_all("li"):
-                    text = li.get_text().lower()
-                    for tag in ["formal", "informal", "colloquial", "slang", "archaic", "literary", 
-                               "regional", "technical", "vulgar", "offensive"]:
-                        if f"({tag})" in text:
-                            tags.append(tag)
+        for elem in index.elements("ol"):  # Definition lists
+            for li in elem.find_all("li"):
+                tags |= find_tag_labels(li.get_text().lower())
         
-        return list(set(tags))  # Remove duplicates
+        return list(tags)
     
-    def scrape_word_list(self, word_list_file: str, output_file: Optional[str] = None):
+    def scrape_word_list(self, word_list_file: str, output_file: Optional[str] = None,
+                         concurrency: int = 1, parse_workers: int = 0,
+                         output_format: Optional[str] = None, resume: bool = False,
+                         progress_interval: Optional[float] = None):
         """Scrape data for a list of words from a file.
         
         Args:
             word_list_file: Path to the file containing words to scrape (one per line)
-            output_file: Path to save the scraped data (JSON format)
+            output_file: Path to save the scraped data
+            concurrency: Number of requests to keep in flight (1 scrapes sequentially)
+            parse_workers: Number of parser processes (0 parses in this process)
+            output_format: "json" (one indented object), "jsonl" (one record per line,
+                written as each word finishes) or "jsonl.gz" (compressed JSON Lines with
+                a random-access index); inferred from output_file if omitted
+            resume: Skip words recorded in the checkpoint of a previous JSON Lines run
+            progress_interval: Print a progress line with words/sec and ETA this often (seconds)
         """
         if not os.path.exists(word_list_file):
             print(f"Word list file not found: {word_list_file}")
@@ -482,27 +492,520 @@ class WiktionaryScraper:
         
         output_file = output_file or os.path.join(
             self.output_dir, 
-            f"wiktionary_{self.lang_code}_{len(words)}_words.json"
+            f"wiktionary_{self.lang_code}_{len(words)}_words.{output_format or 'json'}"
         )
         
+        writer = open_result_writer(output_file, output_format, append=resume)
+        checkpoint = None
+        if isinstance(writer, (JsonLinesResultWriter, GzipJsonLinesResultWriter)):
+            checkpoint = ScrapeCheckpoint(output_file)
+            if resume:
+                done = checkpoint.load()
+                stored = getattr(writer, "stored_words", None)
+                if stored is not None:
+                    # Words still buffered when the previous run stopped never reached the file
+                    done = {word: status for word, status in done.items()
+                            if status != ScrapeCheckpoint.SCRAPED or word in stored}
+                words = [word for word in words if word not in done]
+                print(f"Resuming: skipping {len(done)} words recorded in {checkpoint.path}")
+            else:
+                checkpoint.reset()
+        elif resume:
+            print("Resuming requires JSON Lines output (--format jsonl); scraping all words")
+        
+        # Most frequent words first, so a partial run covers the most useful entries
+        words = self.order_by_frequency(words)
+        
         print(f"Scraping {len(words)} words from Wiktionary ({self.language_name})...")
+        progress = ProgressReporter(len(words), progress_interval) if progress_interval else None
+        
+        def on_result(word, word_data):
+            if word_data:
+                writer.add(word, self.annotate_frequency(word, word_data))
+            if checkpoint:
+                checkpoint.record(word, ScrapeCheckpoint.SCRAPED if word_data else ScrapeCheckpoint.FAILED)
+            metrics.increment("words_scraped" if word_data else "words_failed")
+            if progress:
+                progress.update(extra=f", {self.curl_wrapper.current_rate:.2f} requests/s"
+                                if isinstance(self.curl_wrapper.rate_limiter, AdaptiveRateLimiter) else "")
+        
+        try:
+            self._scrape_pages(words, on_result, concurrency, parse_workers, resolve=True)
+        
+        finally:
+            # Save results
+            saved = writer.close()
+            if checkpoint:
+                checkpoint.close()
+            self.aliases.save()
+        
+        print(f"Scraped {saved} words. Data saved to {output_file}")
+        if isinstance(self.curl_wrapper.rate_limiter, AdaptiveRateLimiter):
+            print(f"Request rate settled at {self.curl_wrapper.current_rate:.2f} requests/second")
+        return output_file
+    
+    def _scrape_words(self, words: List[str], on_result: Callable[[str, Dict[str, Any]], None],
+                      concurrency: int = 1, parse_workers: int = 0):
+        """Scrape words with the strategy that fits the options and fetcher.
+        
+        Args:
+            words: Words to scrape
+            on_result: Called with (word, word_data) as each word finishes
+                (word_data is empty when scraping failed)
+            concurrency: Number of requests to keep in flight (1 scrapes sequentially)
+            parse_workers: Number of parser processes (0 parses in this process)
+        """
+        if parse_workers > 0:
+            pipeline = ParsePipeline(self.lang_code, workers=parse_workers, parser=self.parser)
+            for word, word_data in pipeline.scrape_words(self.curl_wrapper, words, concurrency):
+                on_result(word, word_data)
+        elif hasattr(self.curl_wrapper, "fetch_batch"):
+            self._scrape_words_batched(words, on_result)
+        elif concurrency > 1:
+            asyncio.run(self._scrape_words_async(words, concurrency, on_result))
+        else:
+            for i, word in enumerate(words):
+                word_data = {}
+                try:
+                    print(f"[{i+1}/{len(words)}] Scraping '{word}'...")
+                    word_data = self.scrape_word(word)
+                
+                except Exception as e:
+                    print(f"Error scraping '{word}': {str(e)}")
+                
+                on_result(word, word_data)
+    
+    def _scrape_pages(self, words: List[str], on_result: Callable[[str, Dict[str, Any]], None],
+                      concurrency: int = 1, parse_workers: int = 0, resolve: bool = False):
+        """Scrape words, fetching each distinct Wiktionary page only once.
+        
+        Words are grouped by the canonical title recorded in the alias map
+        (case variants and spellings that redirect to the same page), one
+        word per group is fetched and the result is passed on for every word
+        in the group. Titles learned from the fetched pages are recorded for
+        later runs.
+        
+        Args:
+            words: Words to scrape
+            on_result: Called with (word, word_data) as each word finishes
+                (word_data is empty when scraping failed)
+            concurrency: Number of requests to keep in flight (1 scrapes sequentially)
+            parse_workers: Number of parser processes (0 parses in this process)
+            resolve: First look up unknown words' canonical titles in bulk through the API
+                (only when the scraper was created with resolve_aliases)
+        """
+        missing = self._resolve_aliases(words) if resolve else set()
+        groups: Dict[str, List[str]] = {}
+        for word in words:
+            if word in missing:
+                print(f"No entry found for {word}")
+                on_result(word, {})
+            else:
+                groups.setdefault(self.aliases.resolve(word), []).append(word)
+        
+        saved = len(words) - len(missing) - len(groups)
+        if saved:
+            print(f"{saved} words share a page with another word; fetching {len(groups)} pages")
+        
+        def on_page(title, word_data):
+            canonical = word_data.get("canonical_title", title) if word_data else title
+            for word in groups[title]:
+                alias_data = dict(word_data)
+                if alias_data:
+                    self.aliases.record(word, canonical)
+                    alias_data["text"] = word
+                    alias_data.pop("canonical_title", None)
+                    if canonical != word:
+                        alias_data["canonical_title"] = canonical
+                on_result(word, alias_data)
+        
+        self._scrape_words(list(groups), on_page, concurrency, parse_workers)
+    
+    def _resolve_aliases(self, words: List[str]) -> Set[str]:
+        """Record the canonical titles of words missing from the alias map.
+        
+        Titles are looked up 50 per API request (metadata only). Opt-in, since
+        this goes through the Python HTTP client even with the curl backend;
+        skipped in offline mode and for fetchers that already resolve titles
+        per batch. Without it, words are still grouped by the titles recorded
+        from pages fetched earlier.
+        
+        Returns:
+            Words that have no Wiktionary page
+        """
+        unknown = [word for word in dict.fromkeys(words) if word not in self.aliases]
+        if not unknown or not self.resolve_aliases or self.offline or hasattr(self.curl_wrapper, "fetch_batch"):
+            return set()
         
-        results = {}
-        for i, word in enumerate(words):
-            try:
-                print(f"[{i+1}/{len(words)}] Scraping '{word}'...")
-                word_data = self.scrape_word(word)
-                if word_data:
-                    results[word] = word_data
+        print(f"Resolving page titles of {len(unknown)} words...")
+        missing = set()
+        for word, title in self._revision_client().resolve_titles(unknown).items():
+            if title is None:
+                # Not persisted: the page may be created later
+                missing.add(word)
+            else:
+                self.aliases.record(word, title)
+        return missing
+    
+    def _revision_client(self) -> WiktionaryApiWrapper:
+        """API client for revision lookups, sharing the fetcher's rate limit where possible."""
+        fetcher = getattr(self.curl_wrapper, "fetcher", self.curl_wrapper)
+        if isinstance(fetcher, WiktionaryApiWrapper):
+            return fetcher
+        rate_limiter = getattr(fetcher, "rate_limiter", None)
+        return WiktionaryApiWrapper(rate_limit=self.rate_limit, rate_limiter=rate_limiter)
+    
+    def refresh_word_list(self, word_list_file: str, previous_file: str, output_file: Optional[str] = None,
+                          delta_file: Optional[str] = None, concurrency: int = 1, parse_workers: int = 0,
+                          output_format: Optional[str] = None):
+        """Re-scrape only the words whose Wiktionary page changed since a previous run.
+        
+        Current revision IDs for every word are looked up in bulk through the
+        MediaWiki API (metadata only, 50 titles per request) and compared with
+        the "revision_id" stored in the previous results. Changed, new and
+        previously failed words are scraped again; the rest are carried over.
+        
+        Args:
+            word_list_file: Path to the file containing words to scrape (one per line)
+            previous_file: Results of the previous run (.json, .jsonl or .jsonl.gz)
+            output_file: Path for the complete, updated results
+            delta_file: Path for just the re-scraped records; words whose page was
+                deleted are listed in "<delta_file>.removed"
+            concurrency: Number of requests to keep in flight (1 scrapes sequentially)
+            parse_workers: Number of parser processes (0 parses in this process)
+            output_format: Format of output_file and delta_file (inferred from the names if omitted)
+        """
+        if not os.path.exists(word_list_file):
+            print(f"Word list file not found: {word_list_file}")
+            return
+        if not os.path.exists(previous_file):
+            print(f"Previous results not found: {previous_file}")
+            return
+        
+        with open(word_list_file, "r", encoding="utf-8") as f:
+            words = [line.strip() for line in f if line.strip()]
+        
+        previous = {word: word_data for word, word_data in iter_results(previous_file) if word}
+        
+        print(f"Checking current revisions of {len(words)} words...")
+        revisions = self._revision_client().query_pages(words, content=False)
+        for word, current in revisions.items():
+            if current is not None:
+                self.aliases.record(word, current["title"])
+        
+        changed = []
+        removed = []
+        for word in words:
+            current = revisions.get(word)
+            old = previous.get(word)
+            if current is None:
+                if old:
+                    removed.append(word)
+            elif not old or old.get("revision_id") != current["revid"]:
+                changed.append(word)
+        
+        print(f"{len(changed)} changed or new, {len(removed)} removed, "
+              f"{len(words) - len(changed) - len(removed)} unchanged or missing")
+        
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        output_file = output_file or os.path.join(
+            self.output_dir,
+            f"wiktionary_{self.lang_code}_{len(words)}_words.{output_format or output_format_for(previous_file)}"
+        )
+        delta_file = delta_file or os.path.join(
+            self.output_dir,
+            f"wiktionary_{self.lang_code}_delta_{timestamp}.{output_format or 'jsonl'}"
+        )
+        
+        refreshed = {}
+        delta_writer = open_result_writer(delta_file, output_format)
+        
+        def on_result(word, word_data):
+            if not word_data:
+                return
+            current = revisions[word]
+            # Pages fetched as HTML carry their own revision ID; fall back to the one just queried
+            word_data.setdefault("revision_id", current["revid"])
+            word_data["revision_timestamp"] = current["timestamp"]
+            self.annotate_frequency(word, word_data)
+            refreshed[word] = word_data
+            delta_writer.add(word, word_data)
+        
+        try:
+            self._scrape_pages(changed, on_result, concurrency, parse_workers)
+        finally:
+            updated = delta_writer.close()
+            self.aliases.save()
+        
+        if removed:
+            with open(f"{delta_file}.removed", "w", encoding="utf-8") as f:
+                for word in removed:
+                    f.write(f"{word}\n")
+        
+        # Carry over unchanged records (and keep old data for words that failed to re-scrape)
+        writer = open_result_writer(output_file, output_format)
+        try:
+            removed_words = set(removed)
+            for word in words:
+                word_data = refreshed.get(word) or previous.get(word)
+                if word_data and word not in removed_words:
+                    writer.add(word, word_data)
+        finally:
+            saved = writer.close()
+        
+        print(f"Updated {updated} words ({delta_file}); saved {saved} words to {output_file}")
+        return output_file
+    
+    def crawl(self, crawl_dir: str, seed_file: Optional[str] = None, output_file: Optional[str] = None,
+              max_pages: Optional[int] = None, max_time: Optional[float] = None,
+              max_depth: Optional[int] = None, concurrency: int = 1, parse_workers: int = 0,
+              output_format: Optional[str] = None):
+        """Scrape outward from seed words, following related words, synonyms and antonyms.
+        
+        Words are taken from a persistent frontier most frequent first (by
+        the frequency index; unranked words by link depth), so a crawl that
+        stops at its budget has covered the most valuable words it found.
+        Running again with the same crawl directory resumes where it stopped,
+        appending to the same output. Words already in the output are not
+        scraped again; those crawled after the last save of the frontier
+        have their links queued from the stored record instead.
+        
+        Args:
+            crawl_dir: Directory for the crawl state (frontier and seen-filter)
+            seed_file: File with words to start from (one per line); optional when resuming
+            output_file: JSON Lines file the entries are appended to
+            max_pages: Stop after this many words have been scraped in this run
+            max_time: Stop after this many seconds (checked between rounds)
+            max_depth: Do not queue words more than this many links from a seed
+            concurrency: Number of requests to keep in flight (1 scrapes sequentially)
+            parse_workers: Number of parser processes (0 parses in this process)
+            output_format: "jsonl" or "jsonl.gz" (inferred from output_file if omitted)
+        """
+        output_file = output_file or os.path.join(
+            self.output_dir, f"wiktionary_{self.lang_code}_crawl.{output_format or 'jsonl'}"
+        )
+        if (output_format or output_format_for(output_file)) == "json":
+            print("Crawling writes JSON Lines; use a .jsonl or .jsonl.gz output file")
+            return
+        
+        rank = self.frequency_index.rank if self.frequency_index else None
+        frontier = CrawlFrontier(crawl_dir, rank=rank)
+        seeds = 0
+        if seed_file:
+            if not os.path.exists(seed_file):
+                print(f"Word list file not found: {seed_file}")
+                return
+            with open(seed_file, "r", encoding="utf-8") as f:
+                seeds = sum(frontier.add(line.strip()) for line in f if line.strip())
+        if frontier.resumed:
+            print(f"Resuming crawl: {len(frontier.seen)} words seen, {len(frontier)} queued, {seeds} new seeds")
+        
+        def expand(word_data, depth, discovered=None):
+            if max_depth is None or depth < max_depth:
+                for field in CRAWL_LINK_FIELDS:
+                    for linked in word_data.get(field, []):
+                        if frontier.add(linked, depth + 1) and discovered is not None:
+                            discovered[linked] = depth + 1
+        
+        # Entries already written, by this crawl or an interrupted run of it
+        done = set()
+        if os.path.exists(output_file):
+            # Replay the output in crawl order: words crawled after the frontier was last
+            # saved are still queued there, or were found by such a word, and their links
+            # are queued again; everything else was expanded before that save
+            depths_known = frontier.queued()
+            for word, word_data in iter_results(output_file):
+                done.add(word)
+                frontier.seen.add(word)
+                if word in depths_known:
+                    expand(word_data, depths_known[word], depths_known)
+            print(f"{len(done)} words already in {output_file} will not be scraped again")
+        
+        if not len(frontier):
+            print("Nothing to crawl: the frontier is empty")
+            return output_file
+        
+        # Save right away, so even a crawl killed in its first round can be resumed
+        frontier.save()
+        writer = open_result_writer(output_file, output_format, append=os.path.exists(output_file))
+        started = time.monotonic()
+        last_save = started
+        scraped = 0
+        depths: Dict[str, int] = {}
+        
+        def on_result(word, word_data):
+            nonlocal scraped
+            depth = depths.pop(word)
+            scraped += 1
+            metrics.increment("words_scraped" if word_data else "words_failed")
+            if not word_data:
+                return
+            writer.add(word, self.annotate_frequency(word, word_data))
+            done.add(word)
+            expand(word_data, depth)
+        
+        print(f"Crawling Wiktionary ({self.language_name}) from {len(frontier)} queued words...")
+        try:
+            while len(frontier):
+                if max_pages is not None and scraped >= max_pages:
+                    print(f"Page budget of {max_pages} reached")
+                    break
+                if max_time is not None and time.monotonic() - started >= max_time:
+                    print(f"Time budget of {max_time:.0f}s reached")
+                    break
+                
+                round_size = CRAWL_ROUND_SIZE if max_pages is None else min(CRAWL_ROUND_SIZE, max_pages - scraped)
+                while len(depths) < round_size and len(frontier):
+                    word, depth = frontier.pop()
+                    if word not in done:
+                        depths[word] = depth
+                if not depths:
+                    continue
+                self._scrape_pages(list(depths), on_result, concurrency, parse_workers, resolve=True)
+                
+                print(f"Crawled {scraped} words; {len(frontier)} queued, {len(frontier.seen)} seen")
+                if time.monotonic() - last_save >= CRAWL_SAVE_INTERVAL:
+                    frontier.save()
+                    self.aliases.save()
+                    last_save = time.monotonic()
+        
+        finally:
+            # Words taken for an interrupted round go back to the frontier
+            for word, depth in depths.items():
+                frontier.requeue(word, depth)
+            saved = writer.close()
+            frontier.save()
+            self.aliases.save()
+        
+        print(f"Crawled {scraped} words ({saved} entries) in {time.monotonic() - started:.0f}s. "
+              f"Data saved to {output_file}; {len(frontier)} words left in {crawl_dir}")
+        return output_file
+    
+    def _scrape_words_batched(self, words: List[str], on_result: Callable[[str, Dict[str, Any]], None]):
+        """Scrape words using a fetcher that retrieves many pages per request.
+        
+        Args:
+            words: Words to scrape
+            on_result: Called with (word, word_data) as each word finishes
+        """
+        batch_size = getattr(self.curl_wrapper, "batch_size", 50)
+        for start in range(0, len(words), batch_size):
+            batch = words[start:start + batch_size]
+            print(f"[{start+1}-{start+len(batch)}/{len(words)}] Fetching batch...")
+            pages = self.curl_wrapper.fetch_batch(batch)
+            for word in batch:
+                word_data = {}
+                try:
+                    if pages.get(word):
+                        word_data = self.parse_page(word, pages[word])
+                except Exception as e:
+                    print(f"Error scraping '{word}': {str(e)}")
+                on_result(word, word_data)
+    
+    async def _scrape_words_async(self, words: List[str], concurrency: int,
+                                  on_result: Callable[[str, Dict[str, Any]], None]):
+        """Scrape words with several requests in flight at once.
+        
+        Fetches run on a thread pool and share the fetcher's token bucket, so
+        the aggregate request rate stays within budget. Each page is parsed on
+        the event loop thread as soon as it arrives while the remaining
+        fetches keep downloading.
+        
+        Args:
+            words: Words to scrape
+            concurrency: Maximum number of requests in flight
+            on_result: Called with (word, word_data) as each word finishes
+                (word_data is empty when scraping failed)
+        """
+        loop = asyncio.get_running_loop()
+        completed = 0
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            async def fetch(word):
+                try:
+                    html_content = await loop.run_in_executor(executor, self.curl_wrapper.fetch_page, word)
+                except Exception as e:
+                    print(f"Error fetching '{word}': {str(e)}")
+                    html_content = None
+                return word, html_content
+            
+            def collect(task):
+                nonlocal completed
+                completed += 1
+                word, html_content = task.result()
+                word_data = {}
+                try:
+                    print(f"[{completed}/{len(words)}] Scraped '{word}'")
+                    if not html_content:
+                        print(f"Failed to retrieve page for '{word}'")
+                    else:
+                        word_data = self.parse_page(word, html_content)
+                except Exception as e:
+                    print(f"Error scraping '{word}': {str(e)}")
+                on_result(word, word_data)
             
-            except Exception as e:
-                print(f"Error scraping '{word}': {str(e)}")
+            pending = set()
+            for word in words:
+                if len(pending) >= concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        collect(task)
+                pending.add(asyncio.ensure_future(fetch(word)))
+            
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    collect(task)
+    
+    def scrape_dump(self, dump_file: str, output_file: Optional[str] = None,
+                    workers: Optional[int] = None, output_format: Optional[str] = None):
+        """Extract every word in this language from a Wiktionary XML dump.
         
-        # Save results
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        Dumps hold wikitext, so records lack the fields filled by computed
+        templates (see WIKITEXT_WARNING). The words of such records are
+        written to "<output_file>.incomplete.txt", a word list for an online
+        scrape that completes them.
+        
+        Args:
+            dump_file: Path to a pages-articles dump (.xml, .xml.bz2 or .xml.gz)
+            output_file: Path to save the extracted data
+            workers: Number of parser processes (default: CPU count)
+            output_format: "json", "jsonl" or "jsonl.gz" (inferred from output_file if omitted)
+        """
+        if not os.path.exists(dump_file):
+            print(f"Dump file not found: {dump_file}")
+            return
+        
+        # Dumps are large, so stream records unless "json" is asked for explicitly
+        output_format = output_format or ("jsonl.gz" if output_file and output_file.endswith(".jsonl.gz") else "jsonl")
+        output_file = output_file or os.path.join(
+            self.output_dir,
+            f"wiktionary_{self.lang_code}_dump.{output_format}"
+        )
+        writer = open_result_writer(output_file, output_format)
+        
+        print(f"Reading {self.language_name} entries from {dump_file}...")
+        print(WIKITEXT_WARNING)
+        
+        pipeline = ParsePipeline(self.lang_code, workers=workers, parser=self.parser)
+        pages = iter_dump_pages(dump_file, self.language_name)
+        incomplete_file = f"{output_file}.incomplete.txt"
+        incomplete = 0
+        try:
+            with open(incomplete_file, "w", encoding="utf-8") as incomplete_words:
+                for i, (word, word_data) in enumerate(pipeline.parse_wikitext_pages(pages)):
+                    if word_data:
+                        if "incomplete_fields" in word_data:
+                            incomplete += 1
+                            incomplete_words.write(f"{word}\n")
+                        writer.add(word, self.annotate_frequency(word, word_data))
+                    if (i + 1) % 1000 == 0:
+                        print(f"Processed {i+1} pages...")
+        finally:
+            saved = writer.close()
         
-        print(f"Scraped {len(results)} words. Data saved to {output_file}")
+        print(f"Extracted {saved} words. Data saved to {output_file}")
+        self._report_incomplete(incomplete, saved, incomplete_file)
         return output_file
     
     def scrape_frequency_list(self, count: int = 1000, output_file: Optional[str] = None):
@@ -543,21 +1046,81 @@ def main():
     """Main function to run the scraper from command line."""
     parser = argparse.ArgumentParser(description="Scrape word data from Wiktionary")
     
-    parser.add_argument("--lang", type=str, default="es", help="Language code to scrape (default: es)")
+    parser.add_argument("--lang", type=str, default="es", help="Language code or name to scrape (default: es)")
     parser.add_argument("--word", type=str, help="Single word to scrape")
     parser.add_argument("--word-list", type=str, help="File with words to scrape (one per line)")
     parser.add_argument("--frequency", type=int, help="Scrape top N most frequent words")
     parser.add_argument("--output", type=str, help="Output file path (default: auto-generated)")
     parser.add_argument("--rate-limit", type=float, default=1.0, 
                         help="Seconds to wait between requests (default: 1.0)")
+    parser.add_argument("--adaptive-rate", action="store_true",
+                        help="Start at --rate-limit, speed up while responses are healthy and back off on 429/5xx")
+    parser.add_argument("--max-rate", type=float,
+                        help="Upper bound in requests/second for --adaptive-rate (default: 10x the starting rate)")
+    parser.add_argument("--backend", type=str, default="curl", choices=sorted(FETCHER_BACKENDS),
+                        help="Fetcher backend: curl subprocess or pooled in-process http (default: curl)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Requests to keep in flight when scraping a word list (default: 1)")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="Parser processes for word lists and --html-dir (default: 0, parse inline)")
+    parser.add_argument("--parser", type=str, default="html.parser", choices=sorted(PARSER_BACKENDS),
+                        help="HTML parser backend; 'fast' parses only the target language section (default: html.parser)")
+    parser.add_argument("--cache-dir", type=str, help="Directory for the persistent page cache")
+    parser.add_argument("--max-age", type=float,
+                        help="Seconds to use cached pages without revalidating (default: always revalidate)")
+    parser.add_argument("--offline", action="store_true", help="Only use cached pages, never the network")
+    parser.add_argument("--format", type=str, choices=OUTPUT_FORMATS,
+                        help="Output format: indented JSON, JSON Lines streamed per word, or gzip'd "
+                             "JSON Lines with a random-access index (default: from the --output extension, else json)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue a JSON Lines run, skipping words already scraped or failed")
+    parser.add_argument("--dump", type=str,
+                        help="Extract all entries from a pages-articles XML dump (.xml, .bz2 or .gz); "
+                             "not equivalent to scraping: entries lack word_forms and often IPA, which "
+                             "dumps only hold as templates, and their words are listed in "
+                             "<output>.incomplete.txt for an online --word-list run")
+    parser.add_argument("--html-dir", type=str, help="Re-parse a directory of saved <word>.html pages")
+    parser.add_argument("--refresh", type=str, metavar="PREVIOUS",
+                        help="With --word-list: re-scrape only words whose page changed since the "
+                             "results in PREVIOUS, writing the changes to --delta")
+    parser.add_argument("--delta", type=str, help="Output file for the records changed by --refresh")
+    parser.add_argument("--crawl", type=str, metavar="DIR",
+                        help="Crawl from the --word-list seeds through related words, synonyms and antonyms, "
+                             "most frequent first, keeping the resumable frontier in DIR")
+    parser.add_argument("--max-pages", type=int, help="With --crawl: stop after scraping this many words")
+    parser.add_argument("--max-time", type=float, metavar="SECONDS",
+                        help="With --crawl: stop after this many seconds")
+    parser.add_argument("--max-depth", type=int, help="With --crawl: only follow links this far from the seeds")
+    parser.add_argument("--metrics", type=str, metavar="FILE",
+                        help="Record fetch, rate-limit wait, parse and per-extractor timings and "
+                             "write a JSON summary with histograms to FILE")
+    parser.add_argument("--progress", type=float, metavar="SECONDS",
+                        help="Print a progress line with words/sec and ETA every SECONDS while scraping a word list")
+    parser.add_argument("--aliases", type=str, metavar="FILE",
+                        help="JSON file recording the page each word redirects to, so words sharing a "
+                             "page are fetched once (default: wiktionary_aliases.json in the output directory)")
+    parser.add_argument("--resolve-aliases", action="store_true",
+                        help="Before scraping, look up which page unknown words redirect to through the "
+                             "MediaWiki API (50 words per request, Python HTTP client even with --backend curl)")
+    parser.add_argument("--frequency-index", type=str,
+                        help="Frequency index (.idx) from frequency_list_scraper.py; scrapes word lists "
+                             "most frequent first and stores each word's rank as 'frequency'")
     
     args = parser.parse_args()
+    args.lang = languages.resolve(args.lang) or args.lang
     
-    scraper = WiktionaryScraper(lang_code=args.lang, rate_limit=args.rate_limit)
+    if args.metrics:
+        metrics.reset(enabled=True)
+    
+    scraper = WiktionaryScraper(lang_code=args.lang, rate_limit=args.rate_limit, backend=args.backend,
+                                cache_dir=args.cache_dir, cache_max_age=args.max_age, offline=args.offline,
+                                parser=args.parser, frequency_index=args.frequency_index,
+                                adaptive_rate=args.adaptive_rate, max_rate=args.max_rate,
+                                alias_file=args.aliases, resolve_aliases=args.resolve_aliases)
     
     if args.word:
         # Scrape a single word
-        word_data = scraper.scrape_word(args.word)
+        word_data = scraper.annotate_frequency(args.word, scraper.scrape_word(args.word))
         if word_data:
             output_file = args.output or os.path.join(
                 scraper.output_dir, 
@@ -569,16 +1132,54 @@ def main():
         else:
             print(f"No data found for '{args.word}'")
     
+    elif args.crawl:
+        # Grow the dictionary from seed words
+        scraper.crawl(args.crawl, args.word_list, args.output, max_pages=args.max_pages,
+                      max_time=args.max_time, max_depth=args.max_depth, concurrency=args.concurrency,
+                      parse_workers=args.parse_workers, output_format=args.format)
+    
+    elif args.word_list and args.refresh:
+        # Incremental update of a previous run
+        scraper.refresh_word_list(args.word_list, args.refresh, args.output, delta_file=args.delta,
+                                  concurrency=args.concurrency, parse_workers=args.parse_workers,
+                                  output_format=args.format)
+    
     elif args.word_list:
         # Scrape a list of words
-        scraper.scrape_word_list(args.word_list, args.output)
+        scraper.scrape_word_list(args.word_list, args.output, concurrency=args.concurrency,
+                                 parse_workers=args.parse_workers, output_format=args.format,
+                                 resume=args.resume, progress_interval=args.progress)
+    
+    elif args.dump:
+        # Offline ingestion of a full Wiktionary dump
+        scraper.scrape_dump(args.dump, args.output, workers=args.parse_workers or None,
+                            output_format=args.format)
+    
+    elif args.html_dir:
+        # Re-parse saved pages without touching the network
+        pipeline = ParsePipeline(args.lang, workers=args.parse_workers or None, parser=args.parser)
+        results = {
+            word: scraper.annotate_frequency(word, word_data)
+            for word, word_data in pipeline.parse_pages(iter_html_dir(args.html_dir))
+            if word_data
+        }
+        output_file = args.output or os.path.join(
+            scraper.output_dir,
+            f"wiktionary_{args.lang}_{len(results)}_reparsed.json"
+        )
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"Parsed {len(results)} pages. Data saved to {output_file}")
     
     elif args.frequency:
         # Scrape frequent words
         scraper.scrape_frequency_list(args.frequency, args.output)
     
     else:
-        print("Please specify --word, --word-list, or --frequency")
+        print("Please specify --word, --word-list, --crawl, --dump, --html-dir, or --frequency")
+    
+    if args.metrics:
+        metrics.write_summary(args.metrics)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+require 'json'
+require 'zlib'
+
+module DictionaryScraper
+  # Streams scraper output one word at a time.
+  #
+  # Supports the indented JSON object written by default (word => data, which
+  # has to be parsed in one go), JSON Lines (.jsonl, one word_data per line) and
+  # gzip'd JSON Lines (.jsonl.gz, written as several concatenated gzip members).
+  class ResultReader
+    include Enumerable
+
+    def initialize(file_path)
+      @file_path = file_path
+    end
+
+    # Yields (word_text, word_data) for every record in the file
+    def each
+      return enum_for(:each) unless block_given?
+
+      if @file_path.end_with?('.gz')
+        each_gzip_line { |line| yield record_from_line(line) }
+      elsif @file_path.end_with?('.jsonl')
+        File.foreach(@file_path) { |line| yield record_from_line(line) unless line.strip.empty? }
+      else
+        JSON.parse(File.read(@file_path)).each { |word_text, word_data| yield word_text, word_data }
+      end
+    end
+
+    private
+
+    def record_from_line(line)
+      word_data = JSON.parse(line)
+      [word_data['text'], word_data]
+    end
+
+    # GzipReader stops after one member, so restart it on whatever input remains
+    def each_gzip_line
+      File.open(@file_path, 'rb') do |io|
+        until io.eof?
+          gz = Zlib::GzipReader.new(io)
+          gz.each_line { |line| yield line unless line.strip.empty? }
+          unused = gz.unused
+          gz.finish
+          io.pos -= unused.bytesize if unused
+        end
+      end
+    end
+  end
+end
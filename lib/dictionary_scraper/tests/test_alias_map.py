@@ -0,0 +1,57 @@
+import json
+
+from alias_map import AliasMap
+from wiktionary_scraper import WiktionaryScraper
+
+
+def test_resolve_defaults_to_the_word_itself():
+    aliases = AliasMap()
+    aliases.record("Casa", "casa")
+    aliases.record("casa", "casa")
+    assert aliases.resolve("Casa") == "casa"
+    assert aliases.resolve("perro") == "perro"
+    assert "casa" in aliases and len(aliases) == 2
+    assert aliases.aliases() == {"Casa": "casa"}
+    # Nothing to save without a file
+    aliases.save()
+
+
+def test_saves_only_changes_and_reloads(tmp_path):
+    path = tmp_path / "aliases" / "wiktionary_aliases.json"
+    aliases = AliasMap(str(path))
+    aliases.save()
+    assert not path.exists()
+    aliases.record("Niño", "niño")
+    aliases.save()
+    assert json.loads(path.read_text(encoding="utf-8")) == {"Niño": "niño"}
+    assert AliasMap(str(path)).resolve("Niño") == "niño"
+
+
+def test_unreadable_file_starts_empty(tmp_path, capsys):
+    path = tmp_path / "wiktionary_aliases.json"
+    path.write_text("{not json", encoding="utf-8")
+    aliases = AliasMap(str(path))
+    assert len(aliases) == 0
+    assert "Error reading alias map" in capsys.readouterr().out
+
+
+def test_words_sharing_a_page_are_fetched_once(tmp_path, monkeypatch):
+    scraper = WiktionaryScraper(output_dir=str(tmp_path))
+    scraper.aliases.record("Casa", "casa")
+    fetched = []
+
+    def scrape_words(words, on_page, concurrency, parse_workers):
+        fetched.extend(words)
+        for word in words:
+            on_page(word, {"text": word, "definitions": ["house"]} if word != "xyzzy" else {})
+    monkeypatch.setattr(scraper, "_scrape_words", scrape_words)
+
+    results = {}
+    scraper._scrape_pages(["casa", "Casa", "xyzzy"], results.__setitem__)
+
+    assert fetched == ["casa", "xyzzy"]
+    assert results["casa"] == {"text": "casa", "definitions": ["house"]}
+    assert results["Casa"] == {"text": "Casa", "definitions": ["house"], "canonical_title": "casa"}
+    assert results["xyzzy"] == {}
+    # Failed words are not recorded, so they are looked up again next time
+    assert "xyzzy" not in scraper.aliases
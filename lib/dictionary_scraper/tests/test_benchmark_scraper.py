@@ -0,0 +1,26 @@
+import json
+
+from benchmark_scraper import DEFAULT_BASELINE, DEFAULT_CORPUS, DEFAULT_CORPUS_WORDS, ScraperBenchmark
+from parse_pipeline import iter_html_dir
+
+
+def test_checked_in_corpus_parses_offline():
+    pages = list(iter_html_dir(DEFAULT_CORPUS))
+    with open(DEFAULT_CORPUS_WORDS, encoding="utf-8") as f:
+        words = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    assert sorted(word for word, _ in pages) == sorted(words)
+
+    result = ScraperBenchmark(pages).run(iterations=1)
+
+    assert result["errors"] == {}
+    assert result["pages"] == len(words)
+
+
+def test_baseline_was_recorded_on_the_checked_in_corpus():
+    revisions = ScraperBenchmark(list(iter_html_dir(DEFAULT_CORPUS))).revisions()
+    with open(DEFAULT_BASELINE, encoding="utf-8") as f:
+        baselines = json.load(f)
+    assert "html.parser" in baselines
+    for baseline in baselines.values():
+        assert baseline["revisions"] == revisions
+        assert baseline["errors"] == {}
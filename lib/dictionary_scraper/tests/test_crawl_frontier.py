@@ -0,0 +1,73 @@
+import pytest
+
+from crawl_frontier import BloomFilter, CrawlFrontier
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    words = [f"palabra{i}" for i in range(1000)]
+    for word in words:
+        bloom.add(word)
+    assert all(word in bloom for word in words)
+    assert not bloom.add("palabra0")
+    # add() only counts words that set a new bit, so a false positive is not counted
+    assert 990 <= len(bloom) <= 1000
+
+
+def test_bloom_filter_false_positive_rate_at_capacity():
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    for i in range(2000):
+        bloom.add(f"seen{i}")
+    false_positives = sum(f"unseen{i}" in bloom for i in range(20000))
+    assert false_positives / 20000 < 0.02
+
+
+def test_bloom_filter_round_trip(tmp_path):
+    path = str(tmp_path / "seen.bloom")
+    bloom = BloomFilter(capacity=100)
+    bloom.add("gato")
+    bloom.save(path)
+    loaded = BloomFilter.load(path)
+    assert "gato" in loaded and "perro" not in loaded
+    assert (loaded.bit_count, loaded.hash_count, len(loaded)) == (bloom.bit_count, bloom.hash_count, 1)
+
+    with open(path, "r+b") as f:
+        f.truncate(f.seek(0, 2) - 1)
+    with pytest.raises(ValueError):
+        BloomFilter.load(path)
+
+
+def test_frontier_orders_by_rank_then_depth_then_discovery(tmp_path):
+    ranks = {"de": 1, "casa": 40}
+    frontier = CrawlFrontier(str(tmp_path), rank=ranks.get, capacity=100)
+    for word, depth in [("gato", 1), ("michi", 2), ("casa", 2), ("felino", 1), ("de", 3)]:
+        assert frontier.add(word, depth)
+    assert not frontier.add("gato", 0)
+    assert [frontier.pop() for _ in range(5)] == [("de", 3), ("casa", 2), ("gato", 1), ("felino", 1), ("michi", 2)]
+    assert frontier.pop() is None
+
+
+def test_false_positive_only_skips_the_word(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path), capacity=100)
+    # A saturated filter reports every word as seen
+    frontier.seen.bits = bytearray(b"\xff" * len(frontier.seen.bits))
+    assert not frontier.add("gato")
+    assert len(frontier) == 0
+
+
+def test_resume_restores_queue_and_seen_words(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path), capacity=100)
+    for word in ["gato", "perro", "casa"]:
+        frontier.add(word, 1)
+    word, depth = frontier.pop()
+    # Put back behind the words queued with it
+    frontier.requeue(word, depth)
+    assert frontier.pop() == ("perro", 1)
+    frontier.save()
+
+    resumed = CrawlFrontier(str(tmp_path), capacity=100)
+    assert resumed.resumed
+    assert resumed.queued() == {"casa": 1, "gato": 1}
+    # Words already scraped are not queued again
+    assert not resumed.add("perro")
+    assert resumed.pop() == ("casa", 1)
@@ -0,0 +1,98 @@
+import bz2
+import gzip
+import json
+
+import pytest
+
+from dump_reader import extract_language_section, iter_dump_pages
+from wiktionary_scraper import WiktionaryScraper
+
+EXPORT = """<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.11/">
+  <siteinfo><sitename>Wiktionary</sitename></siteinfo>
+{pages}
+</mediawiki>
+"""
+PAGE = """  <page>
+    <title>{title}</title>
+    <ns>{ns}</ns>
+    {redirect}<revision><id>1</id><text xml:space="preserve">{text}</text></revision>
+  </page>"""
+
+GATO = """==English==
+===Noun===
+# {{l|en|gato}}
+
+==Spanish==
+===Pronunciation===
+* {{IPA|es|/ˈɡato/}}
+
+===Noun===
+{{es-noun|m}}
+
+# [[cat]]
+
+==Portuguese==
+===Noun===
+# [[cat]]"""
+
+HABLAR = """==Spanish==
+===Pronunciation===
+{{es-pr}}
+
+===Verb===
+{{es-verb}}
+
+# to [[speak]]
+
+====Conjugation====
+{{es-conj}}"""
+
+
+def page(title, text, ns=0, redirect=False):
+    return PAGE.format(title=title, ns=ns, text=text,
+                       redirect='<redirect title="gato" />' if redirect else "")
+
+
+@pytest.fixture(params=[".xml", ".xml.bz2", ".xml.gz"])
+def dump_file(request, tmp_path):
+    xml = EXPORT.format(pages="\n".join([
+        page("gato", GATO),
+        page("hablar", HABLAR),
+        page("Gato", "#REDIRECT [[gato]]", redirect=True),
+        page("Talk:gato", GATO, ns=1),
+        page("cat", "==English==\n===Noun===\n# a feline"),
+    ])).encode("utf-8")
+    path = str(tmp_path / f"dump{request.param}")
+    opener = {".xml": open, ".xml.bz2": bz2.open, ".xml.gz": gzip.open}[request.param]
+    with opener(path, "wb") as f:
+        f.write(xml)
+    return path
+
+
+def test_extract_language_section_stops_at_the_next_language():
+    section = extract_language_section(GATO, "Spanish")
+    assert section.startswith("==Spanish==")
+    assert "===Noun===" in section and "Portuguese" not in section
+    assert extract_language_section(GATO, "French") is None
+
+
+def test_iter_dump_pages_yields_main_namespace_entries_of_the_language(dump_file):
+    pages = dict(iter_dump_pages(dump_file, "Spanish"))
+    assert sorted(pages) == ["gato", "hablar"]
+    assert pages["gato"].startswith("==Spanish==") and "English" not in pages["gato"]
+
+
+def test_scrape_dump_lists_words_with_incomplete_records(dump_file, tmp_path, capsys):
+    scraper = WiktionaryScraper(lang_code="es", output_dir=str(tmp_path / "out"))
+    output_file = str(tmp_path / "out" / "dump.jsonl")
+
+    scraper.scrape_dump(dump_file, output_file, workers=1)
+
+    with open(output_file, encoding="utf-8") as f:
+        records = {record["text"]: record for record in map(json.loads, f)}
+    assert sorted(records) == ["gato", "hablar"]
+    assert "incomplete_fields" not in records["gato"]
+    assert records["hablar"]["incomplete_fields"] == ["ipa_transcriptions", "word_forms"]
+    with open(f"{output_file}.incomplete.txt", encoding="utf-8") as f:
+        assert f.read() == "hablar\n"
+    assert f"--word-list {output_file}.incomplete.txt" in capsys.readouterr().out
@@ -0,0 +1,100 @@
+import email.utils
+import time
+
+import pytest
+
+import fetch_response
+import rate_limiter
+from fetch_response import FetchResponse, fetch_with_retries, is_missing_entry, retry_after_seconds
+from rate_limiter import AdaptiveRateLimiter, TokenBucket, backoff_delay
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Record backoff sleeps instead of waiting."""
+    sleeps = []
+    monkeypatch.setattr(fetch_response.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def responses(*statuses, headers=None):
+    """A send() returning the given statuses in turn (an exception for None)."""
+    remaining = list(statuses)
+
+    def send():
+        status = remaining.pop(0)
+        if status is None:
+            raise OSError("connection reset")
+        return FetchResponse(status, headers or {}, "page", "https://example.invalid/wiki/x")
+    return send
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds({"retry-after": "7"}) == 7.0
+    assert retry_after_seconds({}) is None
+    assert retry_after_seconds({"retry-after": "soon"}) is None
+    date = email.utils.formatdate(time.time() + 30, usegmt=True)
+    assert 25 <= retry_after_seconds({"retry-after": date}) <= 30
+
+
+def test_is_missing_entry():
+    assert is_missing_entry(None)
+    assert is_missing_entry("... Wiktionary does not have an entry for this term ...")
+    assert not is_missing_entry("<html>gato</html>")
+
+
+def test_transient_failures_are_retried(no_sleep):
+    response = fetch_with_retries(responses(503, None, 200), TokenBucket(0), 3, "x")
+    assert response.status == 200
+    assert len(no_sleep) == 2
+
+
+def test_gives_up_after_max_retries(no_sleep):
+    assert fetch_with_retries(responses(None, None), TokenBucket(0), 1, "x") is None
+    assert fetch_with_retries(responses(503, 502), TokenBucket(0), 1, "x").status == 502
+
+
+def test_client_errors_are_not_retried(no_sleep):
+    assert fetch_with_retries(responses(404), TokenBucket(0), 3, "x").status == 404
+    assert no_sleep == []
+
+
+def test_retry_after_pauses_the_shared_limiter():
+    bucket = TokenBucket(0)
+    fetch_with_retries(responses(429, 200, headers={"retry-after": "30"}), bucket, 1, "x")
+    assert bucket.paused_until - time.monotonic() > 25
+
+
+def test_adaptive_rate_increases_and_backs_off(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    limiter = AdaptiveRateLimiter(rate=1.0, max_rate=1.1, increase=0.05, decrease=0.5, cooldown=1.0)
+
+    limiter.record_success()
+    limiter.record_success()
+    limiter.record_success()
+    assert limiter.current_rate == pytest.approx(1.1)
+
+    limiter.record_throttle()
+    limiter.record_throttle()  # Same congestion event, within the cooldown
+    assert limiter.current_rate == pytest.approx(0.55)
+    now[0] += 1.0
+    for _ in range(10):
+        limiter.record_throttle()
+        now[0] += 1.0
+    assert limiter.current_rate == limiter.min_rate
+
+
+def test_fetch_with_retries_reports_to_an_adaptive_limiter(monkeypatch):
+    limiter = AdaptiveRateLimiter(rate=0)
+    calls = []
+    monkeypatch.setattr(limiter, "record_success", lambda: calls.append("success"))
+    monkeypatch.setattr(limiter, "record_throttle", lambda: calls.append("throttle"))
+    fetch_with_retries(responses(503, 200), limiter, 2, "x")
+    assert calls == ["throttle", "success"]
+
+
+def test_backoff_delay_is_capped_full_jitter():
+    for attempt in range(10):
+        delay = backoff_delay(attempt, base=1.0, cap=8.0)
+        assert 0 <= delay <= min(8.0, 2 ** attempt)
@@ -0,0 +1,54 @@
+import pytest
+
+from frequency_index import FrequencyIndex, index_path_for, write_frequency_index
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    path = str(tmp_path / "es.idx")
+    write_frequency_index(path, [("de", 50.0), ("la", 40.0), ("niño", 12.5), ("de", 1.0), ("casa", 10)])
+    return path
+
+
+def test_lookup_returns_rank_and_frequency(index_path):
+    with FrequencyIndex(index_path) as index:
+        assert len(index) == 4
+        assert index.lookup("de") == (1, 50.0)
+        assert index.lookup("niño") == (3, 12.5)
+        assert index.rank("casa") == 4
+        assert index.lookup("gato") is None
+        assert index.rank("gato") is None
+        assert "la" in index and "La" not in index
+
+
+def test_words_are_in_utf8_byte_order(index_path):
+    with FrequencyIndex(index_path) as index:
+        assert list(index.words()) == ["casa", "de", "la", "niño"]
+
+
+def test_every_word_is_found_through_colliding_slots(tmp_path):
+    path = str(tmp_path / "big.idx")
+    words = [f"w{i}" for i in range(3000)]
+    assert write_frequency_index(path, ((word, 3000 - i) for i, word in enumerate(words))) == 3000
+    with FrequencyIndex(path) as index:
+        assert all(index.rank(word) == i + 1 for i, word in enumerate(words))
+        assert "w3000" not in index
+
+
+def test_empty_index(tmp_path):
+    path = str(tmp_path / "empty.idx")
+    write_frequency_index(path, [])
+    with FrequencyIndex(path) as index:
+        assert len(index) == 0
+        assert index.lookup("de") is None
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "words.idx"
+    path.write_bytes(b"de 50\nla 40\n" * 4)
+    with pytest.raises(ValueError):
+        FrequencyIndex(str(path))
+
+
+def test_index_path_for():
+    assert index_path_for("frequency_lists/es/es_frequency.txt") == "frequency_lists/es/es_frequency.idx"
@@ -0,0 +1,257 @@
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from frequency_index import FrequencyIndex, index_path_for
+from frequency_list_scraper import FrequencyListScraper
+
+LIST_TEXT = "de 50\nla 40\ncasa 10\n"
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    scraper = FrequencyListScraper(output_dir=str(tmp_path))
+    # Sources are written into the language directory by the tests instead
+    monkeypatch.setattr(scraper, "download_file", lambda url, path, revalidate=None: True)
+    os.makedirs(os.path.join(scraper.output_dir, "xx"))
+    return scraper
+
+
+def use_source(scraper, filename, **source):
+    """Make a line-format source the only one of language "xx"; returns its download path."""
+    scraper.frequency_sources = {"xx": [dict(name="Test", url=f"https://example.invalid/{filename}",
+                                             format="line", pattern=r"^(\S+) (\d+)$", **source)]}
+    return os.path.join(scraper.output_dir, "xx", filename)
+
+
+def track_streams(scraper, monkeypatch):
+    """Record every stream open_archive_member hands out."""
+    opened = []
+    open_member = scraper.open_archive_member
+
+    def tracking(*args, **kwargs):
+        stream = open_member(*args, **kwargs)
+        opened.append(stream)
+        return stream
+    monkeypatch.setattr(scraper, "open_archive_member", tracking)
+    return opened
+
+
+def test_zip_member_is_closed_after_reading(scraper, monkeypatch):
+    with zipfile.ZipFile(use_source(scraper, "list.zip", file_in_archive="list.txt"), "w") as archive:
+        archive.writestr("list.txt", LIST_TEXT)
+    opened = track_streams(scraper, monkeypatch)
+
+    table, total = scraper.get_top_frequencies("xx", 2)
+
+    assert table.pairs() == [("de", 50), ("la", 40)]
+    assert total == 100
+    assert len(opened) == 1 and opened[0].closed
+
+
+def test_gzip_member_is_closed_after_reading(scraper, monkeypatch):
+    with gzip.open(use_source(scraper, "list.txt.gz"), "wt", encoding="utf-8") as f:
+        f.write(LIST_TEXT)
+    opened = track_streams(scraper, monkeypatch)
+
+    assert scraper.get_top_frequencies("xx", 5)[1] == 100
+    assert len(opened) == 1 and opened[0].closed
+
+
+def test_extracted_copy_is_closed_after_reading(scraper, monkeypatch):
+    archive_path = use_source(scraper, "list.txt.gz")
+    with gzip.open(archive_path, "wt", encoding="utf-8") as f:
+        f.write("")
+    with open(archive_path[:-3], "w", encoding="utf-8") as f:
+        f.write(LIST_TEXT)
+    opened = track_streams(scraper, monkeypatch)
+
+    assert scraper.get_top_frequencies("xx", 5)[1] == 100
+    assert len(opened) == 1 and opened[0].closed
+
+
+
+def test_csv_rows_are_streamed_by_column_name(scraper):
+    rows = io.StringIO("word,count\nDe,50\nniño,12.0\n123,9\ncasa,0\n")
+    assert list(scraper.iter_csv_file(rows, "word", "count")) == [("de", 50), ("niño", 12)]
+
+
+def test_line_rows_are_streamed_lazily(scraper):
+    lines = iter(["de 50\n", "not a row\n", "la 40\n"])
+    rows = scraper.iter_line_file(lines, r"^(\S+) (\d+)$")
+    # Nothing is read before the first row is asked for
+    assert next(rows) == ("de", 50)
+    assert next(lines) == "not a row\n"
+    assert list(rows) == [("la", 40)]
+
+
+def test_case_variants_are_counted_as_one_word(scraper):
+    with open(use_source(scraper, "list.txt"), "w", encoding="utf-8") as f:
+        f.write("de 50\nEl 30\nla 40\nel 25\n")
+
+    table, total = scraper.get_top_frequencies("xx", 2)
+
+    assert table.pairs() == [("el", 55), ("de", 50)]
+    assert total == 145
+
+
+def test_word_list_with_repeated_words_is_refused(tmp_path):
+    output_path = str(tmp_path / "list.txt")
+    with pytest.raises(ValueError, match="repeats words: el"):
+        FrequencyListScraper.save_word_list(output_path, [("el", 2.0), ("la", 1.0), ("el", 0.5)])
+    assert not os.path.exists(output_path)
+
+
+def test_word_list_is_written_with_its_index(tmp_path):
+    output_path = str(tmp_path / "list.txt")
+    FrequencyListScraper.save_word_list(output_path, [("el", 2.0), ("la", 1.0)])
+    with open(output_path, encoding="utf-8") as f:
+        assert f.read() == "el\nla\n"
+    with FrequencyIndex(index_path_for(output_path)) as index:
+        assert index.lookup("la") == (2, 1.0)
+
+
+
+def test_sources_are_merged_by_frequency_per_million(scraper):
+    source = dict(format="line", pattern=r"^(\S+) (\d+)$")
+    scraper.frequency_sources = {"xx": [dict(name="Small", url="https://example.invalid/small.txt", **source),
+                                        dict(name="Large", url="https://example.invalid/large.txt", **source)]}
+    # Per million: de 500k, la 300k, casa 200k (small); la 600k, de 300k, casa 100k (large)
+    with open(os.path.join(scraper.output_dir, "xx", "small.txt"), "w", encoding="utf-8") as f:
+        f.write("de 5000\nla 3000\ncasa 2000\n")
+    with open(os.path.join(scraper.output_dir, "xx", "large.txt"), "w", encoding="utf-8") as f:
+        f.write("la 60000\ncasa 10000\nde 30000\n")
+
+    output_path = scraper.generate_complete_wordlist("xx", limit_per_source=3)
+
+    with open(output_path, encoding="utf-8") as f:
+        assert f.read().split() == ["la", "de", "casa"]
+    with FrequencyIndex(index_path_for(output_path)) as index:
+        assert index.lookup("la") == (1, 600_000.0)
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    """Serves one file with an ETag, honouring Range/If-Range and If-None-Match."""
+    body = b""
+    etag = '"v1"'
+    truncate_at = None  # Close the next response after this many bytes
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        start = 0
+        byte_range = self.headers.get("Range")
+        if byte_range and self.headers.get("If-Range") == self.etag:
+            start = int(byte_range[len("bytes="):-1])
+        data = self.body[start:]
+        self.send_response(206 if start else 200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if self.truncate_at is not None:
+            data = data[:self.truncate_at]
+            FileHandler.truncate_at = None
+            self.close_connection = True
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def file_url():
+    server = HTTPServer(("127.0.0.1", 0), FileHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    FileHandler.body = b"".join(b"palabra%d %d\n" % (i, 10000 - i) for i in range(20000))
+    FileHandler.etag = '"v1"'
+    FileHandler.truncate_at = None
+    FileHandler.requests = []
+    yield f"http://127.0.0.1:{server.server_port}/list.txt"
+    server.shutdown()
+    server.server_close()
+
+
+def test_download_records_a_manifest(tmp_path, file_url):
+    target = str(tmp_path / "list.txt")
+    assert FrequencyListScraper(output_dir=str(tmp_path)).download_file(file_url, target)
+    with open(target, "rb") as f:
+        assert f.read() == FileHandler.body
+    with open(f"{target}.manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert manifest["etag"] == '"v1"'
+    assert manifest["size"] == len(FileHandler.body)
+    assert manifest["sha256"] == hashlib.sha256(FileHandler.body).hexdigest()
+    assert not os.path.exists(f"{target}.part")
+
+
+def test_truncated_download_is_resumed(tmp_path, file_url):
+    scraper = FrequencyListScraper(output_dir=str(tmp_path))
+    target = str(tmp_path / "list.txt")
+    FileHandler.truncate_at = 200000
+
+    assert not scraper.download_file(file_url, target)
+    assert not os.path.exists(target)
+    # The chunks received before the connection dropped are kept
+    received = os.path.getsize(f"{target}.part")
+    assert 0 < received <= 200000
+
+    assert scraper.download_file(file_url, target)
+    assert FileHandler.requests[-1]["Range"] == f"bytes={received}-"
+    with open(target, "rb") as f:
+        assert f.read() == FileHandler.body
+    with open(f"{target}.manifest.json", encoding="utf-8") as f:
+        assert json.load(f)["sha256"] == hashlib.sha256(FileHandler.body).hexdigest()
+
+
+def test_changed_file_is_downloaded_whole_instead_of_resumed(tmp_path, file_url):
+    scraper = FrequencyListScraper(output_dir=str(tmp_path))
+    target = str(tmp_path / "list.txt")
+    FileHandler.truncate_at = 200000
+    scraper.download_file(file_url, target)
+
+    FileHandler.body = b"de 50\nla 40\n"
+    FileHandler.etag = '"v2"'
+    assert scraper.download_file(file_url, target)
+    with open(target, "rb") as f:
+        assert f.read() == b"de 50\nla 40\n"
+
+
+def test_verified_download_is_reused_or_revalidated(tmp_path, file_url):
+    scraper = FrequencyListScraper(output_dir=str(tmp_path))
+    target = str(tmp_path / "list.txt")
+    scraper.download_file(file_url, target)
+
+    assert scraper.download_file(file_url, target)
+    assert len(FileHandler.requests) == 1
+
+    assert scraper.download_file(file_url, target, revalidate=True)
+    assert FileHandler.requests[-1]["If-None-Match"] == '"v1"'
+    with open(target, "rb") as f:
+        assert f.read() == FileHandler.body
+
+
+def test_corrupted_download_is_fetched_again(tmp_path, file_url):
+    scraper = FrequencyListScraper(output_dir=str(tmp_path))
+    target = str(tmp_path / "list.txt")
+    scraper.download_file(file_url, target)
+    with open(target, "r+b") as f:
+        f.write(b"X")
+        # Keep the size and bump the mtime, so only the checksum tells
+        os.utime(target, ns=(0, os.stat(target).st_mtime_ns + 10 ** 9))
+
+    assert scraper.download_file(file_url, target)
+    assert len(FileHandler.requests) == 2
+    with open(target, "rb") as f:
+        assert f.read() == FileHandler.body
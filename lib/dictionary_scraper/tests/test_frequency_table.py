@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+import frequency_table
+from frequency_table import FrequencyTable, rank_normalized, top_frequencies
+
+
+@pytest.fixture(params=["numpy", "plain"])
+def backend(request, monkeypatch):
+    """Run a test with NumPy (when installed) and with the plain-list fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(frequency_table, "np", None)
+    return request.param
+
+
+def test_top_keeps_highest_counts_in_source_order_on_ties(backend):
+    table = FrequencyTable(["a", "b", "c", "d", "e"], [1, 3, 2, 3, 3])
+    assert table.top(2).pairs() == [("b", 3), ("d", 3)]
+    assert table.top(10).pairs() == [("b", 3), ("d", 3), ("e", 3), ("c", 2), ("a", 1)]
+    assert table.top(0).pairs() == []
+
+
+def test_from_pairs_sums_repeated_words(backend):
+    table = FrequencyTable.from_pairs([("el", 5), ("la", 4), ("el", 3)])
+    assert table.pairs() == [("el", 8), ("la", 4)]
+    assert table.total == 12
+
+
+def test_top_frequencies_merges_repeated_words(backend):
+    rows = [("de", 7), ("el", 5), ("la", 6), ("el", 3)]
+    table, total = top_frequencies(iter(rows), 2)
+    assert table.pairs() == [("el", 8), ("de", 7)]
+    assert total == 21
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1 << 20])
+def test_spilled_runs_match_in_memory_selection(backend, chunk_size):
+    rows = [("c", 1), ("a", 2), ("b", 2), ("a", 1), ("d", 3), ("c", 2), ("e", 3)]
+    table, total = top_frequencies(iter(rows), 4, chunk_size=chunk_size)
+    assert table.pairs() == [("c", 3), ("a", 3), ("d", 3), ("e", 3)]
+    assert total == 14
+
+
+def test_spilled_runs_match_on_a_larger_list(backend):
+    rng = random.Random(7)
+    rows = [(f"w{rng.randrange(500)}", rng.randrange(1, 50)) for _ in range(5000)]
+    expected = FrequencyTable.from_pairs(rows).top(100).pairs()
+    table, total = top_frequencies(iter(rows), 100, chunk_size=64)
+    assert table.pairs() == expected
+    assert len({word for word, _ in table.pairs()}) == 100
+    assert total == sum(count for _, count in rows)
+
+
+def test_zipf_and_per_million(backend):
+    table = FrequencyTable(["a", "b"], [1000, 10])
+    assert list(table.per_million(1_000_000)) == [1000.0, 10.0]
+    assert [round(value, 6) for value in table.zipf(1_000_000)] == [6.0, 4.0]
+
+
+def test_rank_normalized_keeps_each_word_once_at_its_best(backend):
+    small = FrequencyTable(["a", "b"], [50, 10])
+    large = FrequencyTable(["b", "c"], [600, 100])
+    ranked = rank_normalized([(small, 100), (large, 1000)])
+    assert [word for word, _ in ranked] == ["b", "a", "c"]
+    assert ranked[0][1] == pytest.approx(600_000.0)
@@ -0,0 +1,55 @@
+import pytest
+
+from benchmark_scraper import DEFAULT_CORPUS
+from html_parsers import PARSER_BACKENDS, PartialPageParser, get_page_parser
+from parse_pipeline import iter_html_dir
+
+PAGE = """<html><body><div class="mw-parser-output">
+<h2><span class="mw-headline" id="English">English</span></h2>
+<p>english text</p>
+<h2><span class="mw-headline" id="Spanish">Spanish</span></h2>
+<h3><span class="mw-headline">Noun</span></h3>
+<ol><li>cat &amp; kitten</li></ol>
+</div>
+<!-- NewPP limit report -->
+<div class="printfooter">footer</div>
+</body></html>"""
+
+
+def section_text(parser, html_content, language):
+    nodes = parser.language_section(html_content, language)
+    return None if nodes is None else [node.get_text() for node in nodes]
+
+
+@pytest.mark.parametrize("name", sorted(PARSER_BACKENDS))
+def test_backends_return_the_language_section(name):
+    parser = get_page_parser(name)
+    assert section_text(parser, PAGE, "Spanish") == ["Noun", "cat & kitten"]
+    assert section_text(parser, PAGE, "English") == ["english text"]
+    assert section_text(parser, PAGE, "French") is None
+
+
+def test_partial_parser_slices_only_the_section():
+    fragment = PartialPageParser()._slice_section(PAGE, "Spanish")
+    assert fragment.startswith("<h2>") and "English" not in fragment
+    assert "printfooter" not in fragment and "NewPP" not in fragment
+
+
+def test_partial_parser_falls_back_to_a_full_parse():
+    # Single-quoted attributes escape the raw-HTML scan, but not the full parse
+    page = PAGE.replace('<span class="mw-headline" id="Spanish">', "<span class='mw-headline' id='Spanish'>")
+    assert PartialPageParser()._slice_section(page, "Spanish") is None
+    assert section_text(PartialPageParser(), page, "Spanish") == ["Noun", "cat & kitten"]
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        get_page_parser("regex")
+
+
+@pytest.mark.parametrize("name", sorted(set(PARSER_BACKENDS) - {"html.parser"}))
+def test_backends_agree_on_the_benchmark_corpus(name):
+    reference = get_page_parser("html.parser")
+    parser = get_page_parser(name)
+    for word, html_content in iter_html_dir(DEFAULT_CORPUS):
+        assert section_text(parser, html_content, "Spanish") == section_text(reference, html_content, "Spanish"), word
@@ -0,0 +1,77 @@
+from bs4 import BeautifulSoup
+
+from inflection_tables import _grid, header_labels, read_inflection_table, table_layout, table_signature
+
+
+def table(markup):
+    return BeautifulSoup(f'<table class="inflection-table">{markup}</table>', "html.parser").table
+
+
+def conjugation(forms):
+    """A conjugation table with a mood rail spanning two tense rows."""
+    return table(
+        '<tr><th rowspan="3">indicative</th><th></th><th>yo</th><th>tú</th></tr>'
+        f'<tr><th>present</th><td>{forms[0]}</td><td>{forms[1]}</td></tr>'
+        f'<tr><th>preterite</th><td>{forms[2]}</td><td>{forms[3]}</td></tr>'
+    )
+
+
+def test_header_labels():
+    assert header_labels("present subjunctive") == (("mood", "subjunctive"), ("tense", "present"))
+    assert header_labels("que yo") == (("slot", "1sg"),)
+    assert header_labels("conjugation of hablar") == ()
+
+
+def test_grid_expands_rowspan_and_colspan():
+    signature = (
+        ((True, 2, 1, "a"), (True, 1, 2, "b")),
+        ((False, 1, 1, None), (False, 1, 1, None)),
+    )
+    grid, origins = _grid(signature)
+    assert grid == [[0, 1, 1], [0, 2, 3]]
+    assert origins == [(0, 0), (0, 1), (1, 1), (1, 2)]
+
+
+def test_reads_forms_under_mood_tense_and_person():
+    forms = read_inflection_table(conjugation(["hablo", "hablas", "hablé", "hablaste"]))
+    assert forms == {"indicative": {"present": {"1sg": "hablo", "2sg": "hablas"},
+                                    "preterite": {"1sg": "hablé", "2sg": "hablaste"}}}
+
+
+def test_leading_label_cells_act_as_row_headers():
+    forms = read_inflection_table(table(
+        '<tr><th colspan="2">present</th></tr>'
+        "<tr><td>yo</td><td>como</td></tr>"
+        "<tr><td>tú</td><td>comes</td></tr>"
+    ))
+    assert forms == {"present": {"1sg": "como", "2sg": "comes"}}
+
+
+def test_signature_leaves_out_data_forms():
+    assert table_signature(conjugation(["hablo", "hablas", "hablé", "hablaste"]))[0] == \
+        table_signature(conjugation(["como", "comes", "comí", "comiste"]))[0]
+
+    def declension(singular, plural):
+        return table(f"<tr><th>singular</th><th>plural</th></tr><tr><td>{singular}</td><td>{plural}</td></tr>")
+
+    gato, perro = declension("gato", "gatos"), declension("perro", "perros")
+    assert table_signature(gato)[0] == table_signature(perro)[0]
+    assert read_inflection_table(perro) == {"singular": "perro", "plural": "perros"}
+
+
+def test_layout_is_shared_by_tables_of_one_template():
+    table_layout.cache_clear()
+    for forms in (["a1", "a2", "a3", "a4"], ["b1", "b2", "b3", "b4"], ["c1", "c2", "c3", "c4"]):
+        read_inflection_table(conjugation(forms))
+    info = table_layout.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_repeated_labels_get_alternate_keys():
+    forms = read_inflection_table(table(
+        '<tr><th></th><th>yo</th></tr>'
+        "<tr><th>imperfect subjunctive</th><td>hablara</td></tr>"
+        "<tr><th>imperfect subjunctive</th><td>hablase</td></tr>"
+    ))
+    assert forms == {"subjunctive": {"imperfect": {"1sg": "hablara"},
+                                     "imperfect_alternate": {"1sg": "hablase"}}}
@@ -0,0 +1,70 @@
+import pytest
+import requests
+
+from language_registry import LanguageRegistry, languages, read_languages_file, update_languages_file
+
+LANGUAGES_TSV = ("# code<TAB>canonical name[<TAB>other name...]\n"
+                 "es\tSpanish\tCastilian\n"
+                 "grc\tAncient Greek\n"
+                 "\n"
+                 "broken line\n"
+                 "el\tGreek\tModern Greek\n")
+
+
+@pytest.fixture
+def registry(tmp_path):
+    path = tmp_path / "languages.tsv"
+    path.write_text(LANGUAGES_TSV, encoding="utf-8")
+    return LanguageRegistry(str(path))
+
+
+def test_reads_codes_names_and_other_names(registry):
+    assert list(read_languages_file(registry.path)) == [
+        ("es", "Spanish", ["Castilian"]), ("grc", "Ancient Greek", []), ("el", "Greek", ["Modern Greek"])]
+    assert len(registry) == 3
+
+
+def test_lookups_in_both_directions(registry):
+    assert registry.name("grc") == "Ancient Greek"
+    assert registry.heading("es") == "Spanish"
+    assert registry.heading("xx") == "XX"
+    assert registry.code("Castilian") == "es"
+    assert registry.code("ancient greek") == "grc"
+    assert registry.code("Klingon") is None
+    assert registry.resolve("el") == "el"
+    assert registry.resolve("Modern Greek") == "el"
+    assert "es" in registry and "Spanish" not in registry
+
+
+def test_missing_file_gives_an_empty_registry(tmp_path, capsys):
+    registry = LanguageRegistry(str(tmp_path / "missing.tsv"))
+    assert registry.name("es") is None
+    assert "Error reading language registry" in capsys.readouterr().out
+
+
+def test_bundled_table():
+    assert languages.name("es") == "Spanish"
+    assert languages.code("Spanish") == "es"
+
+
+class FakeResponse:
+    text = 'return {\n\t["el"] = "Greek",\n\t["es"] = "Spanish",\n\t["xx"] = "Say \\"hi\\"",\n}\n'
+
+    def raise_for_status(self):
+        pass
+
+
+def test_update_keeps_other_names_of_remaining_codes(registry, monkeypatch):
+    monkeypatch.setattr(requests, "get", lambda url, timeout: FakeResponse())
+    assert update_languages_file(registry.path) == 3
+    assert list(read_languages_file(registry.path)) == [
+        ("el", "Greek", ["Modern Greek"]), ("es", "Spanish", ["Castilian"]), ("xx", 'Say "hi"', [])]
+
+
+def test_failed_update_leaves_the_file_alone(registry, monkeypatch):
+    def offline(url, timeout):
+        raise requests.ConnectionError("offline")
+    monkeypatch.setattr(requests, "get", offline)
+    assert update_languages_file(registry.path) == 0
+    with open(registry.path, encoding="utf-8") as f:
+        assert f.read() == LANGUAGES_TSV
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from fetch_response import FetchResponse
+from page_cache import CachedFetcher, PageCache
+
+PAGE = "<html>gato</html>"
+
+
+class FakeFetcher:
+    """Backend answering from a queue of (status, content, headers), recording request headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.rate_limiter = "shared"
+
+    def fetch_response(self, word, headers):
+        self.requests.append(headers)
+        status, content, response_headers = self.responses.pop(0)
+        if status is None:
+            return None
+        return FetchResponse(status, response_headers, content, f"https://example.invalid/wiki/{word}")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PageCache(str(tmp_path / "cache"))
+
+
+def test_identical_pages_share_one_blob(cache, tmp_path):
+    cache.put("gato", PAGE)
+    cache.put("Gato", PAGE)
+    blobs = [name for _, _, names in os.walk(cache.blob_dir) for name in names]
+    assert len(blobs) == 1
+    assert cache.read(cache.get("Gato")) == PAGE
+    assert cache.get("perro") is None
+
+
+def test_fresh_entries_are_served_without_a_request(cache):
+    fetcher = FakeFetcher((200, PAGE, {}))
+    cached = CachedFetcher(fetcher, cache, max_age=3600)
+    assert cached.fetch_page("gato") == PAGE
+    assert cached.fetch_page("gato") == PAGE
+    assert len(fetcher.requests) == 1
+    assert cached.rate_limiter == "shared"
+
+
+def test_stale_entries_are_revalidated_with_validators(cache):
+    fetcher = FakeFetcher((200, PAGE, {"etag": '"v1"', "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+                          (304, None, {}))
+    cached = CachedFetcher(fetcher, cache, max_age=None)
+    cached.fetch_page("gato")
+    assert cached.fetch_page("gato") == PAGE
+    assert fetcher.requests[1] == {"If-None-Match": '"v1"',
+                                   "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+
+def test_stale_copy_is_used_when_the_network_fails(cache):
+    fetcher = FakeFetcher((200, PAGE, {}), (None, None, {}), (503, "error", {}))
+    cached = CachedFetcher(fetcher, cache)
+    cached.fetch_page("gato")
+    assert cached.fetch_page("gato") == PAGE
+    assert cached.fetch_page("gato") == PAGE
+
+
+def test_missing_entries_are_cached_as_misses(cache):
+    fetcher = FakeFetcher((404, None, {}))
+    cached = CachedFetcher(fetcher, cache, max_age=3600)
+    assert cached.fetch_page("xyzzy") is None
+    assert cached.fetch_page("xyzzy") is None
+    assert len(fetcher.requests) == 1
+    assert cache.get("xyzzy")["sha256"] is None
+
+
+def test_offline_mode_never_fetches(cache):
+    cache.put("gato", PAGE)
+    fetcher = FakeFetcher()
+    cached = CachedFetcher(fetcher, cache, offline=True)
+    assert cached.fetch_page("gato") == PAGE
+    assert cached.fetch_page("perro") is None
+    assert fetcher.requests == []
@@ -0,0 +1,69 @@
+import threading
+
+from parse_pipeline import ParsePipeline, iter_html_dir
+
+PAGE = ('<html><body><div class="mw-parser-output">'
+        '<h2><span class="mw-headline" id="Spanish">Spanish</span></h2>'
+        '<h3><span class="mw-headline" id="Noun">Noun</span></h3>'
+        '<ol><li>{definition}</li></ol></div></body></html>')
+
+
+class FakeFetcher:
+    def __init__(self):
+        self.fetched = []
+        self._lock = threading.Lock()
+
+    def fetch_page(self, word):
+        with self._lock:
+            self.fetched.append(word)
+        return None if word == "xyzzy" else PAGE.format(definition=word)
+
+
+class FakeBatchFetcher:
+    batch_size = 2
+
+    def __init__(self):
+        self.batches = []
+
+    def fetch_batch(self, words):
+        self.batches.append(words)
+        return {word: PAGE.format(definition=word) for word in words}
+
+
+def test_results_come_back_in_input_order():
+    pages = [("gato", PAGE.format(definition="cat")), ("vacía", None), ("casa", PAGE.format(definition="house"))]
+    results = list(ParsePipeline(workers=2, queue_size=1).parse_pages(iter(pages)))
+    assert [word for word, _ in results] == ["gato", "vacía", "casa"]
+    assert results[0][1]["definitions"] == ["cat"]
+    assert results[1][1] == {}
+    assert results[2][1]["definitions"] == ["house"]
+
+
+def test_fetch_pages_keeps_word_order_across_threads():
+    fetcher = FakeFetcher()
+    words = [f"w{i}" for i in range(20)] + ["xyzzy"]
+    pages = list(ParsePipeline(queue_size=2).fetch_pages(fetcher, words, fetch_threads=4))
+    assert [word for word, _ in pages] == words
+    assert pages[-1] == ("xyzzy", None)
+    assert sorted(fetcher.fetched) == sorted(words)
+
+
+def test_batch_fetchers_are_asked_per_batch():
+    fetcher = FakeBatchFetcher()
+    pages = list(ParsePipeline().fetch_pages(fetcher, ["a", "b", "c"]))
+    assert fetcher.batches == [["a", "b"], ["c"]]
+    assert [word for word, _ in pages] == ["a", "b", "c"]
+
+
+def test_scrape_words_fetches_and_parses(capsys):
+    results = dict(ParsePipeline(workers=1).scrape_words(FakeFetcher(), ["gato", "xyzzy"]))
+    assert results["gato"]["definitions"] == ["gato"]
+    assert results["xyzzy"] == {}
+    assert "Failed to retrieve page for 'xyzzy'" in capsys.readouterr().out
+
+
+def test_iter_html_dir(tmp_path):
+    (tmp_path / "gato_wiktionary.html").write_text("<html>gato</html>", encoding="utf-8")
+    (tmp_path / "casa.html").write_text("<html>casa</html>", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+    assert list(iter_html_dir(str(tmp_path))) == [("casa", "<html>casa</html>"), ("gato", "<html>gato</html>")]
@@ -0,0 +1,74 @@
+import threading
+
+import pytest
+
+import rate_limiter
+from rate_limiter import TokenBucket
+
+
+class Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock)
+    return clock
+
+
+def test_waiters_reserve_consecutive_slots(clock):
+    bucket = TokenBucket(rate=2.0)
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == pytest.approx(0.5)
+    assert bucket._reserve() == pytest.approx(1.0)
+
+
+def test_tokens_refill_up_to_capacity(clock):
+    bucket = TokenBucket(rate=1.0, capacity=3)
+    for _ in range(3):
+        assert bucket._reserve() == 0
+    clock.now += 100
+    for _ in range(3):
+        assert bucket._reserve() == 0
+    assert bucket._reserve() == pytest.approx(1.0)
+
+
+def test_from_interval_and_disabled_bucket(clock):
+    assert TokenBucket.from_interval(0.25).rate == 4.0
+    unlimited = TokenBucket.from_interval(0)
+    assert [unlimited._reserve() for _ in range(5)] == [0] * 5
+
+
+def test_pause_holds_back_every_request(clock):
+    bucket = TokenBucket(rate=0)
+    bucket.pause(5)
+    bucket.pause(2)
+    assert bucket._reserve() == pytest.approx(5)
+    clock.now += 5
+    assert bucket._reserve() == 0
+
+
+def test_shared_bucket_spaces_threads_by_the_aggregate_rate(clock):
+    bucket = TokenBucket(rate=10.0)
+    waits = []
+    lock = threading.Lock()
+
+    def take():
+        wait = bucket._reserve()
+        with lock:
+            waits.append(wait)
+
+    threads = [threading.Thread(target=take) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(waits) == pytest.approx([i / 10 for i in range(8)])
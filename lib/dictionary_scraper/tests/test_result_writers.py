@@ -0,0 +1,148 @@
+import gzip
+import os
+
+from result_writers import (GzipJsonLinesReader, GzipJsonLinesResultWriter, JsonLinesResultWriter,
+                            JsonResultWriter, ScrapeCheckpoint, iter_results, open_result_writer,
+                            output_format_for)
+
+
+def write_words(output_file, words, append=False, records_per_member=2):
+    writer = GzipJsonLinesResultWriter(output_file, append=append, records_per_member=records_per_member)
+    for word in words:
+        writer.add(word, {"text": word})
+    return writer.close()
+
+
+def test_members_form_one_gzip_stream(tmp_path):
+    output_file = str(tmp_path / "out.jsonl.gz")
+    write_words(output_file, ["a", "b", "c"])
+
+    with gzip.open(output_file, "rt", encoding="utf-8") as f:
+        assert f.read().splitlines() == ['{"text": "a"}', '{"text": "b"}', '{"text": "c"}']
+    assert [word for word, _ in iter_results(output_file)] == ["a", "b", "c"]
+
+
+def test_reader_decompresses_single_records(tmp_path):
+    output_file = str(tmp_path / "out.jsonl.gz")
+    write_words(output_file, ["a", "b", "c"])
+
+    reader = GzipJsonLinesReader(output_file)
+    assert reader.words() == ["a", "b", "c"]
+    assert reader.get("c") == {"text": "c"}
+    assert reader.get("z") is None
+
+
+def test_append_continues_after_existing_members(tmp_path):
+    output_file = str(tmp_path / "out.jsonl.gz")
+    write_words(output_file, ["a", "b", "c"])
+
+    writer = GzipJsonLinesResultWriter(output_file, append=True)
+    assert writer.stored_words == {"a", "b", "c"}
+    writer.add("d", {"text": "d"})
+    writer.close()
+
+    assert [word for word, _ in iter_results(output_file)] == ["a", "b", "c", "d"]
+    assert GzipJsonLinesReader(output_file).get("d") == {"text": "d"}
+
+
+def test_append_drops_member_missing_from_index(tmp_path):
+    output_file = str(tmp_path / "out.jsonl.gz")
+    write_words(output_file, ["a", "b"])
+    with open(output_file, "ab") as f:
+        f.write(gzip.compress(b'{"text": "orphan"}\n'))
+
+    write_words(output_file, ["c"], append=True)
+
+    assert [word for word, _ in iter_results(output_file)] == ["a", "b", "c"]
+
+
+def test_append_without_index_rebuilds_it(tmp_path):
+    output_file = str(tmp_path / "out.jsonl.gz")
+    write_words(output_file, ["a", "b", "c"])
+    size = os.path.getsize(output_file)
+    os.unlink(f"{output_file}.index")
+
+    writer = GzipJsonLinesResultWriter(output_file, append=True)
+    assert writer.stored_words == {"a", "b", "c"}
+    assert os.path.getsize(output_file) == size
+    writer.add("d", {"text": "d"})
+    writer.close()
+
+    reader = GzipJsonLinesReader(output_file)
+    assert reader.words() == ["a", "b", "c", "d"]
+    assert reader.get("b") == {"text": "b"}
+
+
+def test_append_without_index_drops_truncated_member(tmp_path):
+    output_file = str(tmp_path / "out.jsonl.gz")
+    write_words(output_file, ["a", "b"])
+    complete = os.path.getsize(output_file)
+    with open(output_file, "ab") as f:
+        f.write(gzip.compress(b'{"text": "c"}\n')[:-5])
+    os.unlink(f"{output_file}.index")
+
+    writer = GzipJsonLinesResultWriter(output_file, append=True)
+    writer.close()
+
+    assert os.path.getsize(output_file) == complete
+    assert GzipJsonLinesReader(output_file).words() == ["a", "b"]
+
+
+def test_index_rebuild_reads_members_larger_than_a_read(tmp_path):
+    output_file = str(tmp_path / "out.jsonl.gz")
+    writer = GzipJsonLinesResultWriter(output_file, records_per_member=1)
+    for word in ("a", "b", "c"):
+        writer.add(word, {"text": word, "blob": os.urandom(150_000).hex()})
+    writer.close()
+    expected = [line for line in open(f"{output_file}.index", encoding="utf-8")]
+    os.unlink(f"{output_file}.index")
+
+    GzipJsonLinesResultWriter(output_file, append=True).close()
+
+    assert [line for line in open(f"{output_file}.index", encoding="utf-8")] == expected
+
+
+def test_json_lines_append_drops_a_partial_last_record(tmp_path):
+    output_file = str(tmp_path / "out.jsonl")
+    writer = JsonLinesResultWriter(output_file)
+    writer.add("a", {"text": "a"})
+    writer.close()
+    with open(output_file, "a", encoding="utf-8") as f:
+        f.write('{"text": "b", "defin')
+
+    writer = JsonLinesResultWriter(output_file, append=True)
+    writer.add("c", {"text": "c"})
+    assert writer.close() == 1
+
+    assert [word for word, _ in iter_results(output_file)] == ["a", "c"]
+
+
+def test_json_writer_and_format_inference(tmp_path):
+    output_file = str(tmp_path / "out.json")
+    writer = open_result_writer(output_file)
+    assert isinstance(writer, JsonResultWriter)
+    writer.add("a", {"text": "a"})
+    writer.close()
+    assert list(iter_results(output_file)) == [("a", {"text": "a"})]
+    assert [output_format_for(name) for name in ("x.jsonl.gz", "x.jsonl", "x.json")] == [
+        "jsonl.gz", "jsonl", "json"]
+
+
+def test_checkpoint_survives_a_partial_line(tmp_path):
+    output_file = str(tmp_path / "out.jsonl")
+    checkpoint = ScrapeCheckpoint(output_file)
+    checkpoint.record("a", ScrapeCheckpoint.SCRAPED)
+    checkpoint.record("b", ScrapeCheckpoint.FAILED)
+    checkpoint.close()
+    with open(checkpoint.path, "a", encoding="utf-8") as f:
+        f.write('{"word": "c", "sta')
+
+    resumed = ScrapeCheckpoint(output_file)
+    assert resumed.load() == {"a": "scraped", "b": "failed"}
+    resumed.record("d", ScrapeCheckpoint.SCRAPED)
+    resumed.close()
+    assert ScrapeCheckpoint(output_file).load() == {"a": "scraped", "b": "failed", "d": "scraped"}
+
+    resumed.reset()
+    assert not os.path.exists(checkpoint.path)
+    assert ScrapeCheckpoint(output_file).load() == {}
@@ -0,0 +1,96 @@
+import json
+
+import scrape_metrics
+from scrape_metrics import Histogram, ProgressReporter, ScrapeMetrics, timed
+
+
+def test_histogram_buckets_and_percentiles():
+    histogram = Histogram()
+    for seconds in [0.0001, 0.0004, 0.003, 0.003, 100.0]:
+        histogram.add(seconds)
+    assert histogram.count == 5
+    assert histogram.min == 0.0001 and histogram.max == 100.0
+    assert histogram.percentile(40) == 0.0005
+    assert histogram.percentile(80) == 0.004
+    # The open-ended last bucket reports the maximum
+    assert histogram.percentile(100) == 100.0
+    assert histogram.to_dict()["buckets"] == {"<=0.0005": 2, "<=0.004": 2, "slower": 1}
+
+
+def test_histogram_merge():
+    first, second = Histogram(), Histogram()
+    first.add(0.001)
+    second.add(0.5, count=3)
+    first.merge(second)
+    first.merge(Histogram())
+    assert first.count == 4
+    assert first.total == 1.501
+    assert (first.min, first.max) == (0.001, 0.5)
+
+
+def test_disabled_collector_records_nothing():
+    collector = ScrapeMetrics()
+    with collector.timer("fetch"):
+        pass
+    collector.increment("scraped")
+    assert collector.stages == {} and collector.counters == {}
+
+
+def test_captured_timings_are_merged_elsewhere():
+    worker, main = ScrapeMetrics(enabled=True), ScrapeMetrics(enabled=True)
+    with worker.capture() as timings:
+        with worker.timer("parse"):
+            pass
+        worker.record("extract_ipa", 0.002)
+    assert worker.stages == {}
+    main.merge_timings(timings)
+    assert sorted(main.stages) == ["extract_ipa", "parse"]
+    assert main.stages["extract_ipa"].count == 1
+
+
+def test_timed_decorator_uses_the_shared_collector(monkeypatch):
+    collector = ScrapeMetrics(enabled=True)
+    monkeypatch.setattr(scrape_metrics, "metrics", collector)
+
+    @timed()
+    def extract_ipa():
+        return ["ˈɡato"]
+
+    @timed("parse")
+    def parse_page():
+        raise ValueError("broken page")
+
+    assert extract_ipa() == ["ˈɡato"]
+    try:
+        parse_page()
+    except ValueError:
+        pass
+    assert collector.stages["extract_ipa"].count == 1
+    assert collector.stages["parse"].count == 1
+
+
+def test_summary_is_written_as_json(tmp_path):
+    collector = ScrapeMetrics(enabled=True)
+    collector.record("fetch", 0.25)
+    collector.increment("scraped", 2)
+    path = tmp_path / "timings.json"
+    collector.write_summary(str(path))
+    summary = json.loads(path.read_text())
+    assert summary["counters"] == {"scraped": 2}
+    assert summary["stages"]["fetch"]["p50"] == 0.25  # Bucket bound capped at the max
+
+
+def test_progress_reporter_prints_once_per_interval(monkeypatch, capsys):
+    now = [100.0]
+    monkeypatch.setattr(scrape_metrics.time, "monotonic", lambda: now[0])
+    reporter = ProgressReporter(total=4, interval=10.0)
+    now[0] = 105.0
+    reporter.update()
+    assert capsys.readouterr().out == ""
+    now[0] = 110.0
+    reporter.update()
+    assert capsys.readouterr().out == "Progress: 2/4 words, 0.20 words/s, ETA 00:00:10\n"
+    # The last word is always reported
+    now[0] = 111.0
+    reporter.update(2)
+    assert "Progress: 4/4 words" in capsys.readouterr().out
@@ -0,0 +1,51 @@
+from bs4 import BeautifulSoup
+
+from html_parsers import _find_language_h2, _section_nodes
+from section_index import SectionIndex
+
+PAGE = """
+<h2><span class="mw-headline" id="Spanish">Spanish</span></h2>
+<h3><span class="mw-headline">Etymology</span></h3>
+<p>From Latin <i>cattus</i>.</p>
+<h3><span class="mw-headline">Pronunciation</span></h3>
+<ul><li>IPA: /ˈɡato/</li></ul>
+<h3><span class="mw-headline">Noun</span></h3>
+<p><b>gato</b> m</p>
+<ol><li>cat</li></ol>
+<h4><span class="mw-headline">Synonyms</span></h4>
+<ul><li>michi</li></ul>
+<h3><span class="mw-headline">Verb</span></h3>
+<ol><li>to jack up</li></ol>
+<h2><span class="mw-headline" id="Tagalog">Tagalog</span></h2>
+<ol><li>not Spanish</li></ol>
+"""
+
+
+def index():
+    soup = BeautifulSoup(PAGE, "html.parser")
+    return SectionIndex(_section_nodes(_find_language_h2(soup, "Spanish")))
+
+
+def test_sections_stop_at_the_next_language():
+    sections = index().sections
+    assert [(s.level, s.title) for s in sections] == [
+        ("h3", "Etymology"), ("h3", "Pronunciation"), ("h3", "Noun"), ("h4", "Synonyms"), ("h3", "Verb")]
+    assert all("not Spanish" not in node.get_text() for node in index().nodes)
+
+
+def test_sections_track_the_part_of_speech_in_effect():
+    pos = {section.title: section.pos for section in index().sections}
+    assert pos == {"Etymology": None, "Pronunciation": None, "Noun": "noun", "Synonyms": "synonyms",
+                   "Verb": "verb"}
+    assert [(pos, ol.get_text()) for pos, ol in index().elements_with_pos("ol")] == [
+        ("noun", "cat"), ("verb", "to jack up")]
+
+
+def test_lookups_by_level_title_and_tag():
+    idx = index()
+    assert [s.title for s in idx.headings(level="h4")] == ["Synonyms"]
+    noun = next(idx.headings(title="Noun"))
+    assert [node.name for node in noun.nodes] == ["p", "ol"]
+    assert idx.first_after(noun, "ul").get_text() == "michi"
+    assert idx.first_after(next(idx.headings(title="Verb")), "ul") is None
+    assert [node.name for node in idx.elements("ul", "p")] == ["p", "ul", "p", "ul"]
@@ -0,0 +1,36 @@
+import pytest
+
+from text_normalization import (POS_MAPPING, clean_definition, find_tag_labels, find_tags,
+                                normalize_whitespace, standard_pos, strip_ipa_delimiters)
+
+
+def test_whitespace_and_parentheticals():
+    assert normalize_whitespace("a \n\t b") == "a b"
+    assert clean_definition("(zoology) cat  (feline)").strip() == "cat"
+    assert strip_ipa_delimiters("/ˈɡato/ [ˈɡa.to]") == "ˈɡato ˈɡa.to"
+
+
+@pytest.mark.parametrize("heading, pos", [
+    ("noun", "noun"),
+    ("adverb", "adverb"),
+    ("pronoun", "pronoun"),
+    ("proper noun", "noun"),
+    ("verb 2", "verb"),
+    ("etymology", None),
+])
+def test_standard_pos_prefers_the_longest_name(heading, pos):
+    assert standard_pos(heading) == pos
+
+
+def test_pos_mapping_is_read_only():
+    with pytest.raises(TypeError):
+        POS_MAPPING["particle"] = "particle"
+
+
+def test_overlapping_tags_are_all_found():
+    assert find_tags("(informal, regional) a dude") == {"informal", "formal", "regional"}
+    assert find_tags("a cat") == set()
+
+
+def test_tag_labels_need_parentheses():
+    assert find_tag_labels("(colloquial) mate; slang for friend") == {"colloquial"}
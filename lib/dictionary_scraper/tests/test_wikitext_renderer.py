@@ -0,0 +1,73 @@
+from bs4 import BeautifulSoup
+
+from wikitext_renderer import render_wikitext
+from wiktionary_scraper import WiktionaryScraper
+
+WIKITEXT = """==Spanish==
+===Etymology===
+From {{inh|es|la|cattus}}.
+
+===Pronunciation===
+* {{IPA|es|/ˈɡato/}}
+{{es-pr}}
+
+===Noun===
+{{es-noun|m}}
+
+# {{lb|es|zoology}} [[cat]] {{gloss|feline}}
+#: {{ux|es|El '''gato''' duerme.|The cat sleeps.}}
+# [[jack]] <!-- a comment --><ref>A reference</ref>
+
+====Synonyms====
+* {{l|es|michi}}
+
+====Translations====
+{{trans-top|cat}}
+* English: {{t|en|cat}}
+{{trans-bottom}}
+
+===Verb===
+{{es-verb}}
+# to [[jack up]]
+
+====Conjugation====
+{{es-conj}}
+"""
+
+
+def soup():
+    return BeautifulSoup(render_wikitext(WIKITEXT, "gato"), "html.parser")
+
+
+def test_headings_carry_headline_spans():
+    headings = [(h.name, h.find("span", class_="mw-headline").text) for h in soup().find_all(["h2", "h3", "h4"])]
+    assert headings == [("h2", "Spanish"), ("h3", "Etymology"), ("h3", "Pronunciation"), ("h3", "Noun"),
+                        ("h4", "Synonyms"), ("h4", "Translations"), ("h3", "Verb"), ("h4", "Conjugation")]
+
+
+def test_lists_links_and_examples():
+    definitions = soup().find_all("ol")[0].find_all("li", recursive=False)
+    assert definitions[0].find("a").text == "cat"
+    assert definitions[0].find("dd").get_text().strip() == "El gato duerme. ― The cat sleeps."
+    assert definitions[1].get_text().strip() == "jack"
+
+
+def test_comments_and_references_are_dropped():
+    html_content = render_wikitext(WIKITEXT, "gato")
+    assert "a comment" not in html_content and "A reference" not in html_content
+
+
+def test_computed_templates_are_listed_as_unrendered():
+    meta = soup().find("meta", attrs={"name": "unrendered-templates"})
+    assert meta["content"].split(",") == ["es-conj", "es-pr"]
+
+
+def test_extractors_read_the_rendered_page(tmp_path):
+    word_data = WiktionaryScraper(output_dir=str(tmp_path)).parse_page("gato", render_wikitext(WIKITEXT, "gato"))
+    assert word_data["ipa_transcriptions"] == ["ˈɡato"]
+    assert word_data["translations"] == {"en": ["cat"]}
+    assert word_data["synonyms"] == ["michi"]
+    assert word_data["examples"] == ["El gato duerme. ― The cat sleeps."]
+    assert word_data["etymology"] == "From cattus."
+    # IPA came from the plain {{IPA}}; only the conjugation is missing
+    assert word_data["incomplete_fields"] == ["word_forms"]
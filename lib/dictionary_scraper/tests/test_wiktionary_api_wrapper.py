@@ -0,0 +1,80 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from wiktionary_api_wrapper import WiktionaryApiWrapper
+
+# Pages of the stand-in wiki by title, with the HTML action=parse renders for each revision
+PAGES = {"gato": 101, "casa": 202}
+RENDERED = {101: '<div class="mw-parser-output"><h2 id="Spanish">Spanish</h2>gato</div>',
+            202: '<div class="mw-parser-output"><h2 id="Spanish">Spanish</h2>casa</div>'}
+REDIRECTS = {"Gato": "gato"}
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        params = {key: values[0] for key, values in parse_qs(urlsplit(self.path).query).items()}
+        self.requests.append(params)
+        if params["action"] == "query":
+            titles = params["titles"].split("|")
+            query = {"redirects": [{"from": t, "to": REDIRECTS[t]} for t in titles if t in REDIRECTS],
+                     "pages": []}
+            for title in dict.fromkeys(REDIRECTS.get(t, t) for t in titles):
+                if title in PAGES:
+                    query["pages"].append({"title": title, "revisions": [
+                        {"revid": PAGES[title], "timestamp": "2024-01-01T00:00:00Z"}]})
+                else:
+                    query["pages"].append({"title": title, "missing": True})
+            body = {"query": query}
+        else:
+            body = {"parse": {"text": RENDERED[int(params["oldid"])]}}
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def wrapper():
+    server = HTTPServer(("127.0.0.1", 0), ApiHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    ApiHandler.requests = []
+    yield WiktionaryApiWrapper(rate_limit=0, base_url=f"http://127.0.0.1:{server.server_port}")
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_batch_returns_pages_rendered_by_the_wiki(wrapper):
+    pages = wrapper.fetch_batch(["gato", "casa", "perro"])
+
+    assert pages["perro"] is None
+    assert RENDERED[101] in pages["gato"]
+    assert '"wgPageName":"gato"' in pages["gato"]
+    assert '"wgRevisionId":202' in pages["casa"]
+
+
+def test_revisions_are_looked_up_per_batch_and_each_page_parsed_once(wrapper):
+    pages = wrapper.fetch_batch(["gato", "Gato", "casa"])
+
+    assert pages["Gato"] == pages["gato"]
+    actions = [params["action"] for params in ApiHandler.requests]
+    assert actions == ["query", "parse", "parse"]
+    query = ApiHandler.requests[0]
+    assert query["titles"] == "gato|Gato|casa"
+    assert "content" not in query["rvprop"]
+    assert {params["oldid"] for params in ApiHandler.requests[1:]} == {"101", "202"}
+
+
+def test_resolve_titles_follows_redirects(wrapper):
+    assert wrapper.resolve_titles(["Gato", "perro"]) == {"Gato": "gato", "perro": None}
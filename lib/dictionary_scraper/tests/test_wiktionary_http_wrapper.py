@@ -0,0 +1,82 @@
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import unquote
+
+import pytest
+
+from wiktionary_http_wrapper import WiktionaryHttpWrapper
+
+PAGES = {"gato": "<html>gato</html>", "niño": "<html>niño</html>",
+         "perro": "<html>Wiktionary does not have an entry for this term</html>"}
+REDIRECTS = {"Gato": "/wiki/gato"}
+
+
+class WikiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    clients = []
+
+    def do_GET(self):
+        self.clients.append(self.client_address)
+        title = unquote(self.path[len("/wiki/"):])
+        if title in REDIRECTS:
+            self.send_response(301)
+            self.send_header("Location", REDIRECTS[title])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        status, data = (200, PAGES[title].encode("utf-8")) if title in PAGES else (404, b"Not found")
+        self.send_response(status)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def wrapper():
+    server = HTTPServer(("127.0.0.1", 0), WikiHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    WikiHandler.clients = []
+    wrapper = WiktionaryHttpWrapper(rate_limit=0, base_url=f"http://127.0.0.1:{server.server_port}",
+                                    max_retries=0, timeout=5)
+    yield wrapper
+    wrapper.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_pages_are_fetched_over_one_kept_alive_connection(wrapper):
+    assert wrapper.fetch_page("gato") == "<html>gato</html>"
+    assert wrapper.fetch_page("niño") == "<html>niño</html>"
+    assert len(WikiHandler.clients) == 2
+    assert WikiHandler.clients[0] == WikiHandler.clients[1]
+
+
+def test_redirects_are_followed(wrapper):
+    response = wrapper.fetch_response("Gato")
+    assert response.status == 200
+    assert response.url.endswith("/wiki/gato")
+    assert response.content == "<html>gato</html>"
+
+
+def test_missing_entries(wrapper, capsys):
+    assert wrapper.fetch_page("perro") is None
+    assert wrapper.fetch_page("xyzzy") is None
+    assert capsys.readouterr().out.count("No entry found") == 2
+
+
+def test_connection_closed_while_idle_is_replaced(wrapper):
+    assert wrapper.fetch_page("gato")
+    pool = next(iter(wrapper._pools.values()))
+    idle = pool.acquire()
+    idle.sock.close()
+    pool.release(idle)
+    assert wrapper.fetch_page("niño") == "<html>niño</html>"
+    assert WikiHandler.clients[0] != WikiHandler.clients[-1]
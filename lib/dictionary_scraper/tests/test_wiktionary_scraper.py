@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from result_writers import iter_results
+from wiktionary_scraper import WiktionaryScraper
+
+
+class FakeRevisionClient:
+    def __init__(self, revisions):
+        self.revisions = revisions
+
+    def query_pages(self, words, content=True):
+        assert not content
+        return {word: self.revisions.get(word) for word in words}
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    scraper = WiktionaryScraper(output_dir=str(tmp_path))
+    monkeypatch.setattr(scraper, "_revision_client", lambda: FakeRevisionClient({
+        "gato": {"title": "gato", "revid": 12, "timestamp": "2024-02-01T00:00:00Z"},
+        "casa": {"title": "casa", "revid": 20, "timestamp": "2024-01-01T00:00:00Z"},
+        "perro": {"title": "perro", "revid": 30, "timestamp": "2024-02-02T00:00:00Z"},
+    }))
+    scraped = []
+
+    def scrape_words(words, on_page, concurrency, parse_workers):
+        scraped.extend(words)
+        for word in words:
+            on_page(word, {"text": word, "definitions": [f"new {word}"]})
+    monkeypatch.setattr(scraper, "_scrape_words", scrape_words)
+    scraper.scraped = scraped
+    return scraper
+
+
+def test_refresh_rescrapes_only_changed_and_new_pages(scraper, tmp_path):
+    words_file = tmp_path / "words.txt"
+    words_file.write_text("gato\ncasa\nperro\nborrado\n", encoding="utf-8")
+    previous_file = tmp_path / "previous.jsonl"
+    previous_file.write_text("".join(json.dumps(record) + "\n" for record in [
+        {"text": "gato", "revision_id": 11, "definitions": ["old gato"]},
+        {"text": "casa", "revision_id": 20, "definitions": ["old casa"]},
+        {"text": "borrado", "revision_id": 5, "definitions": ["old borrado"]},
+    ]), encoding="utf-8")
+    delta_file = str(tmp_path / "delta.jsonl")
+    output_file = str(tmp_path / "updated.jsonl")
+
+    scraper.refresh_word_list(str(words_file), str(previous_file), output_file, delta_file)
+
+    assert scraper.scraped == ["gato", "perro"]
+    delta = dict(iter_results(delta_file))
+    assert sorted(delta) == ["gato", "perro"]
+    assert delta["gato"]["revision_id"] == 12
+    assert delta["gato"]["revision_timestamp"] == "2024-02-01T00:00:00Z"
+    with open(f"{delta_file}.removed", encoding="utf-8") as f:
+        assert f.read() == "borrado\n"
+    updated = dict(iter_results(output_file))
+    assert list(updated) == ["gato", "casa", "perro"]
+    assert updated["casa"]["definitions"] == ["old casa"]
+    assert updated["gato"]["definitions"] == ["new gato"]
+
+
+def test_refresh_needs_the_previous_results(scraper, tmp_path, capsys):
+    words_file = tmp_path / "words.txt"
+    words_file.write_text("gato\n", encoding="utf-8")
+    scraper.refresh_word_list(str(words_file), str(tmp_path / "missing.jsonl"))
+    assert "Previous results not found" in capsys.readouterr().out
+    assert scraper.scraped == []